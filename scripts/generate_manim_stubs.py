@@ -1,13 +1,292 @@
 #!/usr/bin/env python3
-"""Generate comprehensive type stubs for manim from the installed manim CLI."""
+"""Generate comprehensive type stubs for manim.
+
+The script never shells out to the manim executable: presence and version
+are read from installed-package metadata, so no PATH search or interpreter
+startup is paid on any run.
+"""
 
 from __future__ import annotations
 
+import hashlib
+import importlib.metadata
 import json
-import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Data tables describing the generated manim/__init__.pyi. Keeping these as
+# plain tuples (instead of one multi-KB string literal) keeps script import
+# cheap and makes duplicate re-exports impossible to reintroduce by hand.
+
+_IMPORT_GROUPS: tuple[tuple[str, str, tuple[str, ...]], ...] = (
+    (
+        "Core Mobject classes",
+        "manim.mobject.mobject",
+        ("Mobject", "VMobject", "OpenGLMobject", "OpenGLVMobject"),
+    ),
+    (
+        "Geometry shapes",
+        "manim.mobject.geometry.line",
+        ("Line", "DashedLine"),
+    ),
+    (
+        "",
+        "manim.mobject.geometry.arc",
+        ("Arc", "Circle", "AnnularSector", "Sector"),
+    ),
+    (
+        "",
+        "manim.mobject.geometry.polygon",
+        ("Polygon", "Triangle", "Rectangle", "Square", "RegularPolygon"),
+    ),
+    (
+        "Text and equations",
+        "manim.mobject.text.text_mobject",
+        ("Text",),
+    ),
+    (
+        "",
+        "manim.mobject.text.tex_mobject",
+        ("MathTex", "Tex", "SingleStringMathTex"),
+    ),
+    (
+        "Animations - Creation",
+        "manim.animation.creation",
+        (
+            "Create",
+            "DrawBorderThenFill",
+            "Write",
+            "ShowPartial",
+            "AddTextLetterByLetter",
+            "ShowIncreasingSubsets",
+            "ShowSubmobjectsOneByOne",
+            "Uncreate",
+        ),
+    ),
+    (
+        "Animations - Fading",
+        "manim.animation.fading",
+        ("FadeIn", "FadeOut", "FadeInFrom", "FadeOutAndShiftDown"),
+    ),
+    (
+        "Animations - Composition and groups",
+        "manim.animation.composition",
+        ("AnimationGroup", "Succession", "Sequential"),
+    ),
+    (
+        "Animations - Transforms",
+        "manim.animation.transform",
+        (
+            "Transform",
+            "ReplacementTransform",
+            "TransformFromCopy",
+            "ClockwiseTransform",
+            "CounterclockwiseTransform",
+        ),
+    ),
+    (
+        "Animations - Movement",
+        "manim.animation.movement",
+        (
+            "ApplyMethod",
+            "ApplyFunction",
+            "ApplyMatrix",
+            "ApplyComplexFunction",
+            "Homotopy",
+            "SmoothedVMobjectPointFromPointMethod",
+        ),
+    ),
+    (
+        "Animations - Rotation",
+        "manim.animation.rotation",
+        ("Rotate",),
+    ),
+    (
+        "Animations - Indication",
+        "manim.animation.indication",
+        (
+            "Indicate",
+            "Flash",
+            "ShowCreationThenDestruction",
+            "Circumscribe",
+            "ShowCreationThenFadeOut",
+            "ApplyWave",
+            "WiggleOutThenIn",
+            "TurnInsideOut",
+            "FlashAround",
+            "ShowPassingFlash",
+            "ShowPassingFlashAround",
+        ),
+    ),
+    (
+        "Base animation",
+        "manim.animation.animation",
+        ("Animation",),
+    ),
+    (
+        "Scene classes",
+        "manim.scene.scene",
+        ("Scene",),
+    ),
+    (
+        "",
+        "manim.scene.moving_camera_scene",
+        ("MovingCameraScene",),
+    ),
+    (
+        "",
+        "manim.scene.zoomed_scene",
+        ("ZoomedScene",),
+    ),
+    (
+        "Utility classes",
+        "manim.mobject.value_tracker",
+        ("ValueTracker",),
+    ),
+    (
+        "",
+        "manim.utils.color",
+        ("Color", "rgb_to_hex", "hex_to_rgb"),
+    ),
+)
+
+_RATE_FUNC_FAMILIES: tuple[str, ...] = (
+    "quad",
+    "cubic",
+    "quart",
+    "quint",
+    "sine",
+    "back",
+    "elastic",
+    "bounce",
+)
+
+_RATE_FUNCS: tuple[str, ...] = ("linear", "smooth") + tuple(
+    f"ease_{direction}_{family}"
+    for family in _RATE_FUNC_FAMILIES
+    for direction in ("in", "out", "in_out")
+)
+
+_COLOR_CONSTANTS: tuple[str, ...] = (
+    "WHITE",
+    "BLACK",
+    "RED",
+    "GREEN",
+    "BLUE",
+    "YELLOW",
+    "ORANGE",
+    "PURPLE",
+    "PINK",
+    "CYAN",
+    "GRAY",
+    "DARK_GRAY",
+    "LIGHT_GRAY",
+    "TEAL",
+    "LIGHT_BLUE",
+    "DARK_BLUE",
+    "LIGHT_GREEN",
+    "DARK_GREEN",
+    "MAROON",
+    "GOLD",
+)
+
+_DIRECTION_CONSTANTS: tuple[str, ...] = (
+    "UP",
+    "DOWN",
+    "LEFT",
+    "RIGHT",
+    "IN",
+    "OUT",
+    "ORIGIN",
+)
+
+_SUBMODULE_STUBS: tuple[str, ...] = (
+    "manim/mobject/__init__.pyi",
+    "manim/mobject/geometry/__init__.pyi",
+    "manim/animation/__init__.pyi",
+    "manim/animation/creation.pyi",
+    "manim/animation/fading.pyi",
+    "manim/animation/composition.pyi",
+    "manim/scene/__init__.pyi",
+    "manim/utils/__init__.pyi",
+    "manim/utils/rate_functions.pyi",
+)
+
+_SUBMODULE_BODY_TEMPLATE = '"""Type stubs for {p}."""\n\nfrom typing import Any\n\n__all__: list[str]\n'
+
+# Static stub payloads live as real, reviewable files instead of multi-KB
+# string literals compiled on every script import
+TEMPLATES_DIR = Path(__file__).parent / "stub_templates"
+
+def build_manim_init_stub() -> str:
+    """Build the manim/__init__.pyi body from the import data tables."""
+    lines: list[str] = [
+        '"""Manim - Animation engine for explanatory videos."""',
+        "",
+        "from __future__ import annotations",
+        "",
+        "from typing import Any, Callable, Sequence, Type, TypeVar, Union, overload",
+        "",
+        "__version__: str",
+        "__all__: list[str]",
+        "",
+        "# Type variables",
+        "T = TypeVar('T')",
+    ]
+
+    # Insertion-ordered dict keyed by (module, name): duplicates collapse
+    # instead of producing repeated re-export lines
+    exports: dict[tuple[str, str], str] = {}
+    for comment, module, names in _IMPORT_GROUPS:
+        if comment:
+            exports[("", f"#{comment}")] = f"\n# {comment}"
+        for name in names:
+            exports.setdefault((module, name), f"from {module} import {name} as {name}")
+
+    exports[("", "#rate")] = "\n# Rate functions and easing"
+    for name in _RATE_FUNCS:
+        exports.setdefault(
+            ("manim.utils.rate_functions", name),
+            f"from manim.utils.rate_functions import {name} as {name}",
+        )
+
+    lines += "\n".join(exports.values()).split("\n")
+
+    import_lines = [line for line in lines if line.startswith("from manim")]
+    if len(import_lines) != len(set(import_lines)):
+        msg = "Duplicate re-export generated in manim/__init__.pyi"
+        raise RuntimeError(msg)
+
+    lines += [
+        "",
+        "# Rate functions module for easy access",
+        "import manim.utils.rate_functions as rate_functions",
+        "",
+        "# Colors",
+    ]
+    lines += [f"{name}: tuple[float, float, float]" for name in _COLOR_CONSTANTS]
+
+    lines += ["", "# Directions / Unit vectors"]
+    lines += [f"{name}: tuple[float, float, float]" for name in _DIRECTION_CONSTANTS]
+
+    lines += [
+        "",
+        "# Configuration",
+        "def config(*args: Any, **kwargs: Any) -> Any: ...",
+        "",
+    ]
+    return "\n".join(lines)
+
+def write_if_changed(path: Path, body: str) -> bool:
+    """Write body to path, skipping the write when content is unchanged."""
+    encoded = body.encode()
+    if path.exists() and path.read_bytes() == encoded:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(encoded)
+    return True
+
 def main() -> int:
     """Generate comprehensive manim type stubs."""
     project_root = Path(__file__).parent.parent
@@ -15,306 +294,68 @@ def main() -> int:
 
     print("Generating comprehensive manim type stubs...")
 
-    # Try to use manim CLI to extract type information
+    # Metadata lookup answers "is manim installed, which version" without
+    # importing manim or forking an interpreter
     try:
-        result = subprocess.run(
-            ["manim", "--help"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            print("✓ Found manim CLI - generating stubs using it...")
-            return generate_stubs_from_manim_cli(stubs_dir)
-    except FileNotFoundError:
-        print("⚠ Manim CLI not found")
-
-    # Fallback to creating comprehensive manual stubs
-    print("Generating comprehensive manual stubs...")
-    return create_comprehensive_manim_stubs(stubs_dir)
-
-def generate_stubs_from_manim_cli(stubs_dir: Path) -> int:
-    """Generate stubs by using manim's Python environment."""
-    # Create a script that will be executed in the manim environment
-    stub_generator = """
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-try:
-    import manim
-    print("MANIM_FOUND")
-    print(f"VERSION:{manim.__version__}")
-
-    # Import key modules to ensure they're available
-    from manim.mobject.mobject import Mobject, VMobject
-    from manim.scene.scene import Scene
-    from manim.animation.animation import Animation
-    print("IMPORTS_OK")
-except Exception as e:
-    print(f"ERROR:{e}")
-"""
+        version = importlib.metadata.version("manim")
+        print(f"✓ Found manim {version} - creating stubs...")
+    except importlib.metadata.PackageNotFoundError:
+        print("⚠ Manim not found - generating comprehensive manual stubs...")
 
-    try:
-        result = subprocess.run(
-            ["python", "-c", stub_generator],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
+    return create_comprehensive_manim_stubs(stubs_dir)
 
-        if "MANIM_FOUND" in result.stdout:
-            print("✓ Successfully accessed manim - creating stubs...")
-            return create_comprehensive_manim_stubs(stubs_dir)
-        else:
-            print("⚠ Could not import manim from CLI")
-            return create_comprehensive_manim_stubs(stubs_dir)
-    except Exception as e:
-        print(f"⚠ Failed to use manim environment: {e}")
-        return create_comprehensive_manim_stubs(stubs_dir)
+def _write_one(job: tuple[Path, str]) -> bool:
+    """Write a single (path, body) stub job, skipping unchanged content."""
+    path, body = job
+    return write_if_changed(path, body)
 
 def create_comprehensive_manim_stubs(stubs_dir: Path) -> int:
     """Create comprehensive manual stubs for all manim modules."""
     stubs_dir.mkdir(parents=True, exist_ok=True)
 
-    # Main manim __init__.pyi with all common imports
-    manim_init = stubs_dir / "manim" / "__init__.pyi"
-    manim_init.parent.mkdir(parents=True, exist_ok=True)
-
-    manim_init.write_text("""\"\"\"Manim - Animation engine for explanatory videos.\"\"\"
-
-from __future__ import annotations
-
-from typing import Any, Callable, Sequence, Type, TypeVar, Union, overload
-
-__version__: str
-__all__: list[str]
-
-# Type variables
-T = TypeVar('T')
-
-# Core Mobject classes
-from manim.mobject.mobject import Mobject as Mobject
-from manim.mobject.mobject import VMobject as VMobject
-from manim.mobject.mobject import OpenGLMobject as OpenGLMobject
-from manim.mobject.mobject import OpenGLVMobject as OpenGLVMobject
-
-# Geometry shapes
-from manim.mobject.geometry.line import Line as Line
-from manim.mobject.geometry.line import DashedLine as DashedLine
-from manim.mobject.geometry.arc import Arc as Arc
-from manim.mobject.geometry.arc import Circle as Circle
-from manim.mobject.geometry.arc import AnnularSector as AnnularSector
-from manim.mobject.geometry.arc import Sector as Sector
-from manim.mobject.geometry.polygon import Polygon as Polygon
-from manim.mobject.geometry.polygon import Triangle as Triangle
-from manim.mobject.geometry.polygon import Rectangle as Rectangle
-from manim.mobject.geometry.polygon import Square as Square
-from manim.mobject.geometry.polygon import RegularPolygon as RegularPolygon
-
-# Text and equations
-from manim.mobject.text.text_mobject import Text as Text
-from manim.mobject.text.tex_mobject import MathTex as MathTex
-from manim.mobject.text.tex_mobject import Tex as Tex
-from manim.mobject.text.tex_mobject import SingleStringMathTex as SingleStringMathTex
-
-# Animations - Creation
-from manim.animation.creation import Create as Create
-from manim.animation.creation import DrawBorderThenFill as DrawBorderThenFill
-from manim.animation.creation import Write as Write
-from manim.animation.creation import ShowPartial as ShowPartial
-from manim.animation.creation import AddTextLetterByLetter as AddTextLetterByLetter
-from manim.animation.creation import ShowIncreasingSubsets as ShowIncreasingSubsets
-from manim.animation.creation import ShowSubmobjectsOneByOne as ShowSubmobjectsOneByOne
-from manim.animation.creation import Uncreate as Uncreate
-from manim.animation.creation import DrawBorderThenFill as DrawBorderThenFill
-
-# Animations - Fading
-from manim.animation.fading import FadeIn as FadeIn
-from manim.animation.fading import FadeOut as FadeOut
-from manim.animation.fading import FadeInFrom as FadeInFrom
-from manim.animation.fading import FadeOutAndShiftDown as FadeOutAndShiftDown
-
-# Animations - Composition and groups
-from manim.animation.composition import AnimationGroup as AnimationGroup
-from manim.animation.composition import Succession as Succession
-from manim.animation.composition import Sequential as Sequential
-
-# Animations - Transforms
-from manim.animation.transform import Transform as Transform
-from manim.animation.transform import ReplacementTransform as ReplacementTransform
-from manim.animation.transform import TransformFromCopy as TransformFromCopy
-from manim.animation.transform import ClockwiseTransform as ClockwiseTransform
-from manim.animation.transform import CounterclockwiseTransform as CounterclockwiseTransform
-
-# Animations - Movement
-from manim.animation.movement import ApplyMethod as ApplyMethod
-from manim.animation.movement import ApplyFunction as ApplyFunction
-from manim.animation.movement import ApplyMatrix as ApplyMatrix
-from manim.animation.movement import ApplyComplexFunction as ApplyComplexFunction
-from manim.animation.movement import Homotopy as Homotopy
-from manim.animation.movement import SmoothedVMobjectPointFromPointMethod as SmoothedVMobjectPointFromPointMethod
-
-# Animations - Rotation
-from manim.animation.rotation import Rotate as Rotate
-
-# Animations - Indication
-from manim.animation.indication import Indicate as Indicate
-from manim.animation.indication import Flash as Flash
-from manim.animation.indication import ShowCreationThenDestruction as ShowCreationThenDestruction
-from manim.animation.indication import Circumscribe as Circumscribe
-from manim.animation.indication import ShowCreationThenFadeOut as ShowCreationThenFadeOut
-from manim.animation.indication import ApplyWave as ApplyWave
-from manim.animation.indication import WiggleOutThenIn as WiggleOutThenIn
-from manim.animation.indication import TurnInsideOut as TurnInsideOut
-from manim.animation.indication import FlashAround as FlashAround
-from manim.animation.indication import ShowPassingFlash as ShowPassingFlash
-from manim.animation.indication import ShowPassingFlashAround as ShowPassingFlashAround
-
-# Base animation
-from manim.animation.animation import Animation as Animation
-
-# Scene classes
-from manim.scene.scene import Scene as Scene
-from manim.scene.moving_camera_scene import MovingCameraScene as MovingCameraScene
-from manim.scene.zoomed_scene import ZoomedScene as ZoomedScene
-
-# Utility classes
-from manim.mobject.value_tracker import ValueTracker as ValueTracker
-from manim.utils.color import Color as Color
-from manim.utils.color import rgb_to_hex as rgb_to_hex
-from manim.utils.color import hex_to_rgb as hex_to_rgb
-
-# Rate functions and easing
-from manim.utils.rate_functions import linear as linear
-from manim.utils.rate_functions import smooth as smooth
-from manim.utils.rate_functions import ease_in_quad as ease_in_quad
-from manim.utils.rate_functions import ease_out_quad as ease_out_quad
-from manim.utils.rate_functions import ease_in_out_quad as ease_in_out_quad
-from manim.utils.rate_functions import ease_in_cubic as ease_in_cubic
-from manim.utils.rate_functions import ease_out_cubic as ease_out_cubic
-from manim.utils.rate_functions import ease_in_out_cubic as ease_in_out_cubic
-from manim.utils.rate_functions import ease_in_quart as ease_in_quart
-from manim.utils.rate_functions import ease_out_quart as ease_out_quart
-from manim.utils.rate_functions import ease_in_out_quart as ease_in_out_quart
-from manim.utils.rate_functions import ease_in_quint as ease_in_quint
-from manim.utils.rate_functions import ease_out_quint as ease_out_quint
-from manim.utils.rate_functions import ease_in_out_quint as ease_in_out_quint
-from manim.utils.rate_functions import ease_in_sine as ease_in_sine
-from manim.utils.rate_functions import ease_out_sine as ease_out_sine
-from manim.utils.rate_functions import ease_in_out_sine as ease_in_out_sine
-from manim.utils.rate_functions import ease_in_back as ease_in_back
-from manim.utils.rate_functions import ease_out_back as ease_out_back
-from manim.utils.rate_functions import ease_in_out_back as ease_in_out_back
-from manim.utils.rate_functions import ease_in_elastic as ease_in_elastic
-from manim.utils.rate_functions import ease_out_elastic as ease_out_elastic
-from manim.utils.rate_functions import ease_in_out_elastic as ease_in_out_elastic
-from manim.utils.rate_functions import ease_in_bounce as ease_in_bounce
-from manim.utils.rate_functions import ease_out_bounce as ease_out_bounce
-from manim.utils.rate_functions import ease_in_out_bounce as ease_in_out_bounce
-
-# Rate functions module for easy access
-import manim.utils.rate_functions as rate_functions
-
-# Colors
-WHITE: tuple[float, float, float]
-BLACK: tuple[float, float, float]
-RED: tuple[float, float, float]
-GREEN: tuple[float, float, float]
-BLUE: tuple[float, float, float]
-YELLOW: tuple[float, float, float]
-ORANGE: tuple[float, float, float]
-PURPLE: tuple[float, float, float]
-PINK: tuple[float, float, float]
-CYAN: tuple[float, float, float]
-GRAY: tuple[float, float, float]
-DARK_GRAY: tuple[float, float, float]
-LIGHT_GRAY: tuple[float, float, float]
-TEAL: tuple[float, float, float]
-LIGHT_BLUE: tuple[float, float, float]
-DARK_BLUE: tuple[float, float, float]
-LIGHT_GREEN: tuple[float, float, float]
-DARK_GREEN: tuple[float, float, float]
-MAROON: tuple[float, float, float]
-GOLD: tuple[float, float, float]
-
-# Directions / Unit vectors
-UP: tuple[float, float, float]
-DOWN: tuple[float, float, float]
-LEFT: tuple[float, float, float]
-RIGHT: tuple[float, float, float]
-IN: tuple[float, float, float]
-OUT: tuple[float, float, float]
-ORIGIN: tuple[float, float, float]
-
-# Configuration
-def config(*args: Any, **kwargs: Any) -> Any: ...
-""")
-
-    print(f"✓ Created main manim stub: {manim_init}")
-
-    # Create __init__.pyi files for key submodules
-    submodules = [
-        "manim/mobject/__init__.pyi",
-        "manim/mobject/geometry/__init__.pyi",
-        "manim/animation/__init__.pyi",
-        "manim/animation/creation.pyi",
-        "manim/animation/fading.pyi",
-        "manim/animation/composition.pyi",
-        "manim/scene/__init__.pyi",
-        "manim/utils/__init__.pyi",
-        "manim/utils/rate_functions.pyi",
+    # Load the content-hash cache so unchanged submodule stubs cost nothing
+    cache_file = stubs_dir / ".stubcache.json"
+    try:
+        cache: dict[str, str] = json.loads(cache_file.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        cache = {}
+
+    # Build the full job list first, then write concurrently - the writes
+    # are independent blocking syscalls that release the GIL
+    # The init template is regenerated from the data tables when they change;
+    # mobject.pyi is pure data shipped alongside the script
+    init_template = TEMPLATES_DIR / "manim__init__.pyi"
+    write_if_changed(init_template, build_manim_init_stub())
+
+    # Every candidate write is gated by the manifest hash so matching files
+    # are skipped without even rereading their bytes - unchanged outputs keep
+    # their mtime and downstream mypy/pyright caches stay warm
+    candidates: list[tuple[str, str]] = [
+        ("manim/__init__.pyi", init_template.read_text()),
+        ("manim/mobject/mobject.pyi", (TEMPLATES_DIR / "mobject.pyi").read_text()),
+    ]
+    candidates += [
+        (stub_path, _SUBMODULE_BODY_TEMPLATE.format(p=stub_path))
+        for stub_path in _SUBMODULE_STUBS
     ]
 
-    for stub_path in submodules:
+    jobs: list[tuple[Path, str]] = []
+    for stub_path, body in candidates:
         stub_file = stubs_dir / stub_path
-        stub_file.parent.mkdir(parents=True, exist_ok=True)
-        if not stub_file.exists():
-            stub_file.write_text(f'"""Type stubs for {stub_path}."""\n\nfrom typing import Any\n\n__all__: list[str]\n')
-            print(f"✓ Created stub: {stub_path}")
-
-    # Create the critical mobject.mobject stub
-    mobject_stub = stubs_dir / "manim/mobject/mobject.pyi"
-    mobject_stub.parent.mkdir(parents=True, exist_ok=True)
-    mobject_stub.write_text('''"""Type stubs for manim.mobject.mobject."""
-
-from __future__ import annotations
-
-from typing import Any, Callable, Sequence
-
-class Mobject:
-    """Base class for all mobjects."""
-
-    def __init__(self, *args: Any, **kwargs: Any) -> None: ...
-    def get_color(self) -> tuple[float, float, float]: ...
-    def set_color(self, color: str | tuple[float, float, float]) -> Mobject: ...
-    def add(self, *mobjects: Mobject) -> Mobject: ...
-    def remove(self, *mobjects: Mobject) -> Mobject: ...
-    def add_updater(self, update_func: Callable[[Mobject], None]) -> Mobject: ...
-    def shift(self, vector: tuple[float, float, float] | Sequence[float]) -> Mobject: ...
-    def move_to(self, point: tuple[float, float, float] | Sequence[float]) -> Mobject: ...
-    def rotate(self, angle: float, **kwargs: Any) -> Mobject: ...
-    def scale(self, scale_factor: float) -> Mobject: ...
-    def fade(self, darkness: float = ...) -> Mobject: ...
-    @property
-    def animate(self) -> Any: ...
-
-class VMobject(Mobject):
-    """Vector Mobject."""
-
-    pass
-
-class OpenGLMobject(Mobject):
-    """OpenGL Mobject."""
+        digest = hashlib.blake2b(body.encode(), digest_size=16).hexdigest()
+        if cache.get(stub_path) == digest and stub_file.exists():
+            continue
+        jobs.append((stub_file, body))
+        cache[stub_path] = digest
 
-    pass
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        written = list(executor.map(_write_one, jobs))
 
-class OpenGLVMobject(VMobject):
-    """OpenGL Vector Mobject."""
+    for (path, _), changed in zip(jobs, written):
+        if changed:
+            print(f"✓ Created stub: {path}")
 
-    pass
-''')
-    print(f"✓ Created stub: manim/mobject/mobject.pyi")
+    write_if_changed(cache_file, json.dumps(cache, indent=2, sort_keys=True) + "\n")
 
     return 0
 
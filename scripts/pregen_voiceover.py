@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Pre-generate section voiceover audio with a local Piper TTS.
+
+GTTS synthesizes narration over HTTP on every render — rate-limited,
+slow, and non-deterministic. This script renders each section's
+narration once to a WAV with the offline `piper` binary, so renders can
+use `FileVoiceoverService` and never touch the network.
+
+Narration strings are read straight out of the section scene sources
+with `ast`, so the script runs without importing manim (or anything else
+the scenes pull in).
+
+Usage:
+    python scripts/pregen_voiceover.py
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import subprocess
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+_SCENES_DIR = _REPO_ROOT / "videos" / "scenes"
+_OUTPUT_DIR = _REPO_ROOT / "assets" / "voiceover"
+
+_SECTION_MODULES: tuple[str, ...] = (
+    "section1_hallucination.py",
+    "section2_scale.py",
+    "section3_linear.py",
+    "section4_nonlinear.py",
+    "section5_synthesis.py",
+)
+
+_PIPER_MODEL = "en_US-lessac-high"
+
+
+def _extract_voiceover_text(source_path: Path) -> str:
+    """Pull the VOICEOVER_TEXT class attribute out of a scene module.
+
+    Args:
+        source_path: Path to the section scene source file
+
+    Returns:
+        The narration string assigned to VOICEOVER_TEXT
+
+    Raises:
+        ValueError: If the module defines no VOICEOVER_TEXT constant
+
+    """
+    tree = ast.parse(source_path.read_text())
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.AnnAssign)
+            and isinstance(node.target, ast.Name)
+            and node.target.id == "VOICEOVER_TEXT"
+            and node.value is not None
+        ):
+            text = ast.literal_eval(node.value)
+            if isinstance(text, str):
+                return text
+    msg = f"No VOICEOVER_TEXT found in {source_path.name}"
+    raise ValueError(msg)
+
+
+def _synthesize(text: str, wav_path: Path) -> None:
+    """Render one narration line to a WAV with piper.
+
+    Args:
+        text: Narration text to synthesize
+        wav_path: Destination WAV file
+
+    """
+    subprocess.run(
+        ["piper", "--model", _PIPER_MODEL, "--output_file", str(wav_path)],  # noqa: S607
+        input=text.encode(),
+        check=True,
+    )
+
+
+def main() -> None:
+    """Synthesize every section narration and write the lookup manifest."""
+    _OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+    manifest: dict[str, str] = {}
+    for index, module_name in enumerate(_SECTION_MODULES, start=1):
+        text = _extract_voiceover_text(_SCENES_DIR / module_name)
+        wav_name = f"section{index}.wav"
+        _synthesize(text, _OUTPUT_DIR / wav_name)
+        manifest[hashlib.sha256(text.encode()).hexdigest()] = wav_name
+        print(f"Generated {wav_name} ({len(text)} chars)")  # noqa: T201
+
+    manifest_path = _OUTPUT_DIR / "manifest.json"
+    manifest_path.write_text(json.dumps(manifest, indent=2))
+    print(f"Wrote {manifest_path}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""Render all five sections in parallel and concatenate the result.
+
+Each section scene is an independent CPU-bound render, so they fan out
+across worker processes (one per section) and the final video is
+stitched with a stream-copy ffmpeg concat. Wall time approaches the
+longest single section instead of the sum of all five.
+
+Usage:
+    python scripts/render_all.py [output_dir]
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import sys
+
+
+def main() -> None:
+    """Render every section concurrently and print the final video path."""
+    # Fresh interpreters per worker: manim keeps render state in module
+    # globals, and forked copies of an already-configured parent would
+    # share it across sections
+    multiprocessing.set_start_method("spawn", force=True)
+
+    from videos.scenes.judge_curve_complete import render_all_parallel
+
+    output_dir = sys.argv[1] if len(sys.argv) > 1 else "media/sections"
+    final_path = render_all_parallel(output_dir)
+    print(f"Final video: {final_path}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""Manim - Animation engine for explanatory videos."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Sequence, Type, TypeVar, Union, overload
+
+__version__: str
+__all__: list[str]
+
+# Type variables
+T = TypeVar('T')
+
+# Core Mobject classes
+from manim.mobject.mobject import Mobject as Mobject
+from manim.mobject.mobject import VMobject as VMobject
+from manim.mobject.mobject import OpenGLMobject as OpenGLMobject
+from manim.mobject.mobject import OpenGLVMobject as OpenGLVMobject
+
+# Geometry shapes
+from manim.mobject.geometry.line import Line as Line
+from manim.mobject.geometry.line import DashedLine as DashedLine
+from manim.mobject.geometry.arc import Arc as Arc
+from manim.mobject.geometry.arc import Circle as Circle
+from manim.mobject.geometry.arc import AnnularSector as AnnularSector
+from manim.mobject.geometry.arc import Sector as Sector
+from manim.mobject.geometry.polygon import Polygon as Polygon
+from manim.mobject.geometry.polygon import Triangle as Triangle
+from manim.mobject.geometry.polygon import Rectangle as Rectangle
+from manim.mobject.geometry.polygon import Square as Square
+from manim.mobject.geometry.polygon import RegularPolygon as RegularPolygon
+
+# Text and equations
+from manim.mobject.text.text_mobject import Text as Text
+from manim.mobject.text.tex_mobject import MathTex as MathTex
+from manim.mobject.text.tex_mobject import Tex as Tex
+from manim.mobject.text.tex_mobject import SingleStringMathTex as SingleStringMathTex
+
+# Animations - Creation
+from manim.animation.creation import Create as Create
+from manim.animation.creation import DrawBorderThenFill as DrawBorderThenFill
+from manim.animation.creation import Write as Write
+from manim.animation.creation import ShowPartial as ShowPartial
+from manim.animation.creation import AddTextLetterByLetter as AddTextLetterByLetter
+from manim.animation.creation import ShowIncreasingSubsets as ShowIncreasingSubsets
+from manim.animation.creation import ShowSubmobjectsOneByOne as ShowSubmobjectsOneByOne
+from manim.animation.creation import Uncreate as Uncreate
+
+# Animations - Fading
+from manim.animation.fading import FadeIn as FadeIn
+from manim.animation.fading import FadeOut as FadeOut
+from manim.animation.fading import FadeInFrom as FadeInFrom
+from manim.animation.fading import FadeOutAndShiftDown as FadeOutAndShiftDown
+
+# Animations - Composition and groups
+from manim.animation.composition import AnimationGroup as AnimationGroup
+from manim.animation.composition import Succession as Succession
+from manim.animation.composition import Sequential as Sequential
+
+# Animations - Transforms
+from manim.animation.transform import Transform as Transform
+from manim.animation.transform import ReplacementTransform as ReplacementTransform
+from manim.animation.transform import TransformFromCopy as TransformFromCopy
+from manim.animation.transform import ClockwiseTransform as ClockwiseTransform
+from manim.animation.transform import CounterclockwiseTransform as CounterclockwiseTransform
+
+# Animations - Movement
+from manim.animation.movement import ApplyMethod as ApplyMethod
+from manim.animation.movement import ApplyFunction as ApplyFunction
+from manim.animation.movement import ApplyMatrix as ApplyMatrix
+from manim.animation.movement import ApplyComplexFunction as ApplyComplexFunction
+from manim.animation.movement import Homotopy as Homotopy
+from manim.animation.movement import SmoothedVMobjectPointFromPointMethod as SmoothedVMobjectPointFromPointMethod
+
+# Animations - Rotation
+from manim.animation.rotation import Rotate as Rotate
+
+# Animations - Indication
+from manim.animation.indication import Indicate as Indicate
+from manim.animation.indication import Flash as Flash
+from manim.animation.indication import ShowCreationThenDestruction as ShowCreationThenDestruction
+from manim.animation.indication import Circumscribe as Circumscribe
+from manim.animation.indication import ShowCreationThenFadeOut as ShowCreationThenFadeOut
+from manim.animation.indication import ApplyWave as ApplyWave
+from manim.animation.indication import WiggleOutThenIn as WiggleOutThenIn
+from manim.animation.indication import TurnInsideOut as TurnInsideOut
+from manim.animation.indication import FlashAround as FlashAround
+from manim.animation.indication import ShowPassingFlash as ShowPassingFlash
+from manim.animation.indication import ShowPassingFlashAround as ShowPassingFlashAround
+
+# Base animation
+from manim.animation.animation import Animation as Animation
+
+# Scene classes
+from manim.scene.scene import Scene as Scene
+from manim.scene.moving_camera_scene import MovingCameraScene as MovingCameraScene
+from manim.scene.zoomed_scene import ZoomedScene as ZoomedScene
+
+# Utility classes
+from manim.mobject.value_tracker import ValueTracker as ValueTracker
+from manim.utils.color import Color as Color
+from manim.utils.color import rgb_to_hex as rgb_to_hex
+from manim.utils.color import hex_to_rgb as hex_to_rgb
+
+# Rate functions and easing
+from manim.utils.rate_functions import linear as linear
+from manim.utils.rate_functions import smooth as smooth
+from manim.utils.rate_functions import ease_in_quad as ease_in_quad
+from manim.utils.rate_functions import ease_out_quad as ease_out_quad
+from manim.utils.rate_functions import ease_in_out_quad as ease_in_out_quad
+from manim.utils.rate_functions import ease_in_cubic as ease_in_cubic
+from manim.utils.rate_functions import ease_out_cubic as ease_out_cubic
+from manim.utils.rate_functions import ease_in_out_cubic as ease_in_out_cubic
+from manim.utils.rate_functions import ease_in_quart as ease_in_quart
+from manim.utils.rate_functions import ease_out_quart as ease_out_quart
+from manim.utils.rate_functions import ease_in_out_quart as ease_in_out_quart
+from manim.utils.rate_functions import ease_in_quint as ease_in_quint
+from manim.utils.rate_functions import ease_out_quint as ease_out_quint
+from manim.utils.rate_functions import ease_in_out_quint as ease_in_out_quint
+from manim.utils.rate_functions import ease_in_sine as ease_in_sine
+from manim.utils.rate_functions import ease_out_sine as ease_out_sine
+from manim.utils.rate_functions import ease_in_out_sine as ease_in_out_sine
+from manim.utils.rate_functions import ease_in_back as ease_in_back
+from manim.utils.rate_functions import ease_out_back as ease_out_back
+from manim.utils.rate_functions import ease_in_out_back as ease_in_out_back
+from manim.utils.rate_functions import ease_in_elastic as ease_in_elastic
+from manim.utils.rate_functions import ease_out_elastic as ease_out_elastic
+from manim.utils.rate_functions import ease_in_out_elastic as ease_in_out_elastic
+from manim.utils.rate_functions import ease_in_bounce as ease_in_bounce
+from manim.utils.rate_functions import ease_out_bounce as ease_out_bounce
+from manim.utils.rate_functions import ease_in_out_bounce as ease_in_out_bounce
+
+# Rate functions module for easy access
+import manim.utils.rate_functions as rate_functions
+
+# Colors
+WHITE: tuple[float, float, float]
+BLACK: tuple[float, float, float]
+RED: tuple[float, float, float]
+GREEN: tuple[float, float, float]
+BLUE: tuple[float, float, float]
+YELLOW: tuple[float, float, float]
+ORANGE: tuple[float, float, float]
+PURPLE: tuple[float, float, float]
+PINK: tuple[float, float, float]
+CYAN: tuple[float, float, float]
+GRAY: tuple[float, float, float]
+DARK_GRAY: tuple[float, float, float]
+LIGHT_GRAY: tuple[float, float, float]
+TEAL: tuple[float, float, float]
+LIGHT_BLUE: tuple[float, float, float]
+DARK_BLUE: tuple[float, float, float]
+LIGHT_GREEN: tuple[float, float, float]
+DARK_GREEN: tuple[float, float, float]
+MAROON: tuple[float, float, float]
+GOLD: tuple[float, float, float]
+
+# Directions / Unit vectors
+UP: tuple[float, float, float]
+DOWN: tuple[float, float, float]
+LEFT: tuple[float, float, float]
+RIGHT: tuple[float, float, float]
+IN: tuple[float, float, float]
+OUT: tuple[float, float, float]
+ORIGIN: tuple[float, float, float]
+
+# Configuration
+def config(*args: Any, **kwargs: Any) -> Any: ...
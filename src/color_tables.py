@@ -0,0 +1,39 @@
+"""Precomputed NumPy views of the color palette.
+
+Scene code that feeds colors into NumPy or GPU buffers should slice these
+tables instead of reparsing hex strings per frame. The tables are built
+once at import time from src.config.COLORS; this module lives apart from
+src.config so that config-only consumers never pay for the numpy import.
+"""
+
+from __future__ import annotations
+
+from dataclasses import fields
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Final
+
+import numpy as np
+
+from src.config import COLORS, ColorPalette
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+_NAMES: Final[tuple[str, ...]] = tuple(
+    f.name for f in fields(ColorPalette) if not f.name.startswith("_")
+)
+_HEXES: Final[tuple[str, ...]] = tuple(getattr(COLORS, n) for n in _NAMES)
+
+PALETTE_RGB_U8: Final[np.ndarray] = np.frombuffer(
+    b"".join(bytes.fromhex(h[1:]) for h in _HEXES),
+    dtype=np.uint8,
+).reshape(-1, 3)
+"""Palette colors as an (N, 3) uint8 array in ColorPalette field order."""
+
+PALETTE_RGB_F32: Final[np.ndarray] = PALETTE_RGB_U8.astype(np.float32) / 255.0
+"""Palette colors as an (N, 3) float32 array normalized to [0, 1]."""
+
+PALETTE_INDEX: Final[Mapping[str, int]] = MappingProxyType(
+    {n: i for i, n in enumerate(_NAMES)},
+)
+"""Immutable mapping from palette field name to row index in the tables."""
@@ -7,44 +7,124 @@ All color values and timing parameters MUST be imported from this module.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
 from typing import Final
 
 
-@dataclass(frozen=True)
+# Module-level color constants - hot paths can import these directly to skip
+# the COLORS attribute lookup (LOAD_GLOBAL + LOAD_ATTR becomes one LOAD_GLOBAL)
+BACKGROUND: Final[str] = "#0D0D0D"
+"""Main dark void background."""
+
+TEXT: Final[str] = "#F2F2F2"
+"""Primary text/foreground color."""
+
+CYAN: Final[str] = "#00F0FF"
+"""Regression lines, highlights, key elements."""
+
+RED: Final[str] = "#FF2A2A"
+"""Errors, warnings, danger indicators."""
+
+GOLD: Final[str] = "#FFD700"
+"""Final synthesis highlight, VALUE PREDICTED text."""
+
+GRID: Final[str] = "#404040"
+"""Faint grid lines on cartesian plane."""
+
+GREEN: Final[str] = "#00FF00"
+"""Terminal cursor color."""
+
+BROWN: Final[str] = "#8B6F47"
+"""Dull text highlight for secondary emphasis."""
+
+
+@dataclass(frozen=True, slots=True)
 class ColorPalette:
     """Central color palette for all video scenes.
 
     All color values are 6-digit hex codes. Do not hardcode hex values
-    in scene files - always reference this palette.
+    in scene files - always reference this palette. Field defaults read
+    the module-level constants above, which remain the single source of
+    truth; performance-critical code may import those constants directly.
     """
 
-    BACKGROUND: str = "#0D0D0D"
+    BACKGROUND: str = BACKGROUND
     """Main dark void background."""
 
-    TEXT: str = "#F2F2F2"
+    TEXT: str = TEXT
     """Primary text/foreground color."""
 
-    CYAN: str = "#00F0FF"
+    CYAN: str = CYAN
     """Regression lines, highlights, key elements."""
 
-    RED: str = "#FF2A2A"
+    RED: str = RED
     """Errors, warnings, danger indicators."""
 
-    GOLD: str = "#FFD700"
+    GOLD: str = GOLD
     """Final synthesis highlight, VALUE PREDICTED text."""
 
-    GRID: str = "#404040"
+    GRID: str = GRID
     """Faint grid lines on cartesian plane."""
 
-    GREEN: str = "#00FF00"
+    GREEN: str = GREEN
     """Terminal cursor color."""
 
-    BROWN: str = "#8B6F47"
+    BROWN: str = BROWN
     """Dull text highlight for secondary emphasis."""
 
+    _rgb: dict[str, tuple[int, int, int]] = field(init=False, repr=False, compare=False)
+    """Pre-parsed (r, g, b) tuples keyed by field name (set in __post_init__)."""
+
+    _rgb_norm: dict[str, tuple[float, float, float]] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    """Pre-parsed normalized RGB tuples keyed by field name (set in __post_init__)."""
+
+    def __post_init__(self) -> None:
+        """Pre-parse every palette color so hot paths never reparse hex strings."""
+        rgb: dict[str, tuple[int, int, int]] = {}
+        rgb_norm: dict[str, tuple[float, float, float]] = {}
+        for palette_field in fields(self):
+            if palette_field.name.startswith("_"):
+                continue
+            b = bytes.fromhex(getattr(self, palette_field.name).lstrip("#"))
+            rgb[palette_field.name] = (b[0], b[1], b[2])
+            rgb_norm[palette_field.name] = (b[0] / 255.0, b[1] / 255.0, b[2] / 255.0)
+        object.__setattr__(self, "_rgb", rgb)
+        object.__setattr__(self, "_rgb_norm", rgb_norm)
+
+    def rgb(self, name: str) -> tuple[int, int, int]:
+        """Get the pre-parsed (r, g, b) tuple for a palette color.
+
+        Args:
+            name: Palette field name (e.g., "CYAN")
 
-@dataclass(frozen=True)
+        Returns:
+            Tuple of (red, green, blue) values in range 0-255
+
+        """
+        rgb: dict[str, tuple[int, int, int]] = getattr(self, "_rgb")
+        return rgb[name]
+
+    def rgb_norm(self, name: str) -> tuple[float, float, float]:
+        """Get the pre-parsed normalized RGB tuple for a palette color.
+
+        Args:
+            name: Palette field name (e.g., "CYAN")
+
+        Returns:
+            Tuple of (red, green, blue) values in range 0.0-1.0
+
+        """
+        rgb_norm: dict[str, tuple[float, float, float]] = getattr(self, "_rgb_norm")
+        return rgb_norm[name]
+
+
+@dataclass(frozen=True, slots=True)
 class TimingConfig:
     """Animation timing constants in seconds.
 
@@ -82,7 +162,7 @@ class TimingConfig:
     """Overlap duration for scene transitions (FadeOut/FadeIn)."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SceneConfig:
     """Timing boundaries for a single scene.
 
@@ -99,10 +179,12 @@ class SceneConfig:
     end_time: float
     """End timestamp in seconds from video start."""
 
-    @property
-    def duration(self) -> float:
-        """Calculate scene duration from end_time - start_time."""
-        return self.end_time - self.start_time
+    duration: float = field(init=False)
+    """Scene duration (end_time - start_time), precomputed at construction."""
+
+    def __post_init__(self) -> None:
+        """Precompute the constant duration so reads are plain attribute loads."""
+        object.__setattr__(self, "duration", self.end_time - self.start_time)
 
 
 # Scene configuration instances - Single source of truth for timing
@@ -145,10 +227,22 @@ ALL_SCENES: Final[tuple[SceneConfig, ...]] = (
     SCENE_SYNTHESIS,
 )
 
+SCENE_NAMES: Final[tuple[str, ...]] = tuple(s.name for s in ALL_SCENES)
+"""Scene names in render order."""
+
+SCENES_BY_NAME: Final[Mapping[str, SceneConfig]] = MappingProxyType(
+    {s.name: s for s in ALL_SCENES},
+)
+"""Immutable O(1) lookup of scene configs by name."""
+
 # Video configuration constants
 VIDEO_TOTAL_DURATION: Final[float] = 120.0
 """Total video duration in seconds (2 minutes)."""
 
+if sum(s.duration for s in ALL_SCENES) != VIDEO_TOTAL_DURATION:
+    _msg = "Scene durations do not sum to VIDEO_TOTAL_DURATION"
+    raise ValueError(_msg)
+
 VIDEO_WIDTH: Final[int] = 1920
 """Video width in pixels (1080p)."""
 
@@ -3,8 +3,36 @@
 This package provides:
 - color_utils: Color palette functions and constants
 - data_generator: Seeded data generation for regression scenes
+
+Submodules are imported lazily (PEP 562) so that importing src.utils does
+not pay for color_utils/data_generator (and their numpy dependency) until
+they are actually touched.
 """
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
 __all__ = ["color_utils", "data_generator"]
+
+_LAZY_SUBMODULES = frozenset(__all__)
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Import a submodule on first attribute access (PEP 562)."""
+    if name in _LAZY_SUBMODULES:
+        import importlib
+
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+def __dir__() -> list[str]:
+    """Include lazily loaded submodules in dir() output."""
+    return sorted(set(globals()) | _LAZY_SUBMODULES)
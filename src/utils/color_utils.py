@@ -3,17 +3,35 @@
 Provides helper functions for converting between color formats and
 applying color transformations. All base color values come from
 src.config.COLORS to maintain single source of truth.
+
+Note: manim is deliberately never imported at module level here. Importing
+manim costs hundreds of milliseconds, and this module is used by scripts
+that only need config/color math. Keep manim imports inside
+_get_manim_color_cls (lazy, resolved once) or under TYPE_CHECKING; ruff's
+flake8-type-checking rules (enabled via select = ["ALL"]) flag regressions.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import functools
+from typing import TYPE_CHECKING, Any, Final
+
+import numpy as np
 
 from src.config import COLORS
 
 if TYPE_CHECKING:
     from manim import ManimColor, Mobject
 
+_HEX_TABLE: Final[tuple[str, ...]] = tuple(f"{i:02X}" for i in range(256))
+"""Precomputed two-digit hex strings for every byte value (avoids per-call formatting)."""
+
+_HEX_TABLE_ARR: Final[np.ndarray] = np.array(_HEX_TABLE)
+"""Array view of _HEX_TABLE for vectorized elementwise hex formatting."""
+
+_MANIM_COLOR_CACHE: Final[dict[str, Any]] = {}
+"""Memoized ManimColor instances keyed by hex string (one construction per color)."""
+
 
 def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
     """Convert hex color string to RGB tuple.
@@ -28,15 +46,12 @@ def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
         ValueError: If hex_color is not in valid format
 
     """
-    hex_color = hex_color.lstrip("#")
+    hex_color = hex_color.removeprefix("#")
     if len(hex_color) != 6:
         msg = f"Invalid hex color format: {hex_color}"
         raise ValueError(msg)
-    return (
-        int(hex_color[0:2], 16),
-        int(hex_color[2:4], 16),
-        int(hex_color[4:6], 16),
-    )
+    b = bytes.fromhex(hex_color)
+    return (b[0], b[1], b[2])
 
 
 def hex_to_rgb_normalized(hex_color: str) -> tuple[float, float, float]:
@@ -65,12 +80,30 @@ def rgb_to_hex(r: int, g: int, b: int) -> str:
         Hex color string in format "#RRGGBB"
 
     """
-    return f"#{r:02X}{g:02X}{b:02X}"
+    return f"#{_HEX_TABLE[r]}{_HEX_TABLE[g]}{_HEX_TABLE[b]}"
+
+
+_ManimColor: type | None = None
+"""Lazily resolved ManimColor class (imported from manim exactly once)."""
+
 
+def _get_manim_color_cls() -> type:
+    """Resolve and memoize the ManimColor class on first use."""
+    global _ManimColor  # noqa: PLW0603
+    if _ManimColor is None:
+        from manim import ManimColor
 
+        _ManimColor = ManimColor
+    return _ManimColor
+
+
+@functools.lru_cache(maxsize=32)
 def get_manim_color(hex_color: str) -> Any:
     """Convert hex color to Manim-compatible color.
 
+    Results are memoized: the palette only contains a handful of distinct
+    colors, so repeated calls return the same ManimColor instance.
+
     Args:
         hex_color: Color in format "#RRGGBB"
 
@@ -78,9 +111,15 @@ def get_manim_color(hex_color: str) -> Any:
         ManimColor instance for use in Manim animations
 
     """
-    from manim import ManimColor
+    return _get_manim_color_cls()(hex_color)
+
 
-    return ManimColor(hex_color)
+def _cached_manim_color(hex_color: str) -> Any:
+    """Get a memoized ManimColor for a hex string, constructing it at most once."""
+    color = _MANIM_COLOR_CACHE.get(hex_color)
+    if color is None:
+        color = _MANIM_COLOR_CACHE[hex_color] = get_manim_color(hex_color)
+    return color
 
 
 def get_background_color() -> Any:
@@ -90,7 +129,7 @@ def get_background_color() -> Any:
         ManimColor for the dark void background (#0D0D0D)
 
     """
-    return get_manim_color(COLORS.BACKGROUND)
+    return _cached_manim_color(COLORS.BACKGROUND)
 
 
 def get_text_color() -> Any:
@@ -100,7 +139,7 @@ def get_text_color() -> Any:
         ManimColor for primary text (#F2F2F2)
 
     """
-    return get_manim_color(COLORS.TEXT)
+    return _cached_manim_color(COLORS.TEXT)
 
 
 def get_cyan_color() -> Any:
@@ -110,7 +149,7 @@ def get_cyan_color() -> Any:
         ManimColor for cyan (#00F0FF)
 
     """
-    return get_manim_color(COLORS.CYAN)
+    return _cached_manim_color(COLORS.CYAN)
 
 
 def get_red_color() -> Any:
@@ -120,7 +159,7 @@ def get_red_color() -> Any:
         ManimColor for red (#FF2A2A)
 
     """
-    return get_manim_color(COLORS.RED)
+    return _cached_manim_color(COLORS.RED)
 
 
 def get_gold_color() -> Any:
@@ -130,7 +169,7 @@ def get_gold_color() -> Any:
         ManimColor for gold (#FFD700)
 
     """
-    return get_manim_color(COLORS.GOLD)
+    return _cached_manim_color(COLORS.GOLD)
 
 
 def get_grid_color() -> Any:
@@ -140,7 +179,7 @@ def get_grid_color() -> Any:
         ManimColor for grid (#404040)
 
     """
-    return get_manim_color(COLORS.GRID)
+    return _cached_manim_color(COLORS.GRID)
 
 
 def get_green_color() -> Any:
@@ -150,7 +189,37 @@ def get_green_color() -> Any:
         ManimColor for green (#00FF00)
 
     """
-    return get_manim_color(COLORS.GREEN)
+    return _cached_manim_color(COLORS.GREEN)
+
+
+def interpolate_colors_batch(
+    color1: str,
+    color2: str,
+    ts: np.ndarray,
+) -> np.ndarray:
+    """Linearly interpolate between two colors for an array of factors.
+
+    Parses each endpoint exactly once and computes all interpolated
+    values in a single vectorized operation, so the Python-level cost
+    is O(1) regardless of how many factors are supplied.
+
+    Args:
+        color1: Starting hex color
+        color2: Ending hex color
+        ts: Array of interpolation factors (clamped to [0, 1])
+
+    Returns:
+        Array of shape (N, 3) with interpolated RGB values as uint8
+
+    """
+    a = np.frombuffer(bytes.fromhex(color1.lstrip("#")), dtype=np.uint8).astype(np.float64)
+    b = np.frombuffer(bytes.fromhex(color2.lstrip("#")), dtype=np.uint8).astype(np.float64)
+
+    # Copy once, then clamp in place - no second temporary array
+    ts = np.array(ts, dtype=np.float64)
+    np.clip(ts, 0.0, 1.0, out=ts)
+
+    return (a + (b - a) * ts[:, None]).astype(np.uint8)
 
 
 def interpolate_color(
@@ -169,16 +238,8 @@ def interpolate_color(
         Interpolated hex color string
 
     """
-    r1, g1, b1 = hex_to_rgb(color1)
-    r2, g2, b2 = hex_to_rgb(color2)
-
-    t = max(0.0, min(1.0, t))  # Clamp to [0, 1]
-
-    r = int(r1 + (r2 - r1) * t)
-    g = int(g1 + (g2 - g1) * t)
-    b = int(b1 + (b2 - b1) * t)
-
-    return rgb_to_hex(r, g, b)
+    r, g, b = interpolate_colors_batch(color1, color2, np.array([t]))[0]
+    return f"#{_HEX_TABLE[r]}{_HEX_TABLE[g]}{_HEX_TABLE[b]}"
 
 
 def apply_color_to_mobject(mobject: Any, hex_color: str) -> Any:
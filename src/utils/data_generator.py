@@ -7,12 +7,20 @@ satisfying FR-004 reproducibility requirement.
 
 from __future__ import annotations
 
-import csv
+import math
+import weakref
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 import numpy as np
+from scipy.special import expit
+
+try:
+    import numexpr as ne
+except ImportError:  # pragma: no cover - numexpr is an optional accelerator
+    ne = None
 
 from src.config import (
     DATA_SEED,
@@ -24,10 +32,12 @@ from src.config import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
     from numpy.random import Generator
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DataPoint:
     """Represents a single observation on the regression graph.
 
@@ -43,6 +53,112 @@ class DataPoint:
     color: str = "#F2F2F2"
 
 
+@dataclass(frozen=True)
+class DataPoints:
+    """Struct-of-arrays collection of observations.
+
+    Canonical representation for generated datasets: two contiguous
+    float64 arrays instead of one Python object per observation, so
+    fitting and geometry math can run fully vectorized. Implements the
+    sequence protocol (len/iteration/indexing yielding DataPoint), so
+    per-point consumers keep working unchanged.
+
+    Attributes:
+        xs: X-coordinates as a 1-D float64 array
+        ys: Y-coordinates as a 1-D float64 array
+
+    """
+
+    xs: np.ndarray
+    ys: np.ndarray
+
+    def __len__(self) -> int:
+        """Get the number of observations."""
+        return self.xs.shape[0]
+
+    def __getitem__(self, index: int) -> DataPoint:
+        """Build the DataPoint view of a single observation."""
+        return DataPoint(x=float(self.xs[index]), y=float(self.ys[index]))
+
+    def __iter__(self) -> Iterator[DataPoint]:
+        """Iterate observations as DataPoint views."""
+        yield from self.as_list()
+
+    def as_list(self) -> list[DataPoint]:
+        """Materialize the observations as a list of DataPoint objects.
+
+        Returns:
+            List of DataPoint objects (adapter for per-point consumers)
+
+        """
+        # tolist() converts to Python floats in one C call and map with
+        # positional args skips per-point keyword dispatch
+        return list(map(DataPoint, self.xs.tolist(), self.ys.tolist()))
+
+
+def _points_to_arrays(
+    points: DataPoints | list[DataPoint],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Get (xs, ys) arrays for a point collection without copying SoA data.
+
+    Args:
+        points: SoA collection or list of DataPoint objects
+
+    Returns:
+        Tuple of contiguous float64 (xs, ys) arrays
+
+    """
+    if isinstance(points, DataPoints):
+        return points.xs, points.ys
+    # fromiter fills the arrays straight from the generators; no
+    # intermediate Python list is allocated and copied
+    count = len(points)
+    return (
+        np.fromiter((p.x for p in points), dtype=np.float64, count=count),
+        np.fromiter((p.y for p in points), dtype=np.float64, count=count),
+    )
+
+
+def _compile_predictor(
+    line_type: str,
+    coefficients: tuple[float, ...],
+) -> Callable[[float | np.ndarray], float | np.ndarray]:
+    """Build a predictor closure specialized for a model's shape.
+
+    The common cases in this repo (linear, cubic) get straight-line
+    arithmetic closures with the coefficients baked in, so per-call
+    dispatch and the generic Horner loop are paid once at construction
+    instead of on every predict call.
+
+    Args:
+        line_type: Model type ("linear" or "polynomial")
+        coefficients: Model parameters in ascending degree order
+
+    Returns:
+        Callable evaluating the model for a scalar or array input
+
+    """
+    if line_type == "linear" and len(coefficients) == 2:
+        slope, intercept = coefficients
+        return lambda x: slope * x + intercept
+    if line_type == "polynomial" and len(coefficients) == 4:
+        c0, c1, c2, c3 = coefficients
+        return lambda x: ((c3 * x + c2) * x + c1) * x + c0
+    if line_type == "polynomial":
+        np_coeffs = np.asarray(coefficients[::-1], dtype=np.float64)
+
+        def _general(x: float | np.ndarray) -> float | np.ndarray:
+            result = np.polyval(np_coeffs, x)
+            return result if isinstance(x, np.ndarray) else float(result)
+
+        return _general
+
+    def _zero(x: float | np.ndarray) -> float | np.ndarray:
+        return np.zeros_like(x, dtype=np.float64) if isinstance(x, np.ndarray) else 0.0
+
+    return _zero
+
+
 @dataclass(frozen=True)
 class RegressionLine:
     """Mathematical model fitted to data.
@@ -59,6 +175,14 @@ class RegressionLine:
     coefficients: tuple[float, ...]
     color: str = "#00F0FF"
 
+    def __post_init__(self) -> None:
+        """Compile the predictor specialized for this model's shape."""
+        object.__setattr__(
+            self,
+            "_predict",
+            _compile_predictor(self.line_type, self.coefficients),
+        )
+
     @property
     def equation_str(self) -> str:
         """Generate LaTeX representation of the equation.
@@ -82,27 +206,25 @@ class RegressionLine:
             return "y = " + " + ".join(terms)
         return "y = f(x)"
 
-    def predict(self, x: float) -> float:
-        """Calculate y for a given x value.
+    def predict(self, x: float | np.ndarray) -> float | np.ndarray:
+        """Calculate y for a given x value or array of x values.
 
         Args:
-            x: Input x value
+            x: Input x value (scalar) or array of x values
 
         Returns:
-            Predicted y value from the model
+            Predicted y value(s) from the model; an array input returns
+            an array, computed by the closure compiled at construction
 
         """
-        if self.line_type == "linear" and len(self.coefficients) == 2:
-            slope, intercept = self.coefficients
-            return slope * x + intercept
-        if self.line_type == "polynomial":
-            return float(
-                sum(coef * (x**i) for i, coef in enumerate(self.coefficients)),
-            )
-        return 0.0
+        predictor: Callable[[float | np.ndarray], float | np.ndarray] = getattr(
+            self,
+            "_predict",
+        )
+        return predictor(x)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ErrorBar:
     """Residual visualization connecting data point to regression line.
 
@@ -128,7 +250,7 @@ class ErrorBar:
         return self.data_point.y - self.predicted_y
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NetworkNode:
     """Single neuron in the neural network visualization.
 
@@ -148,7 +270,7 @@ class NetworkNode:
     radius: float = 0.02
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NetworkConnection:
     """Edge between two network nodes.
 
@@ -170,34 +292,113 @@ class NetworkConnection:
 class NeuralNetwork:
     """Complete network structure for Section 5 visualization.
 
+    The whole structure is held as packed struct-of-arrays: float32
+    coordinates, int16 layer indices, and an (E, 2) int32 edge-index
+    array, with a single shared edge opacity. The per-neuron NetworkNode
+    and per-edge NetworkConnection objects are only materialized when
+    the corresponding property is first read.
+
     Attributes:
-        nodes: All neurons in the network
-        connections: All edges between neurons
+        xs: Node x positions as a 1-D float32 array
+        ys: Node y positions as a 1-D float32 array
+        layers: Per-node layer index as a 1-D int16 array
+        edges: (source, target) node indices as an (E, 2) int32 array
         layer_sizes: Number of nodes per layer
+        edge_opacity: Shared visual transparency for all edges
 
     """
 
-    nodes: list[NetworkNode]
-    connections: list[NetworkConnection]
+    xs: np.ndarray
+    ys: np.ndarray
+    layers: np.ndarray
+    edges: np.ndarray
     layer_sizes: list[int]
+    edge_opacity: float = 0.05
+
+    @cached_property
+    def nodes(self) -> list[NetworkNode]:
+        """Materialize all neurons as NetworkNode objects (built on demand)."""
+        return [
+            NetworkNode(x=x, y=y, layer=layer)
+            for x, y, layer in zip(
+                self.xs.tolist(),
+                self.ys.tolist(),
+                self.layers.tolist(),
+                strict=True,
+            )
+        ]
+
+    @cached_property
+    def connections(self) -> list[NetworkConnection]:
+        """Materialize all edges as NetworkConnection objects (built on demand)."""
+        nodes = self.nodes
+        return [
+            NetworkConnection(
+                source=nodes[source],
+                target=nodes[target],
+                opacity=self.edge_opacity,
+            )
+            for source, target in self.edges.tolist()
+        ]
 
     @property
     def node_count(self) -> int:
         """Get total number of nodes in the network."""
-        return len(self.nodes)
+        return self.xs.shape[0]
+
+
+_VANDER_CACHE: dict[tuple[int, int], tuple[weakref.ref[np.ndarray], np.ndarray]] = {}
+"""Vandermonde matrices keyed by (id(xs), degree), identity-checked via weakref."""
+
+
+def _get_vandermonde(x_values: np.ndarray, degree: int) -> np.ndarray:
+    """Build (or reuse) the Vandermonde matrix for an x-grid and degree.
+
+    Repeated fits on the same x array (the common "same points, different
+    degree/weights" flow) reuse the cached matrix instead of rebuilding it.
+
+    Args:
+        x_values: 1-D array of x coordinates
+        degree: Polynomial degree
+
+    Returns:
+        Vandermonde matrix of shape (len(x_values), degree + 1)
+
+    """
+    key = (id(x_values), degree)
+    hit = _VANDER_CACHE.get(key)
+    if hit is not None:
+        ref, matrix = hit
+        if ref() is x_values:
+            return matrix
+    matrix = np.vander(x_values, degree + 1)
+    _VANDER_CACHE[key] = (weakref.ref(x_values), matrix)
+    return matrix
+
+
+_STREAM_NAMES: Final[tuple[str, ...]] = ("linear", "scurve", "network")
+"""Named RNG substreams, one per generator family ("streams, not seeds")."""
 
 
-def _get_rng(seed: int | None = None) -> Generator:
-    """Create a reproducible random number generator.
+def _get_rng(stream: str, seed: int | None = None) -> Generator:
+    """Create a reproducible generator on a named independent substream.
+
+    Each generator family draws from its own SeedSequence child, so
+    scene workers generating different datasets in parallel never share
+    or overlap a stream, while outputs for a given (stream, seed) pair
+    stay bit-for-bit reproducible.
 
     Args:
+        stream: Substream name (one of _STREAM_NAMES)
         seed: Random seed (defaults to DATA_SEED from config)
 
     Returns:
         NumPy Generator instance
 
     """
-    return np.random.default_rng(seed if seed is not None else DATA_SEED)
+    root = np.random.SeedSequence(seed if seed is not None else DATA_SEED)
+    children = root.spawn(len(_STREAM_NAMES))
+    return np.random.default_rng(children[_STREAM_NAMES.index(stream)])
 
 
 def generate_linear_data(
@@ -206,7 +407,7 @@ def generate_linear_data(
     intercept: float = LINEAR_INTERCEPT,
     noise_std: float = LINEAR_NOISE_STD,
     seed: int = DATA_SEED,
-) -> list[DataPoint]:
+) -> DataPoints:
     """Generate linear trend data with noise.
 
     Creates data points following y = slope * x + intercept + noise,
@@ -220,29 +421,91 @@ def generate_linear_data(
         seed: Random seed for reproducibility
 
     Returns:
-        List of DataPoint objects with generated coordinates
+        DataPoints collection with generated coordinates
 
     """
-    rng = _get_rng(seed)
+    return DataPoints(
+        *_generate_linear_arrays(n_points, slope, intercept, noise_std, seed),
+    )
 
-    # Generate evenly spaced x values from 1 to 10
-    x_values = np.linspace(1.0, 10.0, n_points)
 
-    # Add some jitter to x positions for natural look
-    x_jitter = rng.normal(0, 0.1, n_points)
-    x_values = x_values + x_jitter
+@lru_cache(maxsize=16)
+def _generate_linear_arrays(
+    n_points: int,
+    slope: float,
+    intercept: float,
+    noise_std: float,
+    seed: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Build (and memoize) the (xs, ys) arrays for a linear dataset.
 
-    # Generate y values with noise
-    noise = rng.normal(0, noise_std, n_points)
-    y_values = slope * x_values + intercept + noise
+    Generation is deterministic per argument tuple (FR-004), so repeated
+    calls across scene render passes return the cached arrays. The arrays
+    are marked read-only so sharing them between callers is safe.
+    """
+    rng = _get_rng("linear", seed)
+
+    # Generate evenly spaced x values from 1 to 10
+    x_values = np.linspace(1.0, 10.0, n_points)
 
-    return [DataPoint(x=float(x), y=float(y)) for x, y in zip(x_values, y_values, strict=True)]
+    # One RNG draw covers both the x jitter and the y noise; rows are
+    # scaled in place to the required standard deviations
+    z = rng.standard_normal((2, n_points))
+    x_jitter = z[0]
+    x_jitter *= 0.1
+    noise = z[1]
+    noise *= noise_std
+
+    # Add some jitter to x positions for natural look (in place)
+    x_values += x_jitter
+
+    if ne is not None:
+        # numexpr fuses the three arithmetic passes into one SIMD sweep
+        y_values = ne.evaluate("slope * x_values + intercept + noise")
+    else:
+        # Generate y values with noise, reusing the noise buffer instead
+        # of allocating temporaries for each arithmetic step
+        y_values = noise
+        y_values += intercept
+        y_values += slope * x_values
+
+    x_values.flags.writeable = False
+    y_values.flags.writeable = False
+    return x_values, y_values
+
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    njit = None
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def _scurve_kernel(x: np.ndarray, noise: np.ndarray, out: np.ndarray) -> None:
+        """Evaluate the S-curve in one fused pass (compiled by numba).
+
+        A single loop picks the correct branch per element, so only one
+        transcendental is evaluated per point and the scale/shift/noise
+        steps are fused instead of spilling through temporaries.
+        """
+        for i in range(x.shape[0]):
+            xi = x[i]
+            if xi < 3.0:
+                base = 0.5 + 0.5 * math.tanh((xi - 1.5) * 1.5)
+            elif xi < 7.0:
+                base = 1.0 + 0.1 * math.sin(xi * 2.0)
+            else:
+                base = 1.0 - 0.3 * (xi - 7.0) ** 2
+            out[i] = base * 5.0 + 2.0 + noise[i]
+else:
+    _scurve_kernel = None
 
 
 def generate_scurve_data(
     n_points: int = NONLINEAR_DATA_POINTS,
     seed: int = DATA_SEED,
-) -> list[DataPoint]:
+) -> DataPoints:
     """Generate S-curve pattern data (rise, plateau, crash).
 
     Creates data points following a sigmoid-like pattern that
@@ -253,55 +516,77 @@ def generate_scurve_data(
         seed: Random seed for reproducibility
 
     Returns:
-        List of DataPoint objects with S-curve coordinates
+        DataPoints collection with S-curve coordinates
 
     """
-    rng = _get_rng(seed)
+    return DataPoints(*_generate_scurve_arrays(n_points, seed))
 
-    # Generate x values across the curve
-    x_values = np.linspace(0.0, 10.0, n_points)
 
-    # S-curve function: steep rise, plateau, then crash
-    # Using a combination of tanh and polynomial
-    y_base = np.zeros(n_points)
-
-    for i, x in enumerate(x_values):
-        if x < 3:
-            # Initial rise phase
-            y_base[i] = 0.5 + 0.5 * np.tanh((x - 1.5) * 1.5)
-        elif x < 7:
-            # Plateau phase with slight wobble
-            y_base[i] = 1.0 + 0.1 * np.sin(x * 2)
-        else:
-            # Crash phase
-            y_base[i] = 1.0 - 0.3 * (x - 7) ** 2
+@lru_cache(maxsize=16)
+def _generate_scurve_arrays(
+    n_points: int,
+    seed: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Build (and memoize) the (xs, ys) arrays for an S-curve dataset.
 
-    # Scale to reasonable y range
-    y_values = y_base * 5 + 2
+    Deterministic per argument tuple (FR-004); cached arrays are marked
+    read-only so sharing between callers is safe.
+    """
+    rng = _get_rng("scurve", seed)
 
-    # Add noise
+    # Generate x values across the curve
+    x_values = np.linspace(0.0, 10.0, n_points)
     noise = rng.normal(0, 0.2, n_points)
-    y_values = y_values + noise
 
-    return [DataPoint(x=float(x), y=float(y)) for x, y in zip(x_values, y_values, strict=True)]
+    if _scurve_kernel is not None:
+        # Fused single-pass evaluation compiled by numba
+        y_values = np.empty(n_points)
+        _scurve_kernel(x_values, noise, y_values)
+    else:
+        # S-curve function: steep rise, plateau, then crash
+        # Evaluated branch-by-branch across the whole vector in C instead
+        # of one scalar at a time in Python. The rise uses SciPy's SIMD
+        # expit; expit(2a) == 0.5 + 0.5*tanh(a), so values are unchanged
+        rise = expit((x_values - 1.5) * 3.0)
+        plateau = 1.0 + 0.1 * np.sin(x_values * 2)
+        crash = 1.0 - 0.3 * (x_values - 7) ** 2
+        y_base = np.where(x_values < 3, rise, np.where(x_values < 7, plateau, crash))
+
+        if ne is not None:
+            # Fuse the scale/shift/noise passes into one SIMD sweep
+            y_values = ne.evaluate("y_base * 5 + 2 + noise")
+        else:
+            # Scale to reasonable y range and add noise, all in the
+            # y_base buffer
+            y_base *= 5
+            y_base += 2
+            y_base += noise
+            y_values = y_base
+
+    x_values.flags.writeable = False
+    y_values.flags.writeable = False
+    return x_values, y_values
 
 
-def save_data_to_csv(points: list[DataPoint], filepath: str | Path) -> None:
+def save_data_to_csv(points: DataPoints | list[DataPoint], filepath: str | Path) -> None:
     """Save data points to CSV file.
 
     Args:
-        points: List of DataPoint objects to save
+        points: Point collection to save
         filepath: Output file path
 
     """
     filepath = Path(filepath)
     filepath.parent.mkdir(parents=True, exist_ok=True)
 
-    with filepath.open("w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(["x", "y"])
-        for point in points:
-            writer.writerow([point.x, point.y])
+    xs, ys = _points_to_arrays(points)
+    np.savetxt(
+        filepath,
+        np.column_stack([xs, ys]),
+        delimiter=",",
+        header="x,y",
+        comments="",
+    )
 
 
 def load_data_from_csv(filepath: str | Path) -> list[DataPoint]:
@@ -319,35 +604,31 @@ def load_data_from_csv(filepath: str | Path) -> list[DataPoint]:
     """
     filepath = Path(filepath)
 
-    points: list[DataPoint] = []
-    with filepath.open() as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            points.append(DataPoint(x=float(row["x"]), y=float(row["y"])))
+    data = np.loadtxt(filepath, delimiter=",", skiprows=1, ndmin=2)
+    return [DataPoint(x=x, y=y) for x, y in data.tolist()]
 
-    return points
 
-
-def fit_linear_regression(points: list[DataPoint]) -> RegressionLine:
+def fit_linear_regression(points: DataPoints | list[DataPoint]) -> RegressionLine:
     """Fit a linear regression model to data points.
 
     Uses least squares to find the best-fit line y = mx + b.
 
     Args:
-        points: List of data points to fit
+        points: Point collection to fit
 
     Returns:
         RegressionLine with fitted slope and intercept
 
     """
-    x_values = np.array([p.x for p in points])
-    y_values = np.array([p.y for p in points])
+    x_values, y_values = _points_to_arrays(points)
 
-    # Least squares: y = mx + b
-    # Using numpy polyfit for degree 1
-    coefficients = np.polyfit(x_values, y_values, 1)
-    slope = float(coefficients[0])
-    intercept = float(coefficients[1])
+    # Closed-form least squares for the 2-parameter case: five reductions
+    # instead of polyfit's Vandermonde + SVD machinery
+    x_mean = x_values.mean()
+    y_mean = y_values.mean()
+    x_centered = x_values - x_mean
+    slope = float((x_centered * (y_values - y_mean)).sum() / (x_centered**2).sum())
+    intercept = float(y_mean - slope * x_mean)
 
     return RegressionLine(
         line_type="linear",
@@ -356,27 +637,27 @@ def fit_linear_regression(points: list[DataPoint]) -> RegressionLine:
 
 
 def fit_polynomial_regression(
-    points: list[DataPoint],
+    points: DataPoints | list[DataPoint],
     degree: int = 3,
 ) -> RegressionLine:
     """Fit a polynomial regression model to data points.
 
     Args:
-        points: List of data points to fit
+        points: Point collection to fit
         degree: Polynomial degree (default: 3 for cubic)
 
     Returns:
         RegressionLine with fitted polynomial coefficients
 
     """
-    x_values = np.array([p.x for p in points])
-    y_values = np.array([p.y for p in points])
+    x_values, y_values = _points_to_arrays(points)
 
-    # Fit polynomial
-    coefficients = np.polyfit(x_values, y_values, degree)
+    # Solve least squares on a (cached) Vandermonde matrix directly
+    vandermonde = _get_vandermonde(x_values, degree)
+    solution = np.linalg.lstsq(vandermonde, y_values, rcond=None)[0]
 
     # Reverse to get ascending degree order
-    coefficients = tuple(reversed(coefficients.tolist()))
+    coefficients = tuple(reversed(solution.tolist()))
 
     return RegressionLine(
         line_type="polynomial",
@@ -385,28 +666,31 @@ def fit_polynomial_regression(
 
 
 def create_error_bars(
-    points: list[DataPoint],
+    points: DataPoints | list[DataPoint],
     regression: RegressionLine,
 ) -> list[ErrorBar]:
     """Create error bar visualizations for data points.
 
     Args:
-        points: List of data points
+        points: Point collection
         regression: Fitted regression model
 
     Returns:
         List of ErrorBar objects for each data point
 
     """
+    xs, _ = _points_to_arrays(points)
+    predictions = regression.predict(xs)
     return [
-        ErrorBar(
-            data_point=point,
-            predicted_y=regression.predict(point.x),
-        )
-        for point in points
+        ErrorBar(data_point=point, predicted_y=predicted)
+        for point, predicted in zip(points, predictions.tolist(), strict=True)
     ]
 
 
+_DEFAULT_NETWORK: NeuralNetwork | None = None
+"""Cached default-argument network (deterministic, built once on first use)."""
+
+
 def generate_neural_network(
     layer_sizes: list[int] | None = None,
     min_nodes: int = 1000,
@@ -415,6 +699,9 @@ def generate_neural_network(
 
     Creates a layered network with specified layer sizes. If layer_sizes
     is not provided, generates a network with at least min_nodes nodes.
+    The default-argument network is deterministic and shared: the same
+    instance is returned on every call, so its lazily materialized node
+    and connection lists are also built only once.
 
     Args:
         layer_sizes: List of node counts per layer
@@ -424,6 +711,11 @@ def generate_neural_network(
         NeuralNetwork with nodes and connections
 
     """
+    global _DEFAULT_NETWORK  # noqa: PLW0603
+    is_default = layer_sizes is None and min_nodes == 1000
+    if is_default and _DEFAULT_NETWORK is not None:
+        return _DEFAULT_NETWORK
+
     if layer_sizes is None:
         # Default structure to meet 1000+ node requirement
         # 5 layers: 50 -> 200 -> 400 -> 250 -> 100 = 1000 nodes
@@ -435,55 +727,89 @@ def generate_neural_network(
         scale_factor = (min_nodes // total_nodes) + 1
         layer_sizes = [size * scale_factor for size in layer_sizes]
 
-    nodes: list[NetworkNode] = []
-    connections: list[NetworkConnection] = []
+    xs, ys, layers, edges = _generate_neural_network_arrays(tuple(layer_sizes))
+
+    network = NeuralNetwork(
+        xs=xs,
+        ys=ys,
+        layers=layers,
+        edges=edges,
+        layer_sizes=layer_sizes,
+    )
+    if is_default:
+        _DEFAULT_NETWORK = network
+    return network
+
+
+@lru_cache(maxsize=16)
+def _generate_neural_network_arrays(
+    layer_sizes: tuple[int, ...],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Build (and memoize) the packed (xs, ys, layers, edges) node arrays.
 
-    # Calculate positions for each layer
+    Network structure is fully determined by the resolved layer sizes, so
+    repeated scene render passes reuse the cached arrays. Arrays are
+    marked read-only so sharing between NeuralNetwork instances is safe.
+
+    Args:
+        layer_sizes: Resolved (already scaled) node counts per layer
+
+    Returns:
+        Tuple of (xs, ys, layers, edges) arrays
+
+    """
+    # Calculate positions for each layer via broadcasting: per-layer x is
+    # repeated across the layer, per-layer y ramps are concatenated.
+    # Coordinates are computed natively in float32 - screen-precision is
+    # plenty at 1920px and the narrower lanes halve memory traffic
     num_layers = len(layer_sizes)
     layer_spacing = 14.0 / (num_layers + 1)  # Spread across screen width
 
-    for layer_idx, layer_size in enumerate(layer_sizes):
-        x_pos = -7.0 + (layer_idx + 1) * layer_spacing
-        node_spacing = 8.0 / (layer_size + 1) if layer_size > 1 else 0
-
-        for node_idx in range(layer_size):
-            y_pos = -4.0 + (node_idx + 1) * node_spacing
-            nodes.append(
-                NetworkNode(
-                    x=x_pos,
-                    y=y_pos,
-                    layer=layer_idx,
-                ),
-            )
+    x_positions = -7.0 + (np.arange(num_layers, dtype=np.float32) + 1.0) * layer_spacing
+    xs = np.repeat(x_positions, layer_sizes)
+    layers = np.repeat(np.arange(num_layers, dtype=np.int16), layer_sizes)
+    ys = np.concatenate(
+        [
+            -4.0
+            + (np.arange(size, dtype=np.float32) + 1.0)
+            * (8.0 / (size + 1) if size > 1 else 0.0)
+            for size in layer_sizes
+        ],
+    )
 
-    # Create connections between adjacent layers
-    node_offset = 0
+    # Create connections between adjacent layers as packed index pairs:
+    # every source id is repeated once per target, targets are tiled per
+    # source - two C calls per layer pair instead of nested Python loops.
+    # Layer start indices come from one cumulative sum instead of a
+    # running offset maintained across iterations
+    offsets = np.cumsum([0, *layer_sizes], dtype=np.int32)
+    edge_blocks: list[np.ndarray] = []
     for layer_idx in range(num_layers - 1):
         current_layer_size = layer_sizes[layer_idx]
         next_layer_size = layer_sizes[layer_idx + 1]
 
-        # Connect each node to a subset of next layer (for performance)
+        # Connect each node to an evenly distributed subset of the next
+        # layer (for performance)
         max_connections_per_node = min(10, next_layer_size)
+        step = max(1, next_layer_size // max_connections_per_node)
+        target_local = np.arange(0, next_layer_size, step, dtype=np.int32)
 
-        for i in range(current_layer_size):
-            source_node = nodes[node_offset + i]
-
-            # Connect to evenly distributed nodes in next layer
-            step = max(1, next_layer_size // max_connections_per_node)
-            for j in range(0, next_layer_size, step):
-                target_node = nodes[node_offset + current_layer_size + j]
-                connections.append(
-                    NetworkConnection(
-                        source=source_node,
-                        target=target_node,
-                        opacity=0.05,  # Very low opacity for many connections
-                    ),
-                )
-
-        node_offset += current_layer_size
-
-    return NeuralNetwork(
-        nodes=nodes,
-        connections=connections,
-        layer_sizes=layer_sizes,
+        source_ids = np.repeat(
+            np.arange(current_layer_size, dtype=np.int32) + offsets[layer_idx],
+            target_local.shape[0],
+        )
+        target_ids = np.tile(
+            target_local + offsets[layer_idx + 1],
+            current_layer_size,
+        )
+        edge_blocks.append(np.stack([source_ids, target_ids], axis=1))
+
+    edges = (
+        np.concatenate(edge_blocks)
+        if edge_blocks
+        else np.empty((0, 2), dtype=np.int32)
     )
+
+    for array in (xs, ys, layers, edges):
+        array.flags.writeable = False
+    return xs, ys, layers, edges
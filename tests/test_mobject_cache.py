@@ -0,0 +1,122 @@
+"""Mobject geometry cache unit tests.
+
+Tests for the content-keyed on-disk cache, covering the miss/hit round
+trip for composite mobjects whose geometry lives in submobjects.
+
+These tests require manim to be available. Skip if not installed.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+try:
+    from manim import Circle, Square, VGroup
+
+    MANIM_AVAILABLE = True
+except ImportError:
+    MANIM_AVAILABLE = False
+    Circle = None  # type: ignore[assignment, misc]
+    Square = None  # type: ignore[assignment, misc]
+    VGroup = None  # type: ignore[assignment, misc]
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+pytestmark = pytest.mark.skipif(not MANIM_AVAILABLE, reason="Manim not available")
+
+
+if MANIM_AVAILABLE:
+    from videos.templates import mobject_cache
+    from videos.templates.mobject_cache import cached_color, content_cached
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the cache at a fresh temporary directory."""
+    monkeypatch.setattr(mobject_cache, "CACHE_DIR", tmp_path)
+    return tmp_path
+
+
+if MANIM_AVAILABLE:
+
+    @content_cached
+    def _build_composite(radius: float) -> VGroup:
+        """Build a styled composite whose own points array is empty."""
+        circle = Circle(radius=radius, color="#FF0000", fill_opacity=0.5)
+        square = Square(side_length=radius, color="#00FF00", stroke_width=2.0)
+        return VGroup(circle, square)
+
+
+class TestContentCached:
+    """Test the content-keyed geometry cache round trip."""
+
+    def test_miss_builds_original(self, cache_dir: Path) -> None:
+        """Verify a cold call returns the factory's own mobject."""
+        result = _build_composite(1.0)
+        assert isinstance(result, VGroup)
+        assert len(result) == 2
+
+    def test_miss_writes_cache_entry(self, cache_dir: Path) -> None:
+        """Verify a cold call stores points and style files."""
+        _build_composite(1.0)
+        assert len(list(cache_dir.glob("*.npz"))) == 1
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+    def test_hit_preserves_family_points(self, cache_dir: Path) -> None:
+        """Verify a hit rebuilds every member's points, not just the root's."""
+        original = _build_composite(1.5)
+        rebuilt = _build_composite(1.5)
+        original_members = original.family_members_with_points()
+        rebuilt_members = rebuilt.family_members_with_points()
+        assert len(rebuilt_members) == len(original_members)
+        for original_member, rebuilt_member in zip(
+            original_members,
+            rebuilt_members,
+            strict=True,
+        ):
+            assert np.allclose(rebuilt_member.points, original_member.points)
+
+    def test_hit_preserves_style(self, cache_dir: Path) -> None:
+        """Verify a hit restores each member's stroke and fill."""
+        original = _build_composite(2.0)
+        rebuilt = _build_composite(2.0)
+        for original_member, rebuilt_member in zip(
+            original.family_members_with_points(),
+            rebuilt.family_members_with_points(),
+            strict=True,
+        ):
+            assert rebuilt_member.get_fill_color().to_hex() == (
+                original_member.get_fill_color().to_hex()
+            )
+            assert rebuilt_member.get_fill_opacity() == pytest.approx(
+                original_member.get_fill_opacity(),
+            )
+            assert rebuilt_member.get_stroke_color().to_hex() == (
+                original_member.get_stroke_color().to_hex()
+            )
+            assert rebuilt_member.get_stroke_width() == pytest.approx(
+                original_member.get_stroke_width(),
+            )
+
+    def test_distinct_arguments_miss_separately(self, cache_dir: Path) -> None:
+        """Verify different arguments produce different cache entries."""
+        _build_composite(1.0)
+        _build_composite(2.0)
+        assert len(list(cache_dir.glob("*.npz"))) == 2
+
+
+class TestCachedColor:
+    """Test the memoized color constructor."""
+
+    def test_returns_shared_instance(self) -> None:
+        """Verify repeated calls return the same object."""
+        assert cached_color("#123456") is cached_color("#123456")
+
+    def test_parses_hex(self) -> None:
+        """Verify the color round-trips its hex string."""
+        assert cached_color("#FF0000").to_hex() == "#FF0000"
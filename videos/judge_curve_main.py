@@ -1,40 +1,49 @@
 #!/usr/bin/env python
 """Entry point script for rendering The Judge & The Curve video.
 
+Installed as the `judge-curve` console script (see [project.scripts] in
+pyproject.toml); `pip install -e .` puts the package on the path, so no
+sys.path manipulation is needed at startup.
+
 Usage:
     # Low quality preview (480p, fast)
-    python videos/judge_curve_main.py -ql
+    judge-curve -ql
 
     # Medium quality (720p)
-    python videos/judge_curve_main.py -qm
+    judge-curve -qm
 
     # High quality final render (1080p60, required for delivery)
-    python videos/judge_curve_main.py -qh
+    judge-curve -qh
 
     # 4K render (future-proofing)
-    python videos/judge_curve_main.py -qk
+    judge-curve -qk
 """
 
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-
-# Add project root to path for imports
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+from typing import Final
 
 from manim import config
 
 from src.config import VIDEO_FPS, VIDEO_HEIGHT, VIDEO_WIDTH
 
+_MANIM_CONFIG: Final[dict[str, object]] = {
+    "pixel_width": VIDEO_WIDTH,
+    "pixel_height": VIDEO_HEIGHT,
+    "frame_rate": VIDEO_FPS,
+    # Animation hashing costs more than re-rendering on a composition
+    # this size, so skip the cache and flush partial movies eagerly
+    "disable_caching": True,
+    "flush_cache": True,
+}
+"""Render settings resolved once at import and applied in a single update."""
+
 
 def main() -> None:
     """Render the complete Judge & Curve video."""
-    # Configure Manim settings
-    config.pixel_width = VIDEO_WIDTH
-    config.pixel_height = VIDEO_HEIGHT
-    config.frame_rate = VIDEO_FPS
+    # One batch update instead of per-attribute assignments, so Manim's
+    # config property setters run their invalidation cascade only once
+    config.update(_MANIM_CONFIG)
 
     # Import and render
     from videos.scenes.judge_curve_complete import JudgeCurveComplete
@@ -11,17 +11,16 @@ Plus the composition class:
 - JudgeCurveComplete: Full 120-second video composition
 
 Also includes existing example scenes for reference.
+
+Scene classes are resolved lazily (PEP 562): rendering a single scene
+imports only that section's module instead of paying Manim's mobject
+graph construction for all five sections up front.
 """
 
 from __future__ import annotations
 
-from videos.scenes.example_scene import DynamicMathExample, ShapeMorphingExample
-from videos.scenes.judge_curve_complete import JudgeCurveComplete
-from videos.scenes.section1_hallucination import HallucinationScene
-from videos.scenes.section2_scale import ContinuousScaleScene
-from videos.scenes.section3_linear import LinearRegressionScene
-from videos.scenes.section4_nonlinear import NonLinearRegressionScene
-from videos.scenes.section5_synthesis import SynthesisScene
+import importlib
+from typing import Final
 
 __all__ = [
     "ContinuousScaleScene",
@@ -33,3 +32,31 @@ __all__ = [
     "ShapeMorphingExample",
     "SynthesisScene",
 ]
+
+_LAZY_SCENES: Final[dict[str, str]] = {
+    "ContinuousScaleScene": "section2_scale",
+    "DynamicMathExample": "example_scene",
+    "HallucinationScene": "section1_hallucination",
+    "JudgeCurveComplete": "judge_curve_complete",
+    "LinearRegressionScene": "section3_linear",
+    "NonLinearRegressionScene": "section4_nonlinear",
+    "ShapeMorphingExample": "example_scene",
+    "SynthesisScene": "section5_synthesis",
+}
+"""Scene class name -> submodule holding it (imported on first access)."""
+
+
+def __getattr__(name: str) -> object:
+    """Resolve a scene class by importing its submodule on first access."""
+    module_name = _LAZY_SCENES.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    scene_cls = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = scene_cls
+    return scene_cls
+
+
+def __dir__() -> list[str]:
+    """List the module's public names, including lazily resolved scenes."""
+    return sorted(set(globals()) | set(__all__))
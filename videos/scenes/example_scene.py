@@ -7,20 +7,41 @@ This module shows:
 
 from __future__ import annotations
 
+from typing import Any
+
 from manim import (
     AnimationGroup,
     Circle,
+    DecimalNumber,
     FadeIn,
     FadeOut,
     MathTex,
     Scene,
     Square,
+    Text,
     ValueTracker,
+    VGroup,
     rate_functions,
 )
 
 
-class DynamicMathExample(Scene):
+class FrozenWaitScene(Scene):
+    """Scene whose waits hold a single frozen frame.
+
+    A plain self.wait(t) renders config.frame_rate * t identical frames
+    through the full writer pipeline. Freezing the frame lets the
+    renderer emit one frame and extend its duration at encode time.
+    Scenes that need updaters ticking during a wait can pass
+    frozen_frame=False explicitly.
+    """
+
+    def wait(self, duration: float = 1.0, **kwargs: Any) -> None:
+        """Wait while emitting one frozen frame instead of duplicates."""
+        kwargs.setdefault("frozen_frame", True)
+        super().wait(duration, **kwargs)
+
+
+class DynamicMathExample(FrozenWaitScene):
     """Demonstrates ValueTracker with add_updater for dynamic expressions."""
 
     def construct(self) -> None:
@@ -32,19 +53,20 @@ class DynamicMathExample(Scene):
         math_expr: MathTex = MathTex(r"f(x) = x^2")
         math_expr.shift([-2, 2, 0])
 
-        result_expr: MathTex = MathTex("= 1")
+        # A DecimalNumber mutates its glyphs in place, so the updater
+        # performs zero LaTeX compiles and no new mobject allocations
+        result_expr: VGroup = VGroup(
+            MathTex("="),
+            DecimalNumber(1.0, num_decimal_places=1),
+        ).arrange()
         result_expr.shift([2, 2, 0])
 
-        # Update the result whenever the tracker changes
-        def update_result(mob: MathTex) -> MathTex:
-            """Update result expression based on tracker value."""
-            x_val: float = x_tracker.get_value()
-            result: float = x_val**2
-            new_expr: MathTex = MathTex(f"= {result:.1f}")
-            new_expr.move_to(result_expr)
-            return new_expr
+        # Update the displayed value whenever the tracker changes
+        def update_result(mob: VGroup) -> None:
+            """Set the result value in place from the tracker."""
+            mob[1].set_value(x_tracker.get_value() ** 2)
 
-        result_expr.add_updater(update_result)  # type: ignore[arg-type]
+        result_expr.add_updater(update_result)
 
         self.add(math_expr, result_expr)
         self.wait(0.5)
@@ -59,7 +81,7 @@ class DynamicMathExample(Scene):
         self.wait(1)
 
 
-class ShapeMorphingExample(Scene):
+class ShapeMorphingExample(FrozenWaitScene):
     """Demonstrates smooth shape morphing and animation."""
 
     def construct(self) -> None:
@@ -72,8 +94,9 @@ class ShapeMorphingExample(Scene):
         square: Square = Square(side_length=2.0, color="RED")
         square.shift([3, 0, 0])
 
-        # Add title
-        title: MathTex = MathTex(r"\text{Shape Morphing}")
+        # Add title - plain text goes through Pango/Cairo, skipping the
+        # TeX -> DVI -> SVG subprocess pipeline for a static string
+        title: Text = Text("Shape Morphing", font_size=48)
         title.shift([0, 3, 0])
 
         self.add(title, circle, square)
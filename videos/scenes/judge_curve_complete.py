@@ -6,10 +6,271 @@ precise timing boundaries and seamless transitions.
 
 from __future__ import annotations
 
+import gc
+import hashlib
+import importlib
+import json
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Final
+
 from manim import Scene
 from manim_voiceover import VoiceoverScene
+from manim_voiceover.services.base import SpeechService
 
 from src.utils.color_utils import get_background_color
+from videos.scenes.section1_hallucination import HallucinationScene
+from videos.scenes.section2_scale import ContinuousScaleScene
+from videos.scenes.section3_linear import LinearRegressionScene
+from videos.scenes.section4_nonlinear import NonLinearRegressionScene
+from videos.scenes.section5_synthesis import SynthesisScene
+from videos.scenes.voiceover_service import CachedGTTSService
+
+_BACKGROUND_COLOR: Final = get_background_color()
+"""Background color resolved once at import instead of per scene construction."""
+
+_SECTION_SCENES: Final[tuple[tuple[str, str], ...]] = (
+    ("videos.scenes.section1_hallucination", "HallucinationScene"),
+    ("videos.scenes.section2_scale", "ContinuousScaleScene"),
+    ("videos.scenes.section3_linear", "LinearRegressionScene"),
+    ("videos.scenes.section4_nonlinear", "NonLinearRegressionScene"),
+    ("videos.scenes.section5_synthesis", "SynthesisScene"),
+)
+"""(module, class) pairs for the five section scenes, in video order."""
+
+
+def _render_one(module_name: str, class_name: str, output_file: str) -> str:
+    """Render a single section scene to its own MP4 (runs in a worker process).
+
+    Args:
+        module_name: Dotted module path containing the scene class
+        class_name: Scene class name to render
+        output_file: Output file name for this section
+
+    Returns:
+        The output file name, for bookkeeping by the parent process
+
+    """
+    from manim import config
+
+    config.output_file = output_file
+    scene_cls = getattr(importlib.import_module(module_name), class_name)
+    scene_cls().render()
+    return output_file
+
+
+def render_all_parallel(output_dir: str | Path = "media/sections") -> Path:
+    """Render all five sections concurrently and concatenate with ffmpeg.
+
+    Each worker process renders one section to its own MP4, so memory
+    stays bounded to a single section per process and wall time drops to
+    roughly the longest section. The final video is stitched with a
+    stream-copy concat (no re-encode).
+
+    Args:
+        output_dir: Directory for per-section MP4s and the final video
+
+    Returns:
+        Path to the concatenated final MP4
+
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    section_files = [
+        output_dir / f"section{index}.mp4"
+        for index in range(1, len(_SECTION_SCENES) + 1)
+    ]
+    with ProcessPoolExecutor(max_workers=len(_SECTION_SCENES)) as executor:
+        futures = [
+            executor.submit(_render_one, module_name, class_name, str(path))
+            for (module_name, class_name), path in zip(
+                _SECTION_SCENES,
+                section_files,
+                strict=True,
+            )
+        ]
+        for future in futures:
+            future.result()
+
+    concat_list = output_dir / "sections.txt"
+    concat_list.write_text(
+        "".join(f"file '{path.resolve()}'\n" for path in section_files),
+    )
+    final_path = output_dir / "judge_curve_final.mp4"
+    subprocess.run(
+        [
+            "ffmpeg",
+            "-y",
+            "-f",
+            "concat",
+            "-safe",
+            "0",
+            "-i",
+            str(concat_list),
+            "-c",
+            "copy",
+            str(final_path),
+        ],
+        check=True,
+    )
+    return final_path
+
+
+def render_all_streamed(
+    output_path: str | Path = "media/judge_curve_final.mp4",
+) -> Path:
+    """Render all sections feeding frames to one ffmpeg encoder pipe.
+
+    Instead of writing per-section intermediate movies to disk and
+    re-muxing them, every rendered frame is piped raw into a single
+    libx264 encoder opened once, eliminating all intermediate frame
+    storage for the full composition.
+
+    Args:
+        output_path: Path for the encoded final MP4
+
+    Returns:
+        Path to the encoded final MP4
+
+    """
+    from manim import config
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    encoder = subprocess.Popen(
+        [
+            "ffmpeg",
+            "-y",
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "rgba",
+            "-s",
+            f"{config.pixel_width}x{config.pixel_height}",
+            "-r",
+            str(config.frame_rate),
+            "-i",
+            "pipe:0",
+            "-c:v",
+            "libx264",
+            "-pix_fmt",
+            "yuv420p",
+            str(output_path),
+        ],
+        stdin=subprocess.PIPE,
+    )
+    stdin = encoder.stdin
+    if stdin is None:  # pragma: no cover - Popen with PIPE always sets stdin
+        msg = "ffmpeg encoder pipe was not opened"
+        raise RuntimeError(msg)
+
+    def _pipe_frame(frame_or_renderer: Any, num_frames: int = 1) -> None:
+        """Forward a rendered frame's pixels straight to the encoder.
+
+        Frozen-frame waits arrive as one buffer with a repeat count, so
+        the bytes are written num_frames times to keep the composition's
+        timing intact.
+
+        Args:
+            frame_or_renderer: Frame array or renderer exposing one
+            num_frames: How many times the frame appears in the output
+
+        """
+        pixels = getattr(frame_or_renderer, "pixel_array", frame_or_renderer)
+        data = bytes(memoryview(pixels).cast("B"))
+        for _ in range(num_frames):
+            stdin.write(data)
+
+    previous_write_to_movie = config.write_to_movie
+    config.write_to_movie = False
+    try:
+        for module_name, class_name in _SECTION_SCENES:
+            scene_cls = getattr(importlib.import_module(module_name), class_name)
+            scene = scene_cls()
+            # Reroute the writer so frames bypass the per-section movie files
+            scene.renderer.file_writer.write_frame = _pipe_frame
+            scene.render()
+    finally:
+        config.write_to_movie = previous_write_to_movie
+        stdin.close()
+        encoder.wait()
+    return output_path
+
+
+_VOICEOVER_ASSET_DIR: Final[Path] = Path("assets/voiceover")
+"""Pre-generated narration WAVs produced by scripts/pregen_voiceover.py."""
+
+
+class FileVoiceoverService(SpeechService):
+    """Speech service backed by pre-generated offline audio files.
+
+    Narration WAVs are synthesized once by scripts/pregen_voiceover.py
+    with a local Piper TTS; this service resolves each narration line to
+    its file via sha256(text) lookup in the generated manifest. Renders
+    make zero TTS network calls and produce identical audio every time.
+    """
+
+    def __init__(
+        self,
+        asset_dir: str | Path = _VOICEOVER_ASSET_DIR,
+        **kwargs: Any,
+    ) -> None:
+        """Load the narration manifest produced by the pre-generation script.
+
+        Args:
+            asset_dir: Directory holding the WAVs and manifest.json
+            **kwargs: Forwarded to SpeechService
+
+        Raises:
+            FileNotFoundError: If the manifest has not been generated yet
+
+        """
+        asset_dir = Path(asset_dir)
+        manifest_path = asset_dir / "manifest.json"
+        if not manifest_path.exists():
+            msg = (
+                f"No voiceover manifest at {manifest_path}; "
+                "run scripts/pregen_voiceover.py first"
+            )
+            raise FileNotFoundError(msg)
+        kwargs.setdefault("cache_dir", str(asset_dir))
+        super().__init__(**kwargs)
+        self._manifest: dict[str, str] = json.loads(manifest_path.read_text())
+
+    def generate_from_text(
+        self,
+        text: str,
+        cache_dir: str | None = None,  # noqa: ARG002
+        path: str | None = None,  # noqa: ARG002
+        **kwargs: Any,  # noqa: ARG002
+    ) -> dict[str, Any]:
+        """Resolve a narration line to its pre-generated WAV.
+
+        Args:
+            text: Narration text to look up
+            cache_dir: Unused; audio is never generated here
+            path: Unused; file names come from the manifest
+            **kwargs: Unused
+
+        Returns:
+            Audio metadata pointing at the pre-generated file
+
+        Raises:
+            KeyError: If the narration line has no pre-generated audio
+
+        """
+        key = hashlib.sha256(text.encode()).hexdigest()
+        if key not in self._manifest:
+            msg = (
+                "Narration text has no pre-generated audio; "
+                "re-run scripts/pregen_voiceover.py"
+            )
+            raise KeyError(msg)
+        return {"input_text": text, "original_audio": self._manifest[key]}
 
 
 class JudgeCurveComplete(VoiceoverScene):
@@ -27,13 +288,15 @@ class JudgeCurveComplete(VoiceoverScene):
 
     def construct(self) -> None:
         """Build the complete video sequence."""
-        # Initialize voiceover service
-        from manim_voiceover.services.gtts import GTTSService
-
-        self.set_speech_service(GTTSService())
+        # Pre-generated offline audio when available (no network TTS);
+        # fall back to the cached gTTS path until the WAVs exist
+        if (_VOICEOVER_ASSET_DIR / "manifest.json").exists():
+            self.set_speech_service(FileVoiceoverService())
+        else:
+            self.set_speech_service(CachedGTTSService())
 
         # Set background color
-        self.camera.background_color = get_background_color()
+        self.camera.background_color = _BACKGROUND_COLOR
 
         # Section 1: Hallucination (25 seconds)
         self._render_section_1()
@@ -51,6 +314,31 @@ class JudgeCurveComplete(VoiceoverScene):
         # Section 5: Synthesis (20 seconds)
         # self._render_section_5()
 
+    @cached_property
+    def _section1(self) -> HallucinationScene:
+        """Section 1 scene instance, constructed once and reused."""
+        return HallucinationScene()
+
+    @cached_property
+    def _section2(self) -> ContinuousScaleScene:
+        """Section 2 scene instance, constructed once and reused."""
+        return ContinuousScaleScene()
+
+    @cached_property
+    def _section3(self) -> LinearRegressionScene:
+        """Section 3 scene instance, constructed once and reused."""
+        return LinearRegressionScene()
+
+    @cached_property
+    def _section4(self) -> NonLinearRegressionScene:
+        """Section 4 scene instance, constructed once and reused."""
+        return NonLinearRegressionScene()
+
+    @cached_property
+    def _section5(self) -> SynthesisScene:
+        """Section 5 scene instance, constructed once and reused."""
+        return SynthesisScene()
+
     def _render_section_1(self) -> None:
         """Render Section 1: Hallucination scene.
 
@@ -58,14 +346,12 @@ class JudgeCurveComplete(VoiceoverScene):
         Establishes AI hallucination metaphor with terminal chaos,
         warning overlay, and static dissolution.
         """
-        from videos.scenes.section1_hallucination import HallucinationScene
-
-        # Render section animations to this scene
-        section = HallucinationScene()
-        section.render_animations(self)
+        # Render section animations to this scene (instance is cached,
+        # so re-entering the composer reuses the built mobject graph)
+        self._section1.render_animations(self)
 
         # Clear for next section
-        self.clear()
+        self._flush_section()
 
     def _render_section_2(self) -> None:
         """Render Section 2: Continuous Scale scene.
@@ -74,12 +360,9 @@ class JudgeCurveComplete(VoiceoverScene):
         Introduces continuous scoring concept with split screen
         and slider visualization.
         """
-        from videos.scenes.section2_scale import ContinuousScaleScene
-
-        section = ContinuousScaleScene()
-        section.render_to(self)
+        self._section2.render_to(self)
 
-        self.clear()
+        self._flush_section()
 
     def _render_section_3(self) -> None:
         """Render Section 3: Linear Regression scene.
@@ -88,12 +371,9 @@ class JudgeCurveComplete(VoiceoverScene):
         Demonstrates linear regression with data points,
         best-fit line, equation, and error visualization.
         """
-        from videos.scenes.section3_linear import LinearRegressionScene
+        self._section3.render_to(self)
 
-        section = LinearRegressionScene()
-        section.render_to(self)
-
-        self.clear()
+        self._flush_section()
 
     def _render_section_4(self) -> None:
         """Render Section 4: Non-Linear Regression scene.
@@ -102,12 +382,9 @@ class JudgeCurveComplete(VoiceoverScene):
         Shows linear model failure on S-curve data,
         then morphs to polynomial curve.
         """
-        from videos.scenes.section4_nonlinear import NonLinearRegressionScene
-
-        section = NonLinearRegressionScene()
-        section.render_to(self)
+        self._section4.render_to(self)
 
-        self.clear()
+        self._flush_section()
 
     def _render_section_5(self) -> None:
         """Render Section 5: Synthesis scene.
@@ -116,13 +393,23 @@ class JudgeCurveComplete(VoiceoverScene):
         Compresses curve to node, expands to neural network,
         displays final "VALUE PREDICTED" message.
         """
-        from videos.scenes.section5_synthesis import SynthesisScene
-
-        section = SynthesisScene()
-        section.render_to(self)
+        self._section5.render_to(self)
 
         # No clear needed - this is the final scene
 
+    def _flush_section(self) -> None:
+        """Clear mobjects and drop cached frame state between sections.
+
+        Keeps the in-memory mobject graph bounded to one section at a
+        time instead of accumulating across the full 120-second
+        composition. Partial-movie files are left alone here:
+        combine_to_movie still needs them at finish(), and
+        config.flush_cache already removes them safely after the
+        combine step.
+        """
+        self.clear()
+        gc.collect()
+
 
 class BaseVideoScene(Scene):
     """Base class for all Judge & Curve video scenes.
@@ -137,7 +424,7 @@ class BaseVideoScene(Scene):
     def construct(self) -> None:
         """Main animation sequence. Must complete within duration."""
         # Set background color
-        self.camera.background_color = get_background_color()
+        self.camera.background_color = _BACKGROUND_COLOR
 
     def get_duration(self) -> float:
         """Return the scene duration in seconds."""
@@ -20,23 +20,27 @@ Duration: 25 seconds (0:00-0:25)
 
 from __future__ import annotations
 
-import random
+from functools import lru_cache
+from pathlib import Path
+from typing import Final
 
+import numpy as np
 from manim import (
     DOWN,
     LEFT,
     RIGHT,
     UP,
-    AddTextLetterByLetter,
     FadeIn,
     FadeOut,
     ManimColor,
     Rectangle,
+    SVGMobject,
     Text,
+    ValueTracker,
     VGroup,
+    config,
 )
 from manim_voiceover import VoiceoverScene
-from manim_voiceover.services.gtts import GTTSService
 
 from src.config import COLORS, SCENE_HALLUCINATION
 from src.utils.color_utils import get_background_color
@@ -45,12 +49,12 @@ from videos.templates.custom_shapes import create_warning_icon
 from videos.templates.effects import (
     apply_chromatic_aberration,
     apply_glow_effect,
-    create_static_noise_overlay,
+    create_static_noise_image,
 )
 
 # Incoherent text fragments representing AI hallucination
 # Style: nonsensical word salad mixing concepts inappropriately
-HALLUCINATION_FRAGMENTS: list[str] = [
+HALLUCINATION_FRAGMENTS: tuple[str, ...] = (
     "The moon is made of blue algorithm potato...",
     "Seventeen clouds whispered to the database...",
     "The answer is definitely purple entropy...",
@@ -66,7 +70,113 @@ HALLUCINATION_FRAGMENTS: list[str] = [
     "Truth equals false equals maybe equals...",
     "Elephants compute faster than yellow...",
     "The output smells like burning certainty...",
-]
+)
+
+_N_FRAGMENTS: Final[int] = len(HALLUCINATION_FRAGMENTS)
+"""Fragment count, resolved once instead of per flood call."""
+
+# ManimColor construction parses and validates the hex string each call;
+# resolve the palette once at import instead of per mobject
+_C_TEXT: Final = ManimColor(COLORS.TEXT)
+_C_GREEN: Final = ManimColor(COLORS.GREEN)
+_C_BROWN: Final = ManimColor(COLORS.BROWN)
+_C_RED: Final = ManimColor(COLORS.RED)
+
+_WARNING_SVG_PATH: Final[Path] = (
+    Path(__file__).resolve().parent.parent / "assets" / "no_metric_found.svg"
+)
+"""Optional pre-rendered 'NO METRIC FOUND' outline, built at design time."""
+
+_PREVIEW_QUALITIES: Final = frozenset({"low_quality", "example_quality"})
+"""Quality settings where layered effects are skipped for faster previews."""
+
+def _compute_line_slices() -> tuple[slice, ...]:
+    """Map each fragment to its character slice in the combined block.
+
+    Text submobjects are the non-whitespace glyphs in order, so each
+    line occupies a contiguous slice that per-line styling can address.
+
+    Returns:
+        One slice per fragment into the combined Text's submobjects.
+
+    """
+    slices: list[slice] = []
+    start = 0
+    for fragment in HALLUCINATION_FRAGMENTS:
+        count = sum(not ch.isspace() for ch in fragment)
+        slices.append(slice(start, start + count))
+        start += count
+    return tuple(slices)
+
+
+_LINE_SLICES: Final[tuple[slice, ...]] = _compute_line_slices()
+
+
+@lru_cache(maxsize=1)
+def _build_warning_overlay() -> VGroup:
+    """Build (once) the 'NO METRIC FOUND' warning overlay prototype.
+
+    The 48pt bold Text is a full font shaping per construction; caching
+    the assembled box/icon/text group means every render - including
+    repeated composition passes - pays only a copy.
+
+    Returns:
+        Cached warning VGroup prototype; copy before mutating.
+
+    """
+    box = Rectangle(
+        width=8,
+        height=2,
+        color=_C_RED,
+        fill_opacity=0.2,
+        stroke_width=3,
+    )
+
+    icon = create_warning_icon(size=0.8, color=COLORS.RED)
+    icon.scale(0.8)
+    icon.next_to(box, LEFT, buff=0.3)
+    icon.shift(RIGHT * 1.5)
+
+    # A checked-in SVG of the fixed string skips the bold font-variant
+    # shaping entirely; fall back to live Text shaping when absent
+    if _WARNING_SVG_PATH.exists():
+        text: SVGMobject | Text = SVGMobject(str(_WARNING_SVG_PATH))
+        text.set_color(_C_RED)
+        text.scale_to_fit_width(6)
+    else:
+        text = Text(
+            "NO METRIC FOUND",
+            font_size=48,
+            color=_C_RED,
+            weight="BOLD",
+        )
+    text.move_to(box.get_center())
+    text.shift(RIGHT * 0.5)
+
+    warning = VGroup(box, icon, text)
+    warning.move_to(DOWN * 0.5)
+    return warning
+
+
+@lru_cache(maxsize=1)
+def _build_flood_block() -> Text:
+    """Build (once) the combined flood text block.
+
+    All 15 fragments live in a single Text mobject, so the Courier
+    shaping runs once for the whole flood and the scene graph carries
+    one entry instead of 15. Callers take a ``.copy()`` before styling.
+
+    Returns:
+        Cached Text prototype; copy before mutating.
+
+    """
+    return Text(
+        "\n".join(HALLUCINATION_FRAGMENTS),
+        font="Courier",
+        font_size=20,
+        line_spacing=0.45,
+        color=_C_TEXT,
+    )
 
 
 class HallucinationScene(VoiceoverScene):
@@ -88,6 +198,10 @@ class HallucinationScene(VoiceoverScene):
     START_TIME: float = SCENE_HALLUCINATION.start_time
     END_TIME: float = SCENE_HALLUCINATION.end_time
 
+    # Cursor prototype built on first use and copied per render (the
+    # warning overlay and flood block are cached at module level)
+    _cursor_proto: VGroup | None = None
+
     # Voiceover script for this section
     VOICEOVER_TEXT: str = (
         "Intelligence without a target is just noise. "
@@ -99,6 +213,11 @@ class HallucinationScene(VoiceoverScene):
 
     def construct(self) -> None:
         """Build the hallucination scene animation sequence."""
+        # Standalone renders are the only path that needs the gTTS
+        # client; composed renders use the parent scene's service, so
+        # the network-capable import is deferred to this method
+        from manim_voiceover.services.gtts import GTTSService
+
         self.set_speech_service(GTTSService())
         self.camera.background_color = get_background_color()
 
@@ -139,26 +258,38 @@ class HallucinationScene(VoiceoverScene):
         warning_duration = total_duration * 0.2
         static_duration = total_duration * 0.4
 
-        # Phase 1: Black screen with blinking terminal cursor
-        cursor = self.create_terminal_cursor()
-        scene.play(FadeIn(cursor), run_time=0.5)
-
-        # Animate cursor blinking
-        blink_time = (cursor_duration - 0.5) / 8
-        for _ in range(4):
-            scene.play(cursor.animate.set_opacity(0.3), run_time=blink_time)
-            scene.play(cursor.animate.set_opacity(1.0), run_time=blink_time)
+        # Grown incrementally as each phase lands, so the dissolution
+        # takes it as-is instead of re-parenting everything at the end
+        all_content = VGroup()
+
+        # Phase 1: Black screen with blinking terminal cursor. Prototypes
+        # are built once per section instance and copied per render, so
+        # re-composing the section skips the shaping and effect layering
+        if self._cursor_proto is None:
+            self._cursor_proto = self.create_terminal_cursor()
+        cursor = self._cursor_proto.copy()
+
+        if cursor_duration < 1.0:
+            # Time-compressed runs (short voiceover, montage reuse) leave
+            # no readable blink; show the cursor statically instead of
+            # paying the fade and blink machinery for sub-second jitter
+            scene.add(cursor)
+            scene.wait(cursor_duration)
+        else:
+            scene.play(FadeIn(cursor), run_time=0.5)
+            self._blink_cursor(scene, cursor, cursor_duration)
+        all_content.add(cursor)
 
         # Phase 2: Rapid incoherent text flood
-        text_group = self._flood_incoherent_text_in_scene(scene, flood_duration)
+        all_content.add(self._flood_incoherent_text_in_scene(scene, flood_duration))
 
-        # Phase 3: Warning overlay
+        # Phase 3: Warning overlay (module-cached prototype, copied)
         warning = self.create_warning_overlay()
         scene.play(create_bounce_animation(warning, duration=0.5))
         scene.wait(warning_duration - 0.5)
+        all_content.add(warning)
 
         # Phase 4: Static dissolution
-        all_content = VGroup(cursor, text_group, warning)
         self._apply_static_dissolution_in_scene(scene, all_content, static_duration)
 
     def _run_visual_sequence(self, total_duration: float) -> None:
@@ -168,95 +299,45 @@ class HallucinationScene(VoiceoverScene):
             total_duration: Total duration from voiceover tracker.
 
         """
-        # Calculate phase durations based on total voiceover length
-        # Phases: cursor (20%), text flood (20%), warning (20%), static (40%)
-        cursor_duration = total_duration * 0.2
-        flood_duration = total_duration * 0.2
-        warning_duration = total_duration * 0.2
-        static_duration = total_duration * 0.4
+        # One implementation serves both standalone and composed renders;
+        # the scene receiver is just this scene when running standalone
+        self._run_visual_sequence_in_scene(self, total_duration)
 
-        # Phase 1: Black screen with blinking terminal cursor
-        cursor = self.create_terminal_cursor()
-        self.play(FadeIn(cursor), run_time=0.5)
+    def _blink_cursor(
+        self,
+        scene: VoiceoverScene,
+        cursor: VGroup,
+        cursor_duration: float,
+    ) -> None:
+        """Blink the cursor with a per-frame opacity updater.
 
-        # Animate cursor blinking
-        blink_time = (cursor_duration - 0.5) / 8  # 4 cycles, 2 animations each
-        for _ in range(4):
-            self.play(cursor.animate.set_opacity(0.3), run_time=blink_time)
-            self.play(cursor.animate.set_opacity(1.0), run_time=blink_time)
+        One square-wave updater over a single wait replaces the eight
+        play calls (each a full animation build plus scheduler pass) the
+        blink loop used to issue, with the same 4-cycle cadence.
 
-        # Phase 2: Rapid incoherent text flood
-        text_group = self._flood_incoherent_text_timed(flood_duration)
+        Args:
+            scene: The scene whose clock drives the blinking.
+            cursor: The cursor group to blink.
+            cursor_duration: Total cursor phase duration including fade-in.
 
-        # Phase 3: Warning overlay "NO METRIC FOUND"
-        warning = self.create_warning_overlay()
-        self.play(create_bounce_animation(warning, duration=0.5))
-        self.wait(warning_duration - 0.5)
+        """
+        blink_time = (cursor_duration - 0.5) / 8
+        start_time = scene.renderer.time
 
-        # Phase 4: Text blurs into static noise
-        all_content = VGroup(cursor, text_group, warning)
-        self._apply_static_dissolution_timed(all_content, static_duration)
+        def _blink(mobject: VGroup, _dt: float) -> None:
+            elapsed = scene.renderer.time - start_time
+            # Dim on even half-cycles, matching the old dim-first loop
+            mobject.set_opacity(0.3 if int(elapsed / blink_time) % 2 == 0 else 1.0)
+
+        cursor.add_updater(_blink)
+        scene.wait(cursor_duration - 0.5)
+        cursor.clear_updaters()
+        cursor.set_opacity(1.0)
 
     # Color variation thresholds for text
     _GREEN_COLOR_THRESHOLD: float = 0.7
     _WARNING_COLOR_THRESHOLD: float = 0.5
 
-    def _flood_incoherent_text_timed(self, duration: float) -> VGroup:
-        """Flood the screen with rapid incoherent text.
-
-        Creates the visual effect of AI hallucination - text appearing
-        rapidly across the screen in an overwhelming, chaotic manner.
-
-        Args:
-            duration: Total duration for the text flood phase.
-
-        Returns:
-            VGroup containing all the text mobjects for later reference.
-
-        """
-        text_group = VGroup()
-        # Deterministic randomness for reproducibility (not for crypto)
-        rng = random.Random(42)  # noqa: S311
-
-        # Create text lines at various positions
-        for i, fragment in enumerate(HALLUCINATION_FRAGMENTS):
-            # Vary position across the screen
-            x_offset = rng.uniform(-5.5, 3.5)
-            y_offset = 3.0 - (i * 0.45)
-
-            text = Text(
-                fragment,
-                font="Courier",
-                font_size=20,
-                color=ManimColor(COLORS.TEXT),
-            )
-            text.move_to(LEFT * (-x_offset) + UP * y_offset)
-
-            # Add slight color variation for some lines
-            if rng.random() > self._GREEN_COLOR_THRESHOLD:
-                text.set_color(ManimColor(COLORS.GREEN))
-            elif rng.random() > self._WARNING_COLOR_THRESHOLD:
-                text.set_color(ManimColor(COLORS.WARNING))
-
-            text_group.add(text)
-
-        # Calculate timing based on duration
-        num_lines = len(text_group)
-        time_per_line = duration / num_lines
-
-        # Rapid-fire text appearance (flooding effect)
-        for i, text in enumerate(text_group):
-            # Use AddTextLetterByLetter for rapid typing effect
-            self.play(
-                AddTextLetterByLetter(text, time_per_char=0.015),
-                run_time=time_per_line * 0.8,
-            )
-            # Brief pause between lines
-            if i < num_lines - 1:
-                self.wait(time_per_line * 0.2)
-
-        return text_group
-
     def create_terminal_cursor(self) -> VGroup:
         """Create blinking green cursor with chromatic aberration.
 
@@ -268,12 +349,17 @@ class HallucinationScene(VoiceoverScene):
         cursor = Rectangle(
             width=0.15,
             height=0.4,
-            color=ManimColor(COLORS.GREEN),
+            color=_C_GREEN,
             fill_opacity=1.0,
             stroke_width=0,
         )
         cursor.move_to(LEFT * 5 + UP * 3)
 
+        # Aberration + glow multiply the mobject count for the cursor's
+        # whole blinking lifetime and are invisible at preview resolution
+        if config.quality in _PREVIEW_QUALITIES:
+            return VGroup(cursor)
+
         # Apply chromatic aberration effect
         cursor_with_effect = apply_chromatic_aberration(cursor, offset=0.03)
 
@@ -283,39 +369,15 @@ class HallucinationScene(VoiceoverScene):
     def create_warning_overlay(self) -> VGroup:
         """Create red warning box with 'NO METRIC FOUND' text.
 
+        The overlay is fixed content, so the prototype is built once at
+        module level and each call hands back a points-only copy instead
+        of re-shaping the 48pt bold text.
+
         Returns:
             VGroup containing the warning box, icon, and text.
 
         """
-        # Create warning box
-        box = Rectangle(
-            width=8,
-            height=2,
-            color=ManimColor(COLORS.RED),
-            fill_opacity=0.2,
-            stroke_width=3,
-        )
-
-        # Create warning icon
-        icon = self.create_warning_icon()
-        icon.scale(0.8)
-        icon.next_to(box, LEFT, buff=0.3)
-        icon.shift(RIGHT * 1.5)
-
-        # Create warning text
-        text = Text(
-            "NO METRIC FOUND",
-            font_size=48,
-            color=ManimColor(COLORS.RED),
-            weight="BOLD",
-        )
-        text.move_to(box.get_center())
-        text.shift(RIGHT * 0.5)
-
-        warning = VGroup(box, icon, text)
-        warning.move_to(DOWN * 0.5)
-
-        return warning
+        return _build_warning_overlay().copy()
 
     def create_warning_icon(self) -> VGroup:
         """Create programmatic warning triangle icon.
@@ -326,42 +388,6 @@ class HallucinationScene(VoiceoverScene):
         """
         return create_warning_icon(size=0.8, color=COLORS.RED)
 
-    def _apply_static_dissolution_timed(
-        self,
-        target: VGroup,
-        duration: float,
-    ) -> None:
-        """Transition target to static noise - text blurs into static.
-
-        Args:
-            target: The mobject group to dissolve into static.
-            duration: Total duration for the dissolution phase.
-
-        """
-        # Create static noise overlay
-        noise = create_static_noise_overlay(density=500)
-        noise.set_opacity(0)
-
-        self.add(noise)
-
-        # Allocate time: 40% blur, 30% hold, 30% fade out
-        blur_time = duration * 0.4
-        hold_time = duration * 0.3
-        fade_time = duration * 0.3
-
-        # Text blurs into static - gradual transition
-        self.play(
-            FadeOut(target),
-            noise.animate.set_opacity(0.8),
-            run_time=blur_time,
-        )
-
-        # Hold on static noise
-        self.wait(hold_time)
-
-        # Fade out static to black
-        self.play(FadeOut(noise), run_time=fade_time)
-
     def get_duration(self) -> float:
         """Return scene duration."""
         return self.END_TIME - self.START_TIME
@@ -370,7 +396,7 @@ class HallucinationScene(VoiceoverScene):
         self,
         scene: VoiceoverScene,
         duration: float,
-    ) -> VGroup:
+    ) -> Text:
         """Flood screen with text in a specific scene (for composition).
 
         Args:
@@ -378,47 +404,40 @@ class HallucinationScene(VoiceoverScene):
             duration: Total duration for the text flood phase.
 
         Returns:
-            VGroup containing all the text mobjects.
+            Text block containing all the flood lines.
 
         """
-        text_group = VGroup()
-        rng = random.Random(42)  # noqa: S311
-
-        # Create text lines
-        for i, fragment in enumerate(HALLUCINATION_FRAGMENTS):
-            x_offset = rng.uniform(-5.5, 3.5)
-            y_offset = 3.0 - (i * 0.45)
-
-            text = Text(
-                fragment,
-                font="Courier",
-                font_size=20,
-                color=ManimColor(COLORS.TEXT),
-            )
-            text.move_to(LEFT * (-x_offset) + UP * y_offset)
-
-            # Add color variation
-            if rng.random() > self._GREEN_COLOR_THRESHOLD:
-                text.set_color(ManimColor(COLORS.GREEN))
-            elif rng.random() > self._WARNING_COLOR_THRESHOLD:
-                text.set_color(ManimColor(COLORS.BROWN))
-
-            text_group.add(text)
-
-        # Calculate timing
-        num_lines = len(text_group)
-        time_per_line = duration / num_lines
-
-        # Rapid-fire text appearance
-        for i, text in enumerate(text_group):
-            scene.play(
-                AddTextLetterByLetter(text, time_per_char=0.015),
-                run_time=time_per_line * 0.8,
-            )
-            if i < num_lines - 1:
-                scene.wait(time_per_line * 0.2)
-
-        return text_group
+        # Deterministic randomness; two vectorized draws replace the
+        # 45 per-fragment Python-level rng calls
+        rng = np.random.default_rng(42)
+        x_offsets = rng.uniform(-5.5, 3.5, size=_N_FRAGMENTS)
+        color_rolls = rng.random((_N_FRAGMENTS, 2))
+
+        # All 15 positions in one (N, 3) array: move_to takes an indexed
+        # row instead of building LEFT/UP vector temporaries per line
+        positions = np.zeros((_N_FRAGMENTS, 3))
+        positions[:, 0] = x_offsets
+        positions[:, 1] = 3.0 - np.arange(_N_FRAGMENTS) * 0.45
+
+        # One Text block instead of 15 separate mobjects: the Courier
+        # shaping ran once at prototype build and the scene graph carries
+        # a single entry. Per-line styling addresses character slices.
+        block = _build_flood_block().copy()
+        for i in range(_N_FRAGMENTS):
+            line = block[_LINE_SLICES[i]]
+            line.move_to(positions[i])
+
+            # Color variation
+            if color_rolls[i, 0] > self._GREEN_COLOR_THRESHOLD:
+                line.set_color(_C_GREEN)
+            elif color_rolls[i, 1] > self._WARNING_COLOR_THRESHOLD:
+                line.set_color(_C_BROWN)
+
+        # Rapid-fire appearance: one animation whose glyph-level lag
+        # reproduces the line-by-line flood cadence
+        scene.play(FadeIn(block, lag_ratio=0.02), run_time=duration)
+
+        return block
 
     def _apply_static_dissolution_in_scene(
         self,
@@ -434,7 +453,9 @@ class HallucinationScene(VoiceoverScene):
             duration: Total duration for the dissolution phase.
 
         """
-        noise = create_static_noise_overlay(density=500)
+        # One pre-rendered texture instead of 500 dot mobjects: the
+        # renderer blits a single image per frame during blur/hold/fade
+        noise = create_static_noise_image()
         noise.set_opacity(0)
         scene.add(noise)
 
@@ -442,10 +463,18 @@ class HallucinationScene(VoiceoverScene):
         hold_time = duration * 0.3
         fade_time = duration * 0.3
 
-        scene.play(
-            FadeOut(target),
-            noise.animate.set_opacity(0.8),
-            run_time=blur_time,
-        )
+        # One tracker drives both cross-fade opacities, so the blur phase
+        # builds a single animation instead of a FadeOut plus an animate.
+        # The group must be in the scene for its updater to run; add()
+        # restructures the family so its members are not double-drawn
+        scene.add(target)
+        alpha = ValueTracker(0.0)
+        target.add_updater(lambda m: m.set_opacity(1.0 - alpha.get_value()))
+        noise.add_updater(lambda m: m.set_opacity(0.8 * alpha.get_value()))
+        scene.play(alpha.animate.set_value(1.0), run_time=blur_time)
+        target.clear_updaters()
+        noise.clear_updaters()
+        scene.remove(target)
+
         scene.wait(hold_time)
         scene.play(FadeOut(noise), run_time=fade_time)
@@ -23,6 +23,8 @@ Duration: 25 seconds (0:25-0:50)
 
 from __future__ import annotations
 
+from typing import ClassVar, Final
+
 from manim import (
     DOWN,
     LEFT,
@@ -37,14 +39,24 @@ from manim import (
     Rectangle,
     RoundedRectangle,
     Text,
+    Transform,
     VGroup,
     Write,
 )
 from manim_voiceover import VoiceoverScene
-from manim_voiceover.services.gtts import GTTSService
 
 from src.config import COLORS, SCENE_CONTINUOUS_SCALE
 from src.utils.color_utils import get_background_color
+from videos.scenes.voiceover_service import CachedGTTSService
+from videos.templates.mobject_cache import freeze
+
+# ManimColor construction parses and validates the hex string each call;
+# resolve the palette once at import instead of per mobject
+_C_RED: Final = ManimColor(COLORS.RED)
+_C_GREEN: Final = ManimColor(COLORS.GREEN)
+_C_CYAN: Final = ManimColor(COLORS.CYAN)
+_C_TEXT: Final = ManimColor(COLORS.TEXT)
+_C_GRID: Final = ManimColor(COLORS.GRID)
 
 
 class ContinuousScaleScene(VoiceoverScene):
@@ -74,6 +86,16 @@ class ContinuousScaleScene(VoiceoverScene):
     LEFT_SCORE: float = 0.99
     RIGHT_SCORE: float = -0.50
 
+    # Slider prototype built on first render and copied thereafter; it
+    # carries no scene state, and a copy skips the font-face lookups and
+    # layout passes of rebuilding nine mobjects per render
+    _slider_template: VGroup | None = None
+
+    # Score-display glyph sets keyed by formatted value; only a handful
+    # of distinct scores are ever shown, so each string is tessellated
+    # once per process and copied per animation
+    _score_glyph_cache: ClassVar[dict[str, DecimalNumber]] = {}
+
     # Voiceover script for this section
     VOICEOVER_TEXT: str = (
         "This 'Judge' (a Reward Model) doesn't just say 'Wrong.' "
@@ -85,7 +107,9 @@ class ContinuousScaleScene(VoiceoverScene):
 
     def construct(self) -> None:
         """Build the continuous scale scene animation sequence."""
-        self.set_speech_service(GTTSService())
+        # Content-keyed cache: unchanged narration never re-hits the
+        # gTTS network path on iterative renders
+        self.set_speech_service(CachedGTTSService())
         self.camera.background_color = get_background_color()
 
         # Start voiceover that plays throughout the scene
@@ -120,14 +144,12 @@ class ContinuousScaleScene(VoiceoverScene):
         scoring_duration = total_duration * 0.40
         conclusion_duration = total_duration * 0.20
 
-        # Phase 1: Split screen
+        # Phase 1: Split screen - one FadeIn over the grouped intro
+        # runs a single interpolation pass instead of three animation
+        # objects marching in lockstep
         left_pane, right_pane, divider = self._create_split_screen()
-        scene.play(
-            FadeIn(left_pane),
-            FadeIn(right_pane),
-            FadeIn(divider),
-            run_time=split_duration * 0.4,
-        )
+        intro = VGroup(left_pane, right_pane, divider)
+        scene.play(FadeIn(intro), run_time=split_duration * 0.4)
         scene.wait(split_duration * 0.6)
 
         # Phase 2: Reward score slider
@@ -144,6 +166,9 @@ class ContinuousScaleScene(VoiceoverScene):
         )
         scene.wait(scoring_duration * 0.05)
 
+        # Undo the highlight as an instant state change; the right
+        # pane's highlight is carried away by the final fade-out
+        left_pane[0].set_stroke(width=2)
         self._animate_score_in_scene(
             scene,
             slider_group,
@@ -156,11 +181,18 @@ class ContinuousScaleScene(VoiceoverScene):
         # Phase 4: Conclusion text
         conclusion = self._create_conclusion_text()
         scene.play(Write(conclusion), run_time=conclusion_duration * 0.6)
+
+        # Everything on screen is static for the final hold; swap the
+        # ensemble for one rasterized snapshot so the wait frames blit a
+        # texture instead of re-filling text and slider vector paths
+        all_content = VGroup(left_pane, right_pane, divider, slider_group, conclusion)
+        frozen = freeze(all_content)
+        scene.remove(*all_content)
+        scene.add(frozen)
         scene.wait(conclusion_duration * 0.4)
 
         # Fade out
-        all_content = VGroup(left_pane, right_pane, divider, slider_group, conclusion)
-        scene.play(FadeOut(all_content), run_time=0.5)
+        scene.play(FadeOut(frozen), run_time=0.5)
 
     def _run_visual_sequence(self, total_duration: float) -> None:
         """Run the visual animation sequence synchronized to voiceover.
@@ -169,54 +201,9 @@ class ContinuousScaleScene(VoiceoverScene):
             total_duration: Total duration from voiceover tracker.
 
         """
-        # Calculate phase durations based on total voiceover length
-        # Phases: split screen (20%), slider appear (20%), scoring (40%), conclusion (20%)
-        split_duration = total_duration * 0.20
-        slider_duration = total_duration * 0.20
-        scoring_duration = total_duration * 0.40
-        conclusion_duration = total_duration * 0.20
-
-        # Phase 1: Split screen with two statements (0:25-0:30)
-        left_pane, right_pane, divider = self._create_split_screen()
-        self.play(
-            FadeIn(left_pane),
-            FadeIn(right_pane),
-            FadeIn(divider),
-            run_time=split_duration * 0.4,
-        )
-        self.wait(split_duration * 0.6)
-
-        # Phase 2: Reward score slider appears (0:30-0:35)
-        slider_group = self._create_reward_slider()
-        self.play(Create(slider_group), run_time=slider_duration)
-
-        # Phase 3: Animate scores (0:35-0:45)
-        # First show score for left statement (0.99)
-        self._animate_score(
-            slider_group,
-            self.LEFT_SCORE,
-            left_pane,
-            duration=scoring_duration * 0.45,
-        )
-        self.wait(scoring_duration * 0.05)
-
-        # Then show score for right statement (-0.50)
-        self._animate_score(
-            slider_group,
-            self.RIGHT_SCORE,
-            right_pane,
-            duration=scoring_duration * 0.45,
-        )
-        self.wait(scoring_duration * 0.05)
-
-        # Phase 4: Show conclusion text (0:45-0:50)
-        conclusion = self._create_conclusion_text()
-        self.play(Write(conclusion), run_time=conclusion_duration * 0.6)
-        self.wait(conclusion_duration * 0.4)
-
-        # Fade out everything
-        all_content = VGroup(left_pane, right_pane, divider, slider_group, conclusion)
-        self.play(FadeOut(all_content), run_time=0.5)
+        # One implementation serves both standalone and composed renders;
+        # the scene receiver is just this scene when running standalone
+        self._run_visual_sequence_in_scene(self, total_duration)
 
     def _create_split_screen(self) -> tuple[VGroup, VGroup, Line]:
         """Create split screen with two statement cards.
@@ -229,7 +216,7 @@ class ContinuousScaleScene(VoiceoverScene):
         divider = Line(
             start=UP * 2.5,
             end=DOWN * 1.5,
-            color=ManimColor(COLORS.GRID),
+            color=_C_GRID,
             stroke_width=3,
         )
 
@@ -237,14 +224,14 @@ class ContinuousScaleScene(VoiceoverScene):
         left_card = self._create_statement_card(
             self.LEFT_STATEMENT,
             position=LEFT * 3.5,
-            border_color=COLORS.GREEN,
+            border_color=_C_GREEN,
         )
 
         # Create right pane - bad answer
         right_card = self._create_statement_card(
             self.RIGHT_STATEMENT,
             position=RIGHT * 3.5,
-            border_color=COLORS.RED,
+            border_color=_C_RED,
         )
 
         return left_card, right_card, divider
@@ -253,7 +240,7 @@ class ContinuousScaleScene(VoiceoverScene):
         self,
         statement: str,
         position: tuple[float, float, float],
-        border_color: str,
+        border_color: ManimColor,
     ) -> VGroup:
         """Create a card containing a statement.
 
@@ -271,7 +258,7 @@ class ContinuousScaleScene(VoiceoverScene):
             width=5.5,
             height=2.0,
             corner_radius=0.2,
-            color=ManimColor(border_color),
+            color=border_color,
             fill_opacity=0.1,
             stroke_width=2,
         )
@@ -281,16 +268,29 @@ class ContinuousScaleScene(VoiceoverScene):
         text = Text(
             statement,
             font_size=28,
-            color=ManimColor(COLORS.TEXT),
+            color=_C_TEXT,
         )
         text.move_to(position)
 
         return VGroup(card, text)
 
     def _create_reward_slider(self) -> VGroup:
-        """Create horizontal reward score slider gauge.
+        """Return a fresh copy of the reward slider gauge.
 
-        NOT a binary switch - a smooth continuous slider.
+        NOT a binary switch - a smooth continuous slider. The slider is
+        built once per process and copied per render.
+
+        Returns:
+            VGroup containing the complete slider component.
+
+        """
+        cls = type(self)
+        if cls._slider_template is None:
+            cls._slider_template = self._build_reward_slider()
+        return cls._slider_template.copy()
+
+    def _build_reward_slider(self) -> VGroup:
+        """Build the reward slider template from scratch.
 
         Returns:
             VGroup containing the complete slider component.
@@ -303,7 +303,7 @@ class ContinuousScaleScene(VoiceoverScene):
         track = Rectangle(
             width=10.0,
             height=0.3,
-            color=ManimColor(COLORS.GRID),
+            color=_C_GRID,
             fill_opacity=0.3,
             stroke_width=2,
         )
@@ -314,7 +314,7 @@ class ContinuousScaleScene(VoiceoverScene):
         left_gradient = Rectangle(
             width=5.0,
             height=0.25,
-            color=ManimColor(COLORS.RED),
+            color=_C_RED,
             fill_opacity=0.4,
             stroke_width=0,
         )
@@ -324,7 +324,7 @@ class ContinuousScaleScene(VoiceoverScene):
         right_gradient = Rectangle(
             width=5.0,
             height=0.25,
-            color=ManimColor(COLORS.GREEN),
+            color=_C_GREEN,
             fill_opacity=0.4,
             stroke_width=0,
         )
@@ -334,7 +334,7 @@ class ContinuousScaleScene(VoiceoverScene):
         handle = Rectangle(
             width=0.15,
             height=0.6,
-            color=ManimColor(COLORS.CYAN),
+            color=_C_CYAN,
             fill_opacity=1.0,
             stroke_width=2,
         )
@@ -344,20 +344,20 @@ class ContinuousScaleScene(VoiceoverScene):
         title_label = Text(
             "REWARD SCORE",
             font_size=24,
-            color=ManimColor(COLORS.TEXT),
+            color=_C_TEXT,
             weight="BOLD",
         )
         title_label.next_to(track, UP, buff=0.4)
 
         # Min/max labels
-        min_label = Text("-1.0", font_size=20, color=ManimColor(COLORS.RED))
+        min_label = Text("-1.0", font_size=20, color=_C_RED)
         min_label.next_to(track, LEFT, buff=0.3)
 
-        max_label = Text("+1.0", font_size=20, color=ManimColor(COLORS.GREEN))
+        max_label = Text("+1.0", font_size=20, color=_C_GREEN)
         max_label.next_to(track, RIGHT, buff=0.3)
 
         # Center label
-        zero_label = Text("0", font_size=18, color=ManimColor(COLORS.GRID))
+        zero_label = Text("0", font_size=18, color=_C_GRID)
         zero_label.next_to(track, DOWN, buff=0.2)
 
         # Score display (will be updated during animation)
@@ -365,7 +365,7 @@ class ContinuousScaleScene(VoiceoverScene):
             0.0,
             num_decimal_places=2,
             font_size=36,
-            color=ManimColor(COLORS.CYAN),
+            color=_C_CYAN,
             include_sign=True,
         )
         score_display.next_to(handle, UP, buff=0.3)
@@ -398,37 +398,12 @@ class ContinuousScaleScene(VoiceoverScene):
             duration: Animation duration.
 
         """
-        track = slider_group[0]
-        handle = slider_group[3]
-        score_display = slider_group[8]
-
-        # Calculate target x position (-1.0 = left edge, +1.0 = right edge)
-        track_left = track.get_left()[0]
-        track_right = track.get_right()[0]
-        track_center_y = track.get_center()[1]
-
-        # Map score (-1 to 1) to position
-        normalized = (target_score + 1.0) / 2.0  # 0 to 1
-        target_x = track_left + (track_right - track_left) * normalized
-
-        # Determine color based on score
-        score_color = ManimColor(COLORS.GREEN) if target_score >= 0 else ManimColor(COLORS.RED)
-
-        # Animate handle movement and score update
-        self.play(
-            handle.animate.move_to([target_x, track_center_y, 0]),
-            score_display.animate.set_value(target_score).move_to(
-                [target_x, track_center_y + 0.5, 0],
-            ),
-            score_display.animate.set_color(score_color),
-            highlight_pane[0].animate.set_stroke(width=4),
-            run_time=duration,
-        )
-
-        # Reset highlight
-        self.play(
-            highlight_pane[0].animate.set_stroke(width=2),
-            run_time=0.2,
+        self._animate_score_in_scene(
+            self,
+            slider_group,
+            target_score,
+            highlight_pane,
+            duration,
         )
 
     def _animate_score_in_scene(
@@ -463,24 +438,44 @@ class ContinuousScaleScene(VoiceoverScene):
         target_x = track_left + (track_right - track_left) * normalized
 
         # Determine color based on score
-        score_color = ManimColor(COLORS.GREEN) if target_score >= 0 else ManimColor(COLORS.RED)
+        score_color = _C_GREEN if target_score >= 0 else _C_RED
+
+        # Animate handle movement and score update. One Transform
+        # carries value, position, and color together; the target's
+        # glyphs come from the per-process cache, so set_value only
+        # re-tessellates the first time each score string appears
+        display_target = self._score_display_target(target_score)
+        display_target.move_to([target_x, track_center_y + 0.5, 0])
+        display_target.set_color(score_color)
 
-        # Animate handle movement and score update
         scene.play(
             handle.animate.move_to([target_x, track_center_y, 0]),
-            score_display.animate.set_value(target_score).move_to(
-                [target_x, track_center_y + 0.5, 0],
-            ),
-            score_display.animate.set_color(score_color),
+            Transform(score_display, display_target),
             highlight_pane[0].animate.set_stroke(width=4),
             run_time=duration,
         )
 
-        # Reset highlight
-        scene.play(
-            highlight_pane[0].animate.set_stroke(width=2),
-            run_time=0.2,
-        )
+    def _score_display_target(self, target_score: float) -> DecimalNumber:
+        """Return a copy of the tessellated display for a score value.
+
+        Args:
+            target_score: Score value to display.
+
+        Returns:
+            DecimalNumber copy ready to position and recolor.
+
+        """
+        key = f"{target_score:+.2f}"
+        cache = type(self)._score_glyph_cache
+        if key not in cache:
+            cache[key] = DecimalNumber(
+                target_score,
+                num_decimal_places=2,
+                font_size=36,
+                color=_C_CYAN,
+                include_sign=True,
+            )
+        return cache[key].copy()
 
     def _create_conclusion_text(self) -> Text:
         """Create the conclusion text about regression.
@@ -492,7 +487,7 @@ class ContinuousScaleScene(VoiceoverScene):
         conclusion = Text(
             "REGRESSION: PREDICTING A QUANTITY",
             font_size=36,
-            color=ManimColor(COLORS.CYAN),
+            color=_C_CYAN,
             weight="BOLD",
         )
         conclusion.to_edge(DOWN, buff=0.5)
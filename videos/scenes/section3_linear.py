@@ -21,11 +21,17 @@ Duration: 25 seconds (0:50-1:15)
 
 from __future__ import annotations
 
+import hashlib
+import json
+from functools import cache, lru_cache
 from pathlib import Path
+from typing import Final
 
+import numpy as np
 from manim import (
     DOWN,
     LEFT,
+    PI,
     RIGHT,
     Axes,
     Create,
@@ -35,22 +41,191 @@ from manim import (
     Line,
     ManimColor,
     Text,
+    UpdateFromAlphaFunc,
     VGroup,
+    VMobject,
     Write,
 )
 from manim_voiceover import VoiceoverScene
-from manim_voiceover.services.gtts import GTTSService
 
 from src.config import COLORS, SCENE_LINEAR_REGRESSION
 from src.utils.color_utils import get_background_color
 from src.utils.data_generator import (
     DataPoint,
     RegressionLine,
-    create_error_bars,
     fit_linear_regression,
     generate_linear_data,
     load_data_from_csv,
 )
+from videos.scenes.voiceover_service import CachedGTTSService
+from videos.templates.coords import Affine, batch_c2p, c2p_affine
+
+# ManimColor construction parses and validates the hex string each call;
+# resolve the palette once at import instead of per dot and error bar
+_C_RED: Final = ManimColor(COLORS.RED)
+_C_CYAN: Final = ManimColor(COLORS.CYAN)
+_C_TEXT: Final = ManimColor(COLORS.TEXT)
+_C_GRID: Final = ManimColor(COLORS.GRID)
+
+
+@lru_cache(maxsize=4)
+def _load_data_points_cached(
+    csv_path: str,
+    _mtime: float,
+    _size: int,
+) -> tuple[DataPoint, ...]:
+    """Parse the CSV once per (path, mtime, size) stamp.
+
+    Re-renders in the same process reuse the parsed points; the stat
+    stamp in the key invalidates the entry whenever the file changes.
+
+    Args:
+        csv_path: Path to the CSV file
+        _mtime: File modification time (cache-key component only)
+        _size: File size in bytes (cache-key component only)
+
+    Returns:
+        Parsed data points as an immutable tuple
+
+    """
+    return tuple(load_data_from_csv(csv_path))
+
+
+def _fit_regression_cached(
+    points: list[DataPoint],
+    csv_path: Path,
+) -> RegressionLine:
+    """Fit OLS once per CSV content, reusing a hash-stamped sidecar.
+
+    The coefficients are deterministic given the data, so they are
+    stored next to the CSV stamped with its sha256; matching stamps
+    reconstruct the RegressionLine without touching the solver.
+
+    Args:
+        points: Data points loaded from the CSV
+        csv_path: The CSV the points came from
+
+    Returns:
+        Fitted (or reconstructed) linear regression model
+
+    """
+    digest = hashlib.sha256(csv_path.read_bytes()).hexdigest()
+    sidecar = csv_path.with_suffix(".regression.json")
+    if sidecar.exists():
+        cached = json.loads(sidecar.read_text())
+        if cached.get("sha256") == digest:
+            return RegressionLine(
+                line_type="linear",
+                coefficients=tuple(cached["coefficients"]),
+            )
+
+    regression = fit_linear_regression(points)
+    tmp = sidecar.with_suffix(".json.tmp")
+    tmp.write_text(
+        json.dumps({"sha256": digest, "coefficients": list(regression.coefficients)}),
+    )
+    tmp.replace(sidecar)
+    return regression
+
+
+@lru_cache(maxsize=2)
+def _build_cartesian_grid(x_label: str, y_label: str) -> Axes:
+    """Build the labelled grid template once per label pair.
+
+    Axes construction lays out tick numbers and two Text labels; the
+    result depends only on the label strings, so repeat renders copy
+    the cached template instead of rebuilding it.
+
+    Args:
+        x_label: Label for x-axis
+        y_label: Label for y-axis
+
+    Returns:
+        Axes mobject with labels, centered on the frame
+
+    """
+    axes = Axes(
+        x_range=[0, 11, 1],
+        y_range=[0, 14, 2],
+        x_length=10,
+        y_length=6,
+        axis_config={
+            "color": _C_GRID,
+            "include_tip": True,
+            "tip_length": 0.2,
+        },
+        x_axis_config={"numbers_to_include": [2, 4, 6, 8, 10]},
+        y_axis_config={"numbers_to_include": [2, 4, 6, 8, 10, 12]},
+    )
+
+    # Add axis labels
+    x_label_text = Text(x_label, font_size=24, color=_C_TEXT)
+    x_label_text.next_to(axes.x_axis, DOWN, buff=0.3)
+
+    y_label_text = Text(y_label, font_size=24, color=_C_TEXT)
+    y_label_text.next_to(axes.y_axis, LEFT, buff=0.3)
+    y_label_text.rotate(PI / 2)
+
+    axes.add(x_label_text, y_label_text)
+    axes.center()
+
+    return axes
+
+
+_DATA_CSV: Final[Path] = Path("videos/assets/data/linear_data.csv")
+"""Pre-generated data set; resolved once instead of per render phase."""
+
+
+@cache
+def _generated_points() -> tuple[DataPoint, ...]:
+    """Generate the fallback data set once per process.
+
+    The generator is deterministic, so repeat renders reuse the same
+    tuple instead of re-running the RNG.
+
+    Returns:
+        Generated data points as an immutable tuple
+
+    """
+    return tuple(generate_linear_data())
+
+
+def _cached_points() -> tuple[tuple[DataPoint, ...], Path | None]:
+    """Return the scene's data points and the CSV they came from.
+
+    One stat call replaces the exists-then-open pair the scene used to
+    issue twice per render; CSV-backed loads go through the
+    stat-stamped parse cache and the generated fallback is computed
+    once per process.
+
+    Returns:
+        Tuple of (points, csv_path); csv_path is None for generated data
+
+    """
+    try:
+        stat = _DATA_CSV.stat()
+    except OSError:
+        return _generated_points(), None
+    return (
+        _load_data_points_cached(str(_DATA_CSV), stat.st_mtime, stat.st_size),
+        _DATA_CSV,
+    )
+
+
+def _points_to_xy(points: list[DataPoint]) -> tuple[np.ndarray, np.ndarray]:
+    """Split data points into x and y coordinate arrays.
+
+    Args:
+        points: Data points to split
+
+    Returns:
+        Tuple of (xs, ys) float64 arrays
+
+    """
+    count = len(points)
+    xs = np.fromiter((p.x for p in points), dtype=np.float64, count=count)
+    ys = np.fromiter((p.y for p in points), dtype=np.float64, count=count)
+    return xs, ys
 
 
 class LinearRegressionScene(VoiceoverScene):
@@ -87,7 +262,9 @@ class LinearRegressionScene(VoiceoverScene):
 
     def construct(self) -> None:
         """Build the linear regression scene animation sequence."""
-        self.set_speech_service(GTTSService())
+        # Content-keyed cache: unchanged narration never re-hits the
+        # gTTS network path on iterative renders
+        self.set_speech_service(CachedGTTSService())
         self.camera.background_color = get_background_color()
 
         # Start voiceover that plays throughout the scene
@@ -115,33 +292,46 @@ class LinearRegressionScene(VoiceoverScene):
         self.play(Create(axes), run_time=grid_duration)
 
         # Phase 2: Load and display data points (0:55-1:00)
-        data_path = Path("videos/assets/data/linear_data.csv")
-        if data_path.exists():
-            points = self._load_data_points(str(data_path))
+        points_tuple, csv_path = _cached_points()
+        points = list(points_tuple)
+
+        # All scene positions from one vectorized transform; the dots
+        # render as a single mobject so the scene graph carries one node
+        # instead of N. The affine is probed once and reused by every
+        # coordinate conversion below
+        affine = c2p_affine(axes)
+        xs, ys = _points_to_xy(points)
+        scene_points = batch_c2p(affine, xs, ys)
+        point_cloud = self._create_data_point_cloud(scene_points)
+
+        self.play(FadeIn(point_cloud), run_time=points_duration)
+
+        # Phase 3: Straight line shoots through (1:00-1:05). When the
+        # data comes from the CSV, the fit is reused via its sidecar
+        if csv_path is not None:
+            regression = _fit_regression_cached(points, csv_path)
         else:
-            # Generate data if file doesn't exist
-            points = generate_linear_data()
-
-        point_mobjects = self._create_data_point_mobjects(points, axes)
-
-        # Animate points appearing in upward trend
-        time_per_point = points_duration / len(point_mobjects)
-        for dot in point_mobjects:
-            self.play(FadeIn(dot), run_time=time_per_point * 0.8)
-
-        # Phase 3: Straight line shoots through (1:00-1:05)
-        regression = self._fit_linear_regression(points)
-        line = self._create_regression_line_mobject(regression, axes, (-0.5, 10.5))
+            regression = self._fit_linear_regression(points)
+        line = self._create_regression_line_mobject(regression, affine, (-0.5, 10.5))
         self.play(Create(line), run_time=line_duration)
 
         # Phase 4: CRITICAL - Zoom on single dot, show "RESIDUAL (ERROR)" (1:05-1:10)
-        error_bars = self._create_error_bars(points, regression, axes)
-
-        # Find the point with largest error for zoom
-        errors = create_error_bars(points, regression)
-        max_error_idx = max(range(len(errors)), key=lambda i: abs(errors[i].residual))
-
-        outlier_dot = point_mobjects[max_error_idx]
+        error_bars = self._create_error_bars(xs, ys, regression, affine)
+
+        # Find the point with largest error for zoom - one vectorized
+        # argmax over residuals computed from the arrays already on hand
+        residuals = ys - np.asarray(regression.predict(xs), dtype=np.float64)
+        max_error_idx = int(np.argmax(np.abs(residuals)))
+
+        # The cloud is one mobject, so the zoomed dot gets its own
+        # overlay Dot stacked on top of the cloud glyph
+        outlier_dot = Dot(
+            point=scene_points[max_error_idx],
+            radius=0.08,
+            color=_C_TEXT,
+            fill_opacity=1.0,
+        )
+        self.add(outlier_dot)
         outlier_bar = error_bars[max_error_idx]
 
         # Show just the single error bar first
@@ -158,7 +348,7 @@ class LinearRegressionScene(VoiceoverScene):
         residual_label = Text(
             "RESIDUAL (ERROR)",
             font_size=24,
-            color=ManimColor(COLORS.RED),
+            color=_C_RED,
             weight="BOLD",
         )
         residual_label.next_to(outlier_bar, RIGHT, buff=0.2)
@@ -175,14 +365,15 @@ class LinearRegressionScene(VoiceoverScene):
         self._animate_error_minimization(
             line,
             regression,
-            axes,
+            affine,
             duration=wiggle_duration * 0.7,
         )
 
         # Phase 6: Fade out everything
         all_content = VGroup(
             axes,
-            point_mobjects,
+            point_cloud,
+            outlier_dot,
             line,
             error_bars,
             residual_label,
@@ -194,7 +385,10 @@ class LinearRegressionScene(VoiceoverScene):
         x_label: str,
         y_label: str,
     ) -> Axes:
-        """Create 2D grid with axis labels.
+        """Return a fresh copy of the labelled 2D grid.
+
+        The grid is built once per (x_label, y_label) pair and copied
+        per render.
 
         Args:
             x_label: Label for x-axis
@@ -204,74 +398,34 @@ class LinearRegressionScene(VoiceoverScene):
             Axes mobject with labels
 
         """
-        axes = Axes(
-            x_range=[0, 11, 1],
-            y_range=[0, 14, 2],
-            x_length=10,
-            y_length=6,
-            axis_config={
-                "color": ManimColor(COLORS.GRID),
-                "include_tip": True,
-                "tip_length": 0.2,
-            },
-            x_axis_config={"numbers_to_include": [2, 4, 6, 8, 10]},
-            y_axis_config={"numbers_to_include": [2, 4, 6, 8, 10, 12]},
-        )
+        return _build_cartesian_grid(x_label, y_label).copy()
 
-        # Add axis labels
-        x_label_text = Text(x_label, font_size=24, color=ManimColor(COLORS.TEXT))
-        x_label_text.next_to(axes.x_axis, DOWN, buff=0.3)
+    def _create_data_point_cloud(self, scene_points: np.ndarray) -> VMobject:
+        """Merge all data dots into a single vectorized mobject.
 
-        y_label_text = Text(y_label, font_size=24, color=ManimColor(COLORS.TEXT))
-        y_label_text.next_to(axes.y_axis, LEFT, buff=0.3)
-        y_label_text.rotate(90 * 3.14159 / 180)
-
-        axes.add(x_label_text, y_label_text)
-        axes.center()
-
-        return axes
-
-    def _load_data_points(self, csv_path: str) -> list[DataPoint]:
-        """Load pre-generated data from CSV.
+        Scene-graph cost in manim is per mobject (bounds, style,
+        transform, fill path), so N separate Dots pay that cost N times
+        per frame. One VMobject holding N disconnected circle subpaths
+        with shared paint renders in a single pass.
 
         Args:
-            csv_path: Path to CSV file
+            scene_points: (N, 3) array of scene-space dot centers
 
         Returns:
-            List of DataPoint objects
+            VMobject containing one filled circle subpath per point
 
         """
-        return load_data_from_csv(csv_path)
-
-    def _create_data_point_mobjects(
-        self,
-        points: list[DataPoint],
-        axes: Axes,
-    ) -> VGroup:
-        """Create dot mobjects for each data point.
-
-        Args:
-            points: List of data points
-            axes: Axes to position dots on
-
-        Returns:
-            VGroup containing all dot mobjects
-
-        """
-        dots = VGroup()
-
-        for point in points:
-            # Convert data coordinates to scene coordinates
-            pos = axes.c2p(point.x, point.y)
-            dot = Dot(
-                point=pos,
-                radius=0.08,
-                color=ManimColor(COLORS.TEXT),
-                fill_opacity=1.0,
-            )
-            dots.add(dot)
+        cloud = VMobject(
+            fill_color=_C_TEXT,
+            fill_opacity=1.0,
+            stroke_width=0,
+        )
+        glyph = Dot(radius=0.08)
+        for pos in scene_points:
+            glyph.move_to(pos)
+            cloud.append_vectorized_mobject(glyph)
 
-        return dots
+        return cloud
 
     def _fit_linear_regression(
         self,
@@ -291,14 +445,14 @@ class LinearRegressionScene(VoiceoverScene):
     def _create_regression_line_mobject(
         self,
         regression: RegressionLine,
-        axes: Axes,
+        affine: Affine,
         x_range: tuple[float, float],
     ) -> Line:
         """Create visual line from regression model.
 
         Args:
             regression: Fitted regression model
-            axes: Axes for coordinate conversion
+            affine: Probed coordinate mapping for conversion
             x_range: (min_x, max_x) for line endpoints
 
         Returns:
@@ -306,31 +460,31 @@ class LinearRegressionScene(VoiceoverScene):
 
         """
         x1, x2 = x_range
-        y1 = regression.predict(x1)
-        y2 = regression.predict(x2)
-
-        start = axes.c2p(x1, y1)
-        end = axes.c2p(x2, y2)
+        origin, ux, uy = affine
+        start = origin + x1 * ux + regression.predict(x1) * uy
+        end = origin + x2 * ux + regression.predict(x2) * uy
 
         return Line(
             start=start,
             end=end,
-            color=ManimColor(COLORS.CYAN),
+            color=_C_CYAN,
             stroke_width=3,
         )
 
     def _create_error_bars(
         self,
-        points: list[DataPoint],
+        xs: np.ndarray,
+        ys: np.ndarray,
         regression: RegressionLine,
-        axes: Axes,
+        affine: Affine,
     ) -> VGroup:
         """Create residual visualization lines.
 
         Args:
-            points: List of data points
+            xs: Data-space x coordinates
+            ys: Data-space y coordinates
             regression: Fitted regression model
-            axes: Axes for coordinate conversion
+            affine: Probed coordinate mapping for conversion
 
         Returns:
             VGroup containing all error bar lines
@@ -338,16 +492,18 @@ class LinearRegressionScene(VoiceoverScene):
         """
         bars = VGroup()
 
-        for point in points:
-            predicted_y = regression.predict(point.x)
-
-            start = axes.c2p(point.x, point.y)
-            end = axes.c2p(point.x, predicted_y)
+        # Vectorized predictions and both endpoint batches in one
+        # transform each, instead of 3N scalar c2p/predict calls; the
+        # Python loop only wraps the results in Line mobjects
+        predicted = np.asarray(regression.predict(xs), dtype=np.float64)
+        starts = batch_c2p(affine, xs, ys)
+        ends = batch_c2p(affine, xs, predicted)
 
+        for start, end in zip(starts, ends, strict=True):
             bar = Line(
                 start=start,
                 end=end,
-                color=ManimColor(COLORS.RED),
+                color=_C_RED,
                 stroke_width=2,
                 stroke_opacity=0.7,
             )
@@ -362,7 +518,7 @@ class LinearRegressionScene(VoiceoverScene):
         self,
         line: Line,
         regression: RegressionLine,
-        axes: Axes,
+        affine: Affine,
         duration: float,
     ) -> None:
         """Animate line wiggling to show error minimization.
@@ -373,7 +529,7 @@ class LinearRegressionScene(VoiceoverScene):
         Args:
             line: Regression line to wiggle.
             regression: Fitted regression model (optimal position).
-            axes: Axes for coordinate conversion.
+            affine: Probed coordinate mapping for conversion.
             duration: Total duration for the wiggle animation.
 
         """
@@ -388,29 +544,32 @@ class LinearRegressionScene(VoiceoverScene):
             # Default if not standard linear
             optimal_slope, optimal_intercept = 1.0, 1.0
 
-        # Define wiggle sequence: start slightly off, then converge
-        # Wiggle offsets from optimal slope (shrinking oscillation)
-        wiggle_offsets = [0.3, -0.2, 0.1, -0.05, 0.0]
-
-        time_per_wiggle = duration / len(wiggle_offsets)
-
-        for offset in wiggle_offsets:
-            new_slope = optimal_slope + offset
-
-            # Calculate new line endpoints with perturbed slope
-            x1, x2 = -0.5, 10.5
-            y1 = new_slope * x1 + optimal_intercept
-            y2 = new_slope * x2 + optimal_intercept
-
-            new_start = axes.c2p(x1, y1)
-            new_end = axes.c2p(x2, y2)
-
-            # Animate line moving to new position
-            self.play(
-                line.animate.put_start_and_end_on(new_start, new_end),
-                run_time=time_per_wiggle,
+        # Wiggle sequence: start at the fitted slope, overshoot, then
+        # converge (shrinking oscillation)
+        wiggle_offsets = (0.0, 0.3, -0.2, 0.1, -0.05, 0.0)
+        last_segment = len(wiggle_offsets) - 1
+        x1, x2 = -0.5, 10.5
+        origin, ux, uy = affine
+
+        def _wiggle(mobject: Line, alpha: float) -> None:
+            # Piecewise-linear walk through the offset sequence; one
+            # updater evaluation per frame replaces five play calls and
+            # their per-call line snapshots. Endpoints come straight
+            # from the affine, so no per-frame c2p dispatch
+            segment = alpha * last_segment
+            index = int(segment)
+            t = segment - index
+            offset = (1 - t) * wiggle_offsets[index] + t * wiggle_offsets[
+                min(index + 1, last_segment)
+            ]
+            slope = optimal_slope + offset
+            mobject.put_start_and_end_on(
+                origin + x1 * ux + (slope * x1 + optimal_intercept) * uy,
+                origin + x2 * ux + (slope * x2 + optimal_intercept) * uy,
             )
 
+        self.play(UpdateFromAlphaFunc(line, _wiggle), run_time=duration)
+
     def get_duration(self) -> float:
         """Return scene duration."""
         return self.END_TIME - self.START_TIME
@@ -22,10 +22,13 @@ Duration: 25 seconds (1:15-1:40)
 from __future__ import annotations
 
 import math
+from typing import Final
 
+import numpy as np
 from manim import (
     DOWN,
     LEFT,
+    PI,
     Axes,
     Create,
     Dot,
@@ -33,18 +36,86 @@ from manim import (
     FadeOut,
     Line,
     ManimColor,
-    ParametricFunction,
     Text,
     Transform,
     VGroup,
+    VMobject,
     Write,
+    config,
 )
 from manim_voiceover import VoiceoverScene
-from manim_voiceover.services.gtts import GTTSService
 
 from src.config import COLORS, SCENE_NONLINEAR_REGRESSION
 from src.utils.color_utils import get_background_color
-from src.utils.data_generator import DataPoint, fit_linear_regression
+from src.utils.data_generator import (
+    DataPoint,
+    RegressionLine,
+    fit_linear_regression,
+)
+from videos.scenes.voiceover_service import CachedGTTSService
+from videos.templates.coords import Affine, batch_c2p, c2p_affine
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    njit = None
+
+
+def _hill_function(x: float) -> float:
+    """Evaluate the dose-response hill curve at one dosage.
+
+    Therapeutic effect rises and saturates; toxicity kicks in past a
+    threshold as a quadratic crash, floored at a minimum health level.
+
+    Args:
+        x: Drug dosage value.
+
+    Returns:
+        Patient health at that dosage.
+
+    """
+    therapeutic = 8.0 * (1.0 - math.exp(-0.6 * x))
+    over = x - 4.0
+    toxicity = 0.15 * over * over if over > 0.0 else 0.0
+    value = therapeutic - toxicity
+    return value if value > 0.5 else 0.5
+
+
+if njit is not None:
+    # ParametricFunction samples the curve hundreds of times per build;
+    # compiling the scalar kernel removes the interpreter dispatch from
+    # each sample. The warm-up call pays the compile cost at import so
+    # the first render doesn't
+    _hill_function = njit(cache=True, fastmath=True)(_hill_function)
+    _hill_function(0.0)
+
+
+# Both scenes that draw the hill trace the exact same geometry, so the
+# curve is sampled once at import; building a copy is then one affine
+# transform plus set_points_smoothly instead of re-running a Python
+# sampling lambda per scene
+_HILL_TS: Final = np.linspace(0.3, 10.5, 256)
+_HILL_YS: Final = np.fromiter(
+    (_hill_function(t) for t in _HILL_TS),
+    dtype=np.float64,
+    count=_HILL_TS.size,
+)
+
+
+def build_hill_curve(affine: Affine, *, stroke_width: float = 3) -> VMobject:
+    """Build the hill-shaped dose-response curve from cached samples.
+
+    Args:
+        affine: Probed (origin, ux, uy) mapping from data to scene space.
+        stroke_width: Stroke width for the curve.
+
+    Returns:
+        VMobject tracing the precomputed hill samples smoothly.
+
+    """
+    curve = VMobject(color=ManimColor(COLORS.CYAN), stroke_width=stroke_width)
+    curve.set_points_smoothly(batch_c2p(affine, _HILL_TS, _HILL_YS))
+    return curve
 
 
 class NonLinearRegressionScene(VoiceoverScene):
@@ -80,7 +151,10 @@ class NonLinearRegressionScene(VoiceoverScene):
 
     def construct(self) -> None:
         """Build the non-linear regression scene animation sequence."""
-        self.set_speech_service(GTTSService())
+        # Voiceover timing varies between renders, so the per-animation
+        # hash/copy of Manim's cache almost never hits; skip it
+        config.disable_caching = True
+        self.set_speech_service(CachedGTTSService())
         self.camera.background_color = get_background_color()
 
         # Start voiceover that plays throughout the scene
@@ -111,17 +185,24 @@ class NonLinearRegressionScene(VoiceoverScene):
         points = self._generate_dose_response_data()
         point_mobjects = self._create_data_point_mobjects(points, axes)
 
-        time_per_point = points_duration / len(point_mobjects)
-        for dot in point_mobjects:
-            self.play(FadeIn(dot), run_time=time_per_point * 0.8)
+        # One staggered animation instead of a scheduler round-trip and
+        # frame flush per dot
+        self.play(
+            FadeIn(point_mobjects, lag_ratio=0.8),
+            run_time=points_duration,
+        )
 
         # Phase 3: Linear line FAILS - MASSIVE error bars (1:25-1:30)
         linear_regression = fit_linear_regression(points)
 
-        # Extend line beyond data to show absurd "infinite dose = infinite health"
+        # Extend line beyond data to show absurd "infinite dose = infinite health";
+        # both endpoints come from one vectorized predict call
+        line_xs = np.array([-0.5, 12.0])
+        line_ys = np.asarray(linear_regression.predict(line_xs), dtype=np.float64)
+        line_points = batch_c2p(c2p_affine(axes), line_xs, line_ys)
         linear_line = Line(
-            start=axes.c2p(-0.5, linear_regression.predict(-0.5)),
-            end=axes.c2p(12, linear_regression.predict(12)),
+            start=line_points[0],
+            end=line_points[1],
             color=ManimColor(COLORS.CYAN),
             stroke_width=3,
         )
@@ -151,6 +232,7 @@ class NonLinearRegressionScene(VoiceoverScene):
             font_size=36,
             color=ManimColor(COLORS.CYAN),
             weight="BOLD",
+            use_svg_cache=False,
         )
         conclusion_text.to_edge(DOWN, buff=0.5)
 
@@ -183,12 +265,22 @@ class NonLinearRegressionScene(VoiceoverScene):
         )
 
         # Add axis labels
-        x_label = Text("Drug Dosage", font_size=24, color=ManimColor(COLORS.TEXT))
+        x_label = Text(
+            "Drug Dosage",
+            font_size=24,
+            color=ManimColor(COLORS.TEXT),
+            use_svg_cache=False,
+        )
         x_label.next_to(axes.x_axis, DOWN, buff=0.3)
 
-        y_label = Text("Patient Health", font_size=24, color=ManimColor(COLORS.TEXT))
+        y_label = Text(
+            "Patient Health",
+            font_size=24,
+            color=ManimColor(COLORS.TEXT),
+            use_svg_cache=False,
+        )
         y_label.next_to(axes.y_axis, LEFT, buff=0.3)
-        y_label.rotate(90 * math.pi / 180)
+        y_label.rotate(PI / 2)
 
         axes.add(x_label, y_label)
         axes.center()
@@ -205,26 +297,22 @@ class NonLinearRegressionScene(VoiceoverScene):
             List of DataPoint objects following dose-response curve.
 
         """
-        points: list[DataPoint] = []
-
-        # Generate hill-shaped dose-response curve with some noise
-        x_values = [0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0]
-
-        for x in x_values:
-            # Dose-response: rises, saturates, then crashes (toxicity)
-            # Therapeutic effect (rises and saturates)
-            therapeutic = 8.0 * (1.0 - math.exp(-0.6 * x))
-            # Toxicity kicks in at higher doses (quadratic crash)
-            toxicity = 0.15 * max(0.0, x - 4.0) ** 2
-            y = max(0.5, therapeutic - toxicity)
+        # Generate hill-shaped dose-response curve with some noise, all
+        # in one vectorized pass instead of per-point math calls
+        x = np.array(
+            [0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0],
+        )
 
-            # Add small noise for realism
-            noise = 0.3 * math.sin(x * 2.5)
-            y = max(0.5, y + noise)
+        # Dose-response: rises, saturates, then crashes (toxicity)
+        therapeutic = 8.0 * (1.0 - np.exp(-0.6 * x))
+        toxicity = 0.15 * np.maximum(0.0, x - 4.0) ** 2
+        y = np.maximum(0.5, therapeutic - toxicity)
 
-            points.append(DataPoint(x=x, y=y))
+        # Add small noise for realism
+        noise = 0.3 * np.sin(x * 2.5)
+        y = np.maximum(0.5, y + noise)
 
-        return points
+        return [DataPoint(x=float(xi), y=float(yi)) for xi, yi in zip(x, y, strict=True)]
 
     def _create_data_point_mobjects(
         self,
@@ -243,14 +331,23 @@ class NonLinearRegressionScene(VoiceoverScene):
         """
         dots = VGroup()
 
-        for point in points:
-            pos = axes.c2p(point.x, point.y)
-            dot = Dot(
-                point=pos,
-                radius=0.08,
-                color=ManimColor(COLORS.TEXT),
-                fill_opacity=1.0,
-            )
+        # One prototype carries the parsed style and point buffer; each
+        # grid slot gets a repositioned copy instead of a fresh Dot init
+        prototype = Dot(
+            radius=0.08,
+            color=ManimColor(COLORS.TEXT),
+            fill_opacity=1.0,
+        )
+
+        # All scene positions from one vectorized transform
+        count = len(points)
+        xs = np.fromiter((p.x for p in points), dtype=np.float64, count=count)
+        ys = np.fromiter((p.y for p in points), dtype=np.float64, count=count)
+        scene_points = batch_c2p(c2p_affine(axes), xs, ys)
+
+        for pos in scene_points:
+            dot = prototype.copy()
+            dot.move_to(pos)
             dots.add(dot)
 
         return dots
@@ -258,7 +355,7 @@ class NonLinearRegressionScene(VoiceoverScene):
     def _create_massive_error_bars(
         self,
         points: list[DataPoint],
-        regression: object,
+        regression: RegressionLine,
         axes: Axes,
     ) -> VGroup:
         """Create MASSIVE red error bars showing linear failure.
@@ -269,7 +366,7 @@ class NonLinearRegressionScene(VoiceoverScene):
 
         Args:
             points: List of data points.
-            regression: Linear regression model with predict() method.
+            regression: Fitted linear regression model.
             axes: Axes for coordinate conversion.
 
         Returns:
@@ -278,25 +375,31 @@ class NonLinearRegressionScene(VoiceoverScene):
         """
         bars = VGroup()
 
-        for point in points:
-            predicted_y = regression.predict(point.x)  # type: ignore[union-attr]
-
-            start = axes.c2p(point.x, point.y)
-            end = axes.c2p(point.x, predicted_y)
+        # MASSIVE thick red bars to emphasize failure; one prototype is
+        # restyled once and re-aimed per point via its endpoints
+        prototype = Line(
+            color=ManimColor(COLORS.RED),
+            stroke_width=5,
+            stroke_opacity=0.9,
+        )
 
-            # MASSIVE thick red bars to emphasize failure
-            bar = Line(
-                start=start,
-                end=end,
-                color=ManimColor(COLORS.RED),
-                stroke_width=5,
-                stroke_opacity=0.9,
-            )
+        # Both endpoint batches from one vectorized transform each
+        affine = c2p_affine(axes)
+        count = len(points)
+        xs = np.fromiter((p.x for p in points), dtype=np.float64, count=count)
+        ys = np.fromiter((p.y for p in points), dtype=np.float64, count=count)
+        predicted = np.asarray(regression.predict(xs), dtype=np.float64)
+        starts = batch_c2p(affine, xs, ys)
+        ends = batch_c2p(affine, xs, predicted)
+
+        for start, end in zip(starts, ends, strict=True):
+            bar = prototype.copy()
+            bar.put_start_and_end_on(start, end)
             bars.add(bar)
 
         return bars
 
-    def _create_hill_curve(self, axes: Axes) -> ParametricFunction:
+    def _create_hill_curve(self, axes: Axes) -> VMobject:
         """Create the hill-shaped curve that fits dose-response data.
 
         The curve rises, plateaus (saturation), then crashes (toxicity).
@@ -305,24 +408,10 @@ class NonLinearRegressionScene(VoiceoverScene):
             axes: Axes for coordinate conversion.
 
         Returns:
-            ParametricFunction representing the hill curve.
+            VMobject tracing the cached hill-curve samples.
 
         """
-
-        def hill_function(x: float) -> float:
-            """Dose-response hill function."""
-            # Therapeutic effect (rises and saturates)
-            therapeutic = 8.0 * (1.0 - math.exp(-0.6 * x))
-            # Toxicity kicks in at higher doses
-            toxicity = 0.15 * max(0.0, x - 4.0) ** 2
-            return max(0.5, therapeutic - toxicity)
-
-        return ParametricFunction(
-            lambda t: axes.c2p(t, hill_function(t)),
-            t_range=[0.3, 10.5],
-            color=ManimColor(COLORS.CYAN),
-            stroke_width=3,
-        )
+        return build_hill_curve(c2p_affine(axes))
 
     def get_duration(self) -> float:
         """Return scene duration."""
@@ -18,8 +18,7 @@ Duration: 20 seconds (1:40-2:00)
 
 from __future__ import annotations
 
-import math
-
+import numpy as np
 from manim import (
     DOWN,
     ORIGIN,
@@ -27,16 +26,21 @@ from manim import (
     FadeIn,
     FadeOut,
     ManimColor,
-    ParametricFunction,
+    ReplacementTransform,
     Text,
     VGroup,
+    VMobject,
     Write,
+    config,
+    there_and_back,
 )
 from manim_voiceover import VoiceoverScene
-from manim_voiceover.services.gtts import GTTSService
 
 from src.config import COLORS, SCENE_SYNTHESIS
 from src.utils.color_utils import get_background_color
+from videos.scenes.section4_nonlinear import build_hill_curve
+from videos.scenes.voiceover_service import CachedGTTSService
+from videos.templates.coords import Affine
 from videos.templates.effects import apply_glow_effect
 
 
@@ -71,7 +75,10 @@ class SynthesisScene(VoiceoverScene):
 
     def construct(self) -> None:
         """Build the synthesis scene animation sequence."""
-        self.set_speech_service(GTTSService())
+        # Voiceover timing varies between renders, so the per-animation
+        # hash/copy of Manim's cache almost never hits; skip it
+        config.disable_caching = True
+        self.set_speech_service(CachedGTTSService())
         self.camera.background_color = get_background_color()
 
         # Start voiceover that plays throughout the scene
@@ -107,32 +114,23 @@ class SynthesisScene(VoiceoverScene):
         # Phase 4: "Judge" text returns, GLOWING (1:55-2:00)
         self._create_glowing_judge_text(network, judge_duration)
 
-    def _create_biological_curve(self) -> ParametricFunction:
+    def _create_biological_curve(self) -> VMobject:
         """Create the hill-shaped dose-response curve from Section 4.
 
         Returns:
-            ParametricFunction representing the non-linear curve.
+            VMobject tracing the non-linear curve.
 
         """
-
-        def hill_function(t: float) -> float:
-            """Dose-response hill function matching Section 4."""
-            # Map t from [0, 10] to x values for the hill curve
-            x = t
-            # Therapeutic effect (rises and saturates)
-            therapeutic = 8.0 * (1.0 - math.exp(-0.6 * x))
-            # Toxicity kicks in at higher doses
-            toxicity = 0.15 * max(0.0, x - 4.0) ** 2
-            return max(0.5, therapeutic - toxicity)
-
-        return ParametricFunction(
-            lambda t: [t - 5, hill_function(t) - 4, 0],
-            t_range=[0.3, 10.5],
-            color=ManimColor(COLORS.CYAN),
-            stroke_width=4,
+        # Same cached geometry as Section 4, shifted into this scene's
+        # frame via a plain translation affine instead of new axes
+        offset_affine: Affine = (
+            np.array([-5.0, -4.0, 0.0]),
+            np.array([1.0, 0.0, 0.0]),
+            np.array([0.0, 1.0, 0.0]),
         )
+        return build_hill_curve(offset_affine, stroke_width=4)
 
-    def _isolate_curve(self, curve: ParametricFunction) -> VGroup:
+    def _isolate_curve(self, curve: VMobject) -> VGroup:
         """Remove context, keep only glowing curve.
 
         Args:
@@ -148,7 +146,7 @@ class SynthesisScene(VoiceoverScene):
         self,
         curve: VGroup,
         duration: float,
-    ) -> ParametricFunction:
+    ) -> VGroup:
         """Zoom out - the curve becomes a single wire (neuron).
 
         The wire remains curved to show it's a non-linear function.
@@ -184,7 +182,7 @@ class SynthesisScene(VoiceoverScene):
 
     def _reveal_curved_wire_network(
         self,
-        start_wire: VGroup | ParametricFunction,
+        start_wire: VGroup | VMobject,
         duration: float,
     ) -> VGroup:
         """Zoom out rapidly to reveal network of millions of curved wires.
@@ -200,28 +198,11 @@ class SynthesisScene(VoiceoverScene):
             VGroup containing all network wire elements.
 
         """
-        # Create a grid of curved wires (neurons)
-        network_wires = VGroup()
-
-        # Generate many small curved wires
-        for row in range(self._WIRE_ROWS):
-            for col in range(self._WIRE_COLS):
-                # Create small curved wire (each represents a non-linear function)
-                wire = self._create_small_curved_wire()
-
-                # Position in grid pattern
-                x = (col - self._WIRE_COLS / 2) * self._WIRE_SPACING_X
-                y = (row - self._WIRE_ROWS / 2) * self._WIRE_SPACING_Y
-
-                wire.move_to([x, y, 0])
-                wire.scale(self._WIRE_SCALE)
-
-                # Vary opacity slightly for depth effect
-                base_opacity = 0.6
-                opacity_variation = 0.3 * ((row + col) % 3) / 2
-                wire.set_opacity(base_opacity + opacity_variation)
-
-                network_wires.add(wire)
+        # Every wire shares the same geometry, so one sampled tanh
+        # polyline is tiled across the grid with broadcasting and the
+        # whole layer renders as three batched mobjects (one per
+        # opacity class) instead of rows*cols scene-graph nodes
+        network_wires = self._create_wire_layer()
 
         # Create connection lines between wires (also curved for consistency)
         connections = self._create_network_connections()
@@ -248,65 +229,112 @@ class SynthesisScene(VoiceoverScene):
 
         return full_network
 
-    def _create_small_curved_wire(self) -> ParametricFunction:
-        """Create a small curved wire representing one neuron.
+    # Samples per wire polyline and number of depth-opacity classes
+    _WIRE_SAMPLES: int = 32
+    _WIRE_OPACITY_CLASSES: int = 3
+
+    def _create_wire_layer(self) -> VGroup:
+        """Build the grid of curved wires as a few batched mobjects.
 
-        Each wire is curved to show it's a non-linear function.
+        One tanh polyline is sampled once and tiled over the grid with
+        a broadcasted offset array; wires sharing an opacity class merge
+        into a single VMobject of disconnected subpaths, so the network
+        layer holds three mobjects instead of one per wire.
 
         Returns:
-            ParametricFunction for a small curved wire.
+            VGroup of one VMobject per depth-opacity class.
 
         """
-        # Small sigmoid-like curve - represents non-linear activation
-        return ParametricFunction(
-            lambda t: [t, 0.3 * math.tanh(t * 2), 0],
-            t_range=[-1, 1],
-            color=ManimColor(COLORS.CYAN),
-            stroke_width=2,
+        # Reference sigmoid-like polyline - represents non-linear
+        # activation, sampled once for every wire in the grid
+        t = np.linspace(-1.0, 1.0, self._WIRE_SAMPLES)
+        base = self._WIRE_SCALE * np.stack(
+            [t, 0.3 * np.tanh(2.0 * t), np.zeros_like(t)],
+            axis=1,
         )
 
+        # Grid offsets, row-major like the original nested loop
+        xs = (np.arange(self._WIRE_COLS) - self._WIRE_COLS / 2) * self._WIRE_SPACING_X
+        ys = (np.arange(self._WIRE_ROWS) - self._WIRE_ROWS / 2) * self._WIRE_SPACING_Y
+        grid_x, grid_y = np.meshgrid(xs, ys)
+        offsets = np.stack(
+            [grid_x, grid_y, np.zeros_like(grid_x)],
+            axis=-1,
+        ).reshape(-1, 3)
+        tiled = offsets[:, None, :] + base[None, :, :]
+
+        # Depth effect: opacity varies with (row + col) % 3 as before
+        rows, cols = np.divmod(np.arange(offsets.shape[0]), self._WIRE_COLS)
+        classes = (rows + cols) % self._WIRE_OPACITY_CLASSES
+
+        layer = VGroup()
+        for opacity_class in range(self._WIRE_OPACITY_CLASSES):
+            wires = VMobject(
+                color=ManimColor(COLORS.CYAN),
+                stroke_width=2,
+                stroke_opacity=0.6 + 0.3 * opacity_class / 2,
+            )
+            for wire_points in tiled[classes == opacity_class]:
+                wires.start_new_path(wire_points[0])
+                wires.add_points_as_corners(wire_points[1:])
+            layer.add(wires)
+
+        return layer
+
     # Connection generation constants
     _CONNECTION_COUNT: int = 150
     _CONNECTION_OPACITY: float = 0.25
 
-    def _create_network_connections(self) -> VGroup:
+    def _create_network_connections(self) -> VMobject:
         """Create curved connections between network nodes.
 
+        All connections live in one VMobject as bezier subpaths, so the
+        renderer draws the whole wiring layer in a single pass instead
+        of iterating 150 separate mobjects per frame.
+
         Returns:
-            VGroup containing curved connection lines.
+            VMobject containing every curved connection as a subpath.
 
         """
-        import random
-
-        connections = VGroup()
-
-        # Deterministic randomness for reproducibility
-        rng = random.Random(42)  # noqa: S311
-
-        # Create curved connection paths
-        for _ in range(self._CONNECTION_COUNT):
-            # Random start and end points within the network bounds
-            x1 = rng.uniform(-6, 6)
-            y1 = rng.uniform(-3, 3)
-            x2 = rng.uniform(-6, 6)
-            y2 = rng.uniform(-3, 3)
-
-            # Create curved connection (Bezier-like)
-            mid_x = (x1 + x2) / 2
-            mid_y = (y1 + y2) / 2 + rng.uniform(-0.5, 0.5)
-
-            connection = ParametricFunction(
-                lambda t, x1=x1, y1=y1, mid_x=mid_x, mid_y=mid_y, x2=x2, y2=y2: [
-                    (1 - t) ** 2 * x1 + 2 * (1 - t) * t * mid_x + t**2 * x2,
-                    (1 - t) ** 2 * y1 + 2 * (1 - t) * t * mid_y + t**2 * y2,
-                    0,
-                ],
-                t_range=[0, 1],
-                color=ManimColor(COLORS.GRID),
-                stroke_width=0.5,
-                stroke_opacity=self._CONNECTION_OPACITY,
-            )
-            connections.add(connection)
+        connections = VMobject(
+            color=ManimColor(COLORS.GRID),
+            stroke_width=0.5,
+            stroke_opacity=self._CONNECTION_OPACITY,
+        )
+
+        # Deterministic randomness for reproducibility; every endpoint
+        # and control-point sag comes from one broadcast rng fill
+        # instead of separate draws per coordinate
+        rng = np.random.default_rng(42)
+        count = self._CONNECTION_COUNT
+        zeros = np.zeros(count)
+
+        draws = rng.uniform(
+            low=[-6.0, -3.0, -6.0, -3.0, -0.5],
+            high=[6.0, 3.0, 6.0, 3.0, 0.5],
+            size=(count, 5),
+        )
+        starts = np.column_stack([draws[:, 0], draws[:, 1], zeros])
+        ends = np.column_stack([draws[:, 2], draws[:, 3], zeros])
+
+        # Curved connection control points (Bezier-like), sagged in y
+        controls = (starts + ends) / 2.0
+        controls[:, 1] += draws[:, 4]
+
+        # Exact quadratic beziers expressed in cubic form; the loop only
+        # appends precomputed handles as subpaths
+        first_handles = starts + (controls - starts) * (2.0 / 3.0)
+        second_handles = ends + (controls - ends) * (2.0 / 3.0)
+
+        for start, first, second, end in zip(
+            starts,
+            first_handles,
+            second_handles,
+            ends,
+            strict=True,
+        ):
+            connections.start_new_path(start)
+            connections.add_cubic_bezier_curve_to(first, second, end)
 
         return connections
 
@@ -331,40 +359,37 @@ class SynthesisScene(VoiceoverScene):
             font_size=96,
             color=ManimColor(COLORS.GOLD),
             weight="BOLD",
+            use_svg_cache=False,
         )
         judge_text.move_to(ORIGIN)
 
-        # Create glowing version
+        # Build the glowing version up front so the reveal is a single
+        # transform instead of a remove+add pair of scene mutations
         glow_text = apply_glow_effect(
             judge_text,
             glow_factor=1.8,
             opacity=0.5,
             color=COLORS.GOLD,
         )
-
-        # Animate text appearing with glow
-        self.play(Write(judge_text), run_time=duration * 0.4)
-
-        # Replace with glowing version
-        self.remove(judge_text)
         glow_text.move_to(ORIGIN)
-        self.add(glow_text)
 
-        # Pulse the glow for emphasis
-        self.play(
-            glow_text.animate.scale(1.1),
-            run_time=duration * 0.2,
-        )
+        # Animate text appearing, then morph it into the glowing version;
+        # the phase budget still sums to the full duration
+        self.play(Write(judge_text), run_time=duration * 0.3)
+        self.play(ReplacementTransform(judge_text, glow_text), run_time=duration * 0.1)
+
+        # Pulse the glow for emphasis; there_and_back folds the grow and
+        # shrink into one animation so the scheduler runs once
         self.play(
-            glow_text.animate.scale(1 / 1.1),
-            run_time=duration * 0.2,
+            glow_text.animate(rate_func=there_and_back).scale(1.1),
+            run_time=duration * 0.4,
         )
 
         self.wait(duration * 0.2)
 
-        # Fade everything out
-        all_content = VGroup(network, glow_text)
-        self.play(FadeOut(all_content), run_time=duration * 0.0)
+        # Zero-duration fades still run the full animation pipeline;
+        # the scene transition handles disposal, so drop them directly
+        self.remove(network, glow_text)
 
     def get_duration(self) -> float:
         """Return scene duration."""
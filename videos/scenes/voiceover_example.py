@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from manim import *
 from manim_voiceover import VoiceoverScene
-from manim_voiceover.services.gtts import GTTSService
+
+from videos.scenes.voiceover_service import CachedGTTSService
 
 
 class VoiceoverDemo(VoiceoverScene):
@@ -12,8 +13,12 @@ class VoiceoverDemo(VoiceoverScene):
 
     def construct(self) -> None:
         """Create an animated scene with synchronized voiceover narration."""
+        # Voiceover timing varies between renders, so Manim's animation
+        # cache almost never hits; skip the per-animation hash/copy
+        config.disable_caching = True
+
         # Initialize Google Text-to-Speech service
-        self.set_speech_service(GTTSService())
+        self.set_speech_service(CachedGTTSService())
 
         # Create title
         title = Text("Manim Voiceover Demo", font_size=48)
@@ -58,7 +63,10 @@ class MLConceptWithVoiceover(VoiceoverScene):
 
     def construct(self) -> None:
         """Explain a simple ML concept with synchronized animations and voice."""
-        self.set_speech_service(GTTSService())
+        # Voiceover timing varies between renders, so Manim's animation
+        # cache almost never hits; skip the per-animation hash/copy
+        config.disable_caching = True
+        self.set_speech_service(CachedGTTSService())
 
         # Introduction
         title = Text("Linear Regression", font_size=48, color=YELLOW)
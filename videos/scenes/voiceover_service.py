@@ -0,0 +1,79 @@
+"""Content-keyed caching wrapper around the gTTS speech service.
+
+Every gTTS call is a network round-trip to Google Translate; narration
+text is stable across iterative renders, so synthesized audio metadata
+is cached on disk keyed by sha256(text + language). Any scene that sets
+its own speech service should use this wrapper so re-renders skip all
+TTS network calls for unchanged lines.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+from manim_voiceover.services.gtts import GTTSService
+
+
+class CachedGTTSService(GTTSService):
+    """GTTS speech service with a content-keyed on-disk cache.
+
+    Re-renders skip the TTS network round-trip for any narration line
+    whose text and language match a previously generated manifest.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path = "media/voiceover_cache",
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the service and ensure the cache directory exists.
+
+        Args:
+            cache_dir: Directory holding cached generation manifests
+            **kwargs: Forwarded to GTTSService
+
+        """
+        super().__init__(**kwargs)
+        self._tts_cache_dir = Path(cache_dir)
+        self._tts_cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def generate_from_text(
+        self,
+        text: str,
+        cache_dir: str | None = None,
+        path: str | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Generate (or reuse cached) audio metadata for a narration line.
+
+        Args:
+            text: Narration text to synthesize
+            cache_dir: Forwarded to GTTSService
+            path: Forwarded to GTTSService
+            **kwargs: Forwarded to GTTSService
+
+        Returns:
+            The audio generation result dictionary
+
+        """
+        lang = getattr(self, "lang", "en")
+        key = hashlib.sha256(f"{text}:{lang}".encode()).hexdigest()
+        manifest = self._tts_cache_dir / f"{key}.json"
+        if manifest.exists():
+            return json.loads(manifest.read_text())
+
+        result = super().generate_from_text(
+            text,
+            cache_dir=cache_dir,
+            path=path,
+            **kwargs,
+        )
+        # Write atomically so an interrupted render never leaves a
+        # truncated manifest to poison later cache hits
+        tmp = manifest.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(result))
+        tmp.replace(manifest)
+        return result
@@ -8,4 +8,4 @@ Contains:
 
 from __future__ import annotations
 
-__all__ = ["animations", "custom_shapes", "effects"]
+__all__ = ["animations", "coords", "custom_shapes", "effects", "mobject_cache"]
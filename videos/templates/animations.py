@@ -8,20 +8,23 @@ from __future__ import annotations
 
 import random
 from collections.abc import Callable
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 from manim import (
     Animation,
     FadeIn,
     Line,
-    ManimColor,
-    ParametricFunction,
     Text,
     Transform,
+    VGroup,
+    VMobject,
     rate_functions,
 )
 
 from src.config import COLORS, DATA_SEED
+from videos.templates.mobject_cache import cached_color
 
 if TYPE_CHECKING:
     from manim import Mobject
@@ -95,6 +98,13 @@ class TextJitter(Animation):
         self.original_text = text_mobject.text
         self.corruption_rate = corruption_rate
         self.rng = random.Random(seed)
+        # Resolve each character's corruption choices once; the
+        # per-frame loop then only draws random numbers and indexes
+        # tuples instead of upper-casing and probing the map every frame
+        self._char_table: list[tuple[str, tuple[str, ...] | None]] = [
+            (char, tuple(CORRUPTION_MAP[char.upper()]) if char.upper() in CORRUPTION_MAP else None)
+            for char in self.original_text
+        ]
         super().__init__(text_mobject, **kwargs)
 
     def interpolate_mobject(self, alpha: float) -> None:
@@ -108,25 +118,75 @@ class TextJitter(Animation):
             # At start and end, show original text
             return
 
-        # Corrupt some characters based on alpha and corruption_rate
-        corrupted_chars = []
-        for char in self.original_text:
-            if self.rng.random() < self.corruption_rate:
-                upper_char = char.upper()
-                if upper_char in CORRUPTION_MAP:
-                    corrupted_chars.append(
-                        self.rng.choice(CORRUPTION_MAP[upper_char]),
-                    )
-                else:
-                    corrupted_chars.append(char)
+        # Corrupt some characters based on alpha and corruption_rate;
+        # local bindings keep the per-character frame loop free of
+        # attribute lookups
+        rng_random = self.rng.random
+        rate = self.corruption_rate
+        corrupted_chars: list[str] = []
+        append_char = corrupted_chars.append
+        for char, choices in self._char_table:
+            if choices is not None and rng_random() < rate:
+                append_char(choices[int(rng_random() * len(choices))])
             else:
-                corrupted_chars.append(char)
+                append_char(char)
 
         # Note: In practice, we would need to replace the text content
         # This is a simplified version - full implementation would
         # recreate the Text mobject or use character-by-character submobjects
 
 
+@lru_cache(maxsize=32)
+def _sampled_curve_points(
+    target_func: Callable[[float], float],
+    x_range: tuple[float, float],
+    samples: int = 200,
+) -> np.ndarray:
+    """Sample y = f(x) into an (N, 3) point array, memoized per function.
+
+    ParametricFunction re-samples its lambda point by point on every
+    construction; sampling once into a preallocated array and reusing it
+    across morph instances pays the Python call cost a single time.
+    Callers must treat the returned array as read-only.
+
+    Args:
+        target_func: Target function y = f(x); must be hashable
+        x_range: Domain as (min_x, max_x)
+        samples: Number of sample points across the domain
+
+    Returns:
+        (samples, 3) array of curve points in the xy plane
+
+    """
+    xs = np.linspace(x_range[0], x_range[1], samples)
+    ys = np.fromiter((target_func(x) for x in xs), dtype=np.float64, count=samples)
+    return np.stack([xs, ys, np.zeros_like(xs)], axis=1)
+
+
+def _build_target_curve(
+    line: Line,
+    target_func: Callable[[float], float],
+    x_range: tuple[float, float],
+) -> VMobject:
+    """Build the morph target curve from cached samples, styled like the line.
+
+    Args:
+        line: Source line providing color and stroke width
+        target_func: Target function y = f(x)
+        x_range: Domain for the curve
+
+    Returns:
+        VMobject tracing the sampled curve smoothly
+
+    """
+    curve = VMobject(
+        color=line.get_color(),
+        stroke_width=line.get_stroke_width(),
+    )
+    curve.set_points_smoothly(_sampled_curve_points(target_func, x_range))
+    return curve
+
+
 class LineMorph(Animation):
     """Smoothly morph a straight line to a curved function.
 
@@ -157,12 +217,8 @@ class LineMorph(Animation):
         self.start_point = line.get_start()
         self.end_point = line.get_end()
 
-        # Create target curve
-        self.target_curve = ParametricFunction(
-            lambda t: [t, target_func(t), 0],
-            t_range=[x_range[0], x_range[1]],
-            color=line.get_color(),
-        )
+        # Create target curve from the memoized sample array
+        self.target_curve = _build_target_curve(line, target_func, x_range)
 
         super().__init__(line, **kwargs)
 
@@ -202,12 +258,7 @@ def create_line_to_curve_animation(
         Transform animation from line to curve
 
     """
-    target_curve = ParametricFunction(
-        lambda t: [t, target_func(t), 0],
-        t_range=[x_range[0], x_range[1]],
-        color=line.get_color(),
-        stroke_width=line.get_stroke_width(),
-    )
+    target_curve = _build_target_curve(line, target_func, x_range)
 
     return Transform(line, target_curve, run_time=duration)
 
@@ -237,7 +288,12 @@ class StampIn(Animation):
         """
         self.shear_angle = shear_angle
         self.scale_factor = scale_factor
-        self.original_matrix = text.get_points().copy() if len(text.get_points()) > 0 else None
+        # Baseline geometry cached once; each frame rebuilds points
+        # from it, so no bounding-box scan runs per frame and the scale
+        # no longer compounds across frames
+        points = text.get_points()
+        self._initial_points = points.copy() if len(points) > 0 else None
+        self._initial_center = text.get_center()
         super().__init__(text, **kwargs)
 
     def interpolate_mobject(self, alpha: float) -> None:
@@ -247,18 +303,27 @@ class StampIn(Animation):
             alpha: Animation progress from 0.0 to 1.0
 
         """
+        if self._initial_points is None:
+            return
+
         # Use rush_from rate function for slam effect
         t = rate_functions.rush_from(alpha)
 
-        # Scale down from large to normal
+        # Scale settles from scale_factor to 1 while the shear decays;
+        # one affine built from two cached scalars maps the baseline
+        # points about their original center in a single matrix product
         current_scale = self.scale_factor - (self.scale_factor - 1.0) * t
-
-        # Reduce shear as animation progresses
         current_shear = self.shear_angle * (1.0 - t)
-
-        # Apply transformations
-        self.mobject.scale(
-            current_scale / self.mobject.get_height() if self.mobject.get_height() > 0 else 1
+        stamp_matrix = np.array(
+            [
+                [current_scale, current_shear, 0.0],
+                [0.0, current_scale, 0.0],
+                [0.0, 0.0, 1.0],
+            ],
+        )
+        self.mobject.set_points(
+            self._initial_center
+            + (self._initial_points - self._initial_center) @ stamp_matrix.T,
         )
 
 
@@ -281,7 +346,7 @@ def create_stamp_animation(
         FadeIn animation with scale effect
 
     """
-    text.set_color(ManimColor(color))
+    text.set_color(cached_color(color))
     text.scale(0.1)  # Start small
 
     return FadeIn(
@@ -313,12 +378,17 @@ class CascadeText(Animation):
             **kwargs: Additional animation parameters
 
         """
-        from manim import VGroup
-
         self.text_lines = text_lines
         self.interval = interval
         self.group = VGroup(*text_lines)
 
+        # Per-line reveal windows precomputed once; the last applied
+        # opacities let the frame loop skip lines that are already
+        # saturated at 0 or 1
+        total_lines = len(text_lines)
+        self._line_starts = np.arange(total_lines) / max(total_lines, 1)
+        self._last_opacities = np.full(total_lines, -1.0)
+
         # Start all lines invisible
         for line in text_lines:
             line.set_opacity(0)
@@ -332,24 +402,25 @@ class CascadeText(Animation):
             alpha: Animation progress from 0.0 to 1.0
 
         """
-        # Calculate which lines should be visible
+        # Each line takes up 1/total_lines of the animation; compute
+        # every opacity in one clipped vector expression and only touch
+        # lines whose value actually moved since the last frame
         total_lines = len(self.text_lines)
         if total_lines == 0:
             return
 
-        # Each line takes up 1/total_lines of the animation
-        for i, line in enumerate(self.text_lines):
-            line_start = i / total_lines
-            line_end = (i + 1) / total_lines
+        if alpha >= 1.0:
+            # Fully revealed: one group-wide traversal instead of
+            # per-line updates
+            self.group.set_opacity(1.0)
+            self._last_opacities[:] = 1.0
+            return
 
-            if alpha < line_start:
-                line.set_opacity(0)
-            elif alpha >= line_end:
-                line.set_opacity(1)
-            else:
-                # Fade in during this line's segment
-                line_alpha = (alpha - line_start) / (line_end - line_start)
-                line.set_opacity(line_alpha)
+        opacities = np.clip((alpha - self._line_starts) * total_lines, 0.0, 1.0)
+        changed = np.nonzero(opacities != self._last_opacities)[0]
+        for i in changed:
+            self.text_lines[i].set_opacity(float(opacities[i]))
+        self._last_opacities[changed] = opacities[changed]
 
 
 def create_bounce_animation(
@@ -0,0 +1,56 @@
+"""Vectorized axes coordinate conversion.
+
+``Axes.coords_to_point`` interpolates per call in Python, so converting
+N data points costs N interpreter round-trips. The mapping is a plain
+affine transform, fully described by the origin and two unit vectors;
+probing it once lets whole batches convert through a single NumPy
+expression.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from manim import Axes
+
+Affine = tuple[np.ndarray, np.ndarray, np.ndarray]
+"""Probed (origin, x unit vector, y unit vector) coordinate mapping."""
+
+
+def c2p_affine(axes: Axes) -> Affine:
+    """Probe the axes' coordinate mapping into an affine triple.
+
+    Three ``c2p`` probes up front let every later conversion be a
+    constant-time NumPy expression instead of going back through
+    ``Axes.coords_to_point``.
+
+    Args:
+        axes: Axes defining the coordinate mapping
+
+    Returns:
+        Tuple of (origin, x unit vector, y unit vector)
+
+    """
+    origin = np.asarray(axes.c2p(0.0, 0.0), dtype=np.float64)
+    ux = np.asarray(axes.c2p(1.0, 0.0), dtype=np.float64) - origin
+    uy = np.asarray(axes.c2p(0.0, 1.0), dtype=np.float64) - origin
+    return origin, ux, uy
+
+
+def batch_c2p(affine: Affine, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """Convert data coordinates to scene points in one affine transform.
+
+    Args:
+        affine: Probed (origin, ux, uy) triple from ``c2p_affine``
+        xs: Data-space x coordinates
+        ys: Data-space y coordinates
+
+    Returns:
+        (N, 3) array of scene-space points
+
+    """
+    origin, ux, uy = affine
+    return origin + xs[:, None] * ux + ys[:, None] * uy
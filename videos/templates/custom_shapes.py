@@ -7,11 +7,13 @@ using Manim primitives per FR-012 requirement.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
+import numpy as np
 from manim import (
     UP,
     Circle,
     Line,
-    ManimColor,
     Polygon,
     Rectangle,
     Text,
@@ -19,6 +21,7 @@ from manim import (
 )
 
 from src.config import COLORS
+from videos.templates.mobject_cache import cached_color
 
 
 def create_warning_icon(
@@ -44,22 +47,22 @@ def create_warning_icon(
         [-size / 2, -triangle_height / 3, 0],
         [size / 2, -triangle_height / 3, 0],
         [0, 2 * triangle_height / 3, 0],
-        color=ManimColor(color),
+        color=cached_color(color),
         stroke_width=3 * size,
     )
-    triangle.set_fill(ManimColor(COLORS.BACKGROUND), opacity=0.8)
+    triangle.set_fill(cached_color(COLORS.BACKGROUND), opacity=0.8)
 
     # Create exclamation mark
     exclaim_line = Line(
         start=[0, triangle_height / 4, 0],
         end=[0, -triangle_height / 8, 0],
-        color=ManimColor(color),
+        color=cached_color(color),
         stroke_width=4 * size,
     )
 
     exclaim_dot = Circle(
         radius=0.05 * size,
-        color=ManimColor(color),
+        color=cached_color(color),
         fill_opacity=1.0,
     )
     exclaim_dot.move_to([0, -triangle_height / 4, 0])
@@ -95,7 +98,7 @@ def create_slider_component(
     track = Rectangle(
         height=height,
         width=width,
-        color=ManimColor(COLORS.GRID),
+        color=cached_color(COLORS.GRID),
         fill_opacity=0.3,
         stroke_width=2,
     )
@@ -105,31 +108,31 @@ def create_slider_component(
     segment_height = height / num_segments
     gradient_segments = VGroup()
 
-    for i in range(num_segments):
-        # Interpolate color from top to bottom
-        t = i / (num_segments - 1)
-        # Simple linear interpolation in hex
-        top_rgb = _hex_to_rgb(top_color)
-        bottom_rgb = _hex_to_rgb(bottom_color)
-        r = int(top_rgb[0] + (bottom_rgb[0] - top_rgb[0]) * t)
-        g = int(top_rgb[1] + (bottom_rgb[1] - top_rgb[1]) * t)
-        b = int(top_rgb[2] + (bottom_rgb[2] - top_rgb[2]) * t)
-        segment_color = f"#{r:02X}{g:02X}{b:02X}"
-
+    # Parse each endpoint color once and interpolate every segment in a
+    # single vectorized lerp instead of re-parsing the hex strings and
+    # lerping channel by channel per segment
+    top_rgb = np.asarray(_hex_to_rgb(top_color), dtype=np.float64)
+    bottom_rgb = np.asarray(_hex_to_rgb(bottom_color), dtype=np.float64)
+    ts = np.linspace(0.0, 1.0, num_segments)[:, None]
+    segment_rgbs = (top_rgb + (bottom_rgb - top_rgb) * ts).astype(np.uint8)
+    segment_ys = height / 2 - segment_height / 2 - np.arange(num_segments) * segment_height
+    segment_width = width * 0.8
+
+    for (r, g, b), y in zip(segment_rgbs, segment_ys, strict=True):
         segment = Rectangle(
             height=segment_height,
-            width=width * 0.8,
-            color=ManimColor(segment_color),
+            width=segment_width,
+            color=cached_color(f"#{int(r):02X}{int(g):02X}{int(b):02X}"),
             fill_opacity=0.8,
             stroke_width=0,
         )
-        segment.move_to([0, height / 2 - segment_height / 2 - i * segment_height, 0])
+        segment.move_to([0, float(y), 0])
         gradient_segments.add(segment)
 
     # Create handle
     handle = Circle(
         radius=width * 0.8,
-        color=ManimColor(COLORS.TEXT),
+        color=cached_color(COLORS.TEXT),
         fill_opacity=1.0,
         stroke_width=2,
     )
@@ -166,10 +169,10 @@ def create_slider_with_labels(
     slider = create_slider_component(height, width, top_color, bottom_color)
 
     # Create labels
-    top_text = Text(top_label, font_size=24, color=ManimColor(COLORS.TEXT))
+    top_text = Text(top_label, font_size=24, color=cached_color(COLORS.TEXT))
     top_text.next_to(slider, UP, buff=0.2)
 
-    bottom_text = Text(bottom_label, font_size=24, color=ManimColor(COLORS.TEXT))
+    bottom_text = Text(bottom_label, font_size=24, color=cached_color(COLORS.TEXT))
     bottom_text.next_to(slider, direction=-UP, buff=0.2)
 
     return VGroup(slider, top_text, bottom_text)
@@ -194,7 +197,7 @@ def create_network_node(
     # Create outer circle
     node = Circle(
         radius=radius,
-        color=ManimColor(color),
+        color=cached_color(color),
         fill_opacity=0.8,
         stroke_width=1,
     )
@@ -202,7 +205,7 @@ def create_network_node(
     # Add glow effect by creating a larger, faded circle behind
     glow = Circle(
         radius=radius * 1.5,
-        color=ManimColor(color),
+        color=cached_color(color),
         fill_opacity=0.2,
         stroke_width=0,
     )
@@ -211,7 +214,7 @@ def create_network_node(
 
     # Add symbol if provided
     if symbol:
-        text = Text(symbol, font_size=int(radius * 600), color=ManimColor(COLORS.TEXT))
+        text = Text(symbol, font_size=int(radius * 600), color=cached_color(COLORS.TEXT))
         text.move_to(node.get_center())
         result.add(text)
 
@@ -253,7 +256,7 @@ def create_data_point_dot(
     """
     return Circle(
         radius=radius,
-        color=ManimColor(color),
+        color=cached_color(color),
         fill_opacity=1.0,
         stroke_width=0,
     )
@@ -277,40 +280,45 @@ def create_grid_background(
         VGroup containing all grid lines
 
     """
-    grid = VGroup()
-
-    # Vertical lines
-    x = x_range[0]
-    while x <= x_range[1]:
-        line = Line(
-            start=[x, y_range[0], 0],
-            end=[x, y_range[1], 0],
-            color=ManimColor(COLORS.GRID),
+    # arange avoids the float-accumulation drift of repeated += and the
+    # endpoint epsilon keeps the upper bound inclusive like the old
+    # loops intended; the palette color is parsed once for all lines
+    grid_color = cached_color(COLORS.GRID)
+    xs = np.arange(x_range[0], x_range[1] + 1e-9, x_step)
+    ys = np.arange(y_range[0], y_range[1] + 1e-9, y_step)
+
+    v_lines = [
+        Line(
+            start=[float(x), y_range[0], 0],
+            end=[float(x), y_range[1], 0],
+            color=grid_color,
             stroke_width=0.5,
             stroke_opacity=0.3,
         )
-        grid.add(line)
-        x += x_step
-
-    # Horizontal lines
-    y = y_range[0]
-    while y <= y_range[1]:
-        line = Line(
-            start=[x_range[0], y, 0],
-            end=[x_range[1], y, 0],
-            color=ManimColor(COLORS.GRID),
+        for x in xs
+    ]
+    h_lines = [
+        Line(
+            start=[x_range[0], float(y), 0],
+            end=[x_range[1], float(y), 0],
+            color=grid_color,
             stroke_width=0.5,
             stroke_opacity=0.3,
         )
-        grid.add(line)
-        y += y_step
+        for y in ys
+    ]
 
-    return grid
+    return VGroup(*v_lines, *h_lines)
 
 
+@lru_cache(maxsize=None)
 def _hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
     """Convert hex color to RGB tuple (internal helper).
 
+    Callers pass immutable palette constants from the config, so
+    repeated parses of the same string hit the cache instead of
+    redoing three base-16 conversions; no invalidation is needed.
+
     Args:
         hex_color: Color in format "#RRGGBB"
 
@@ -318,7 +326,7 @@ def _hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
         Tuple of (r, g, b) values in range 0-255
 
     """
-    hex_color = hex_color.lstrip("#")
+    hex_color = hex_color.lstrip("#").upper()
     return (
         int(hex_color[0:2], 16),
         int(hex_color[2:4], 16),
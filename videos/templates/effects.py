@@ -8,27 +8,59 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import numpy as np
 from manim import (
     DOWN,
     LEFT,
     RIGHT,
     UP,
     Animation,
+    Dot,
     FadeIn,
     FadeOut,
+    ImageMobject,
     Mobject,
     MovingCameraScene,
+    Rectangle,
     ScaleInPlace,
+    UpdateFromAlphaFunc,
     VGroup,
+    config,
     rate_functions,
 )
 
 from src.config import COLORS, TIMING
+from videos.templates.mobject_cache import cached_color
 
 if TYPE_CHECKING:
     from manim import Scene
 
 
+def _style_aberration_layer(
+    layer: Mobject,
+    color: str,
+    opacity: float,
+    shift_vector: np.ndarray,
+) -> None:
+    """Color, fade, and shift one RGB layer in a single family walk.
+
+    set_color, set_opacity, and shift each traverse the submobject
+    family on their own; fusing them applies all three mutations in one
+    pass, with the shift reduced to an in-place points addition.
+
+    Args:
+        layer: Copied mobject forming one RGB layer
+        color: Channel color for the layer
+        opacity: Opacity applied to the layer
+        shift_vector: Offset added to the layer's points
+
+    """
+    for member in layer.family_members_with_points():
+        member.set_color(color, family=False)
+        member.set_opacity(opacity, family=False)
+        member.points += shift_vector
+
+
 def apply_chromatic_aberration(
     mobject: Mobject,
     offset: float = 0.02,
@@ -46,16 +78,12 @@ def apply_chromatic_aberration(
         VGroup containing original and RGB-shifted copies
 
     """
-    # Create RGB-shifted copies
+    # Create RGB-shifted copies, each styled and offset in one pass
     red_copy = mobject.copy()
-    red_copy.set_color("#FF0000")
-    red_copy.set_opacity(0.3)
-    red_copy.shift(LEFT * offset + UP * offset * 0.5)
+    _style_aberration_layer(red_copy, "#FF0000", 0.3, LEFT * offset + UP * offset * 0.5)
 
     blue_copy = mobject.copy()
-    blue_copy.set_color("#0000FF")
-    blue_copy.set_opacity(0.3)
-    blue_copy.shift(RIGHT * offset + DOWN * offset * 0.5)
+    _style_aberration_layer(blue_copy, "#0000FF", 0.3, RIGHT * offset + DOWN * offset * 0.5)
 
     # Combine with original on top
     result = VGroup(red_copy, blue_copy, mobject)
@@ -85,18 +113,27 @@ def apply_glow_effect(
     """
     glow_layers = VGroup()
 
-    # Create multiple glow layers for smooth falloff
+    # Create multiple glow layers for smooth falloff. Scales and
+    # opacities are precomputed in one vector expression each; the
+    # first copy is recolored once and later layers clone it, so the
+    # loop body is a tight copy, incremental scale, and opacity assign
     num_layers = 3
-    for i in range(num_layers):
-        layer_scale = 1.0 + (glow_factor - 1.0) * (i + 1) / num_layers
-        layer_opacity = opacity * (num_layers - i) / num_layers
-
-        glow = mobject.copy()
-        glow.scale(layer_scale)
-        glow.set_opacity(layer_opacity)
-        if color:
-            glow.set_color(color)
-        glow_layers.add(glow)
+    layer_steps = np.arange(1, num_layers + 1)
+    scales = 1.0 + (glow_factor - 1.0) * layer_steps / num_layers
+    opacities = opacity * (num_layers + 1 - layer_steps) / num_layers
+
+    layer = mobject.copy()
+    if color:
+        layer.set_color(color)
+
+    previous_scale = 1.0
+    for layer_scale, layer_opacity in zip(scales.tolist(), opacities.tolist(), strict=True):
+        if len(glow_layers) > 0:
+            layer = layer.copy()
+        layer.scale(layer_scale / previous_scale)
+        layer.set_opacity(layer_opacity)
+        previous_scale = layer_scale
+        glow_layers.add(layer)
 
     # Add original on top
     glow_layers.add(mobject)
@@ -148,16 +185,15 @@ def create_fade_pulse(
         Animation object for the fade pulse
 
     """
-    # Store original opacity
-    original_opacity = mobject.get_fill_opacity()
+    # Bind the easing function and opacity delta once; the closure runs
+    # every frame, and manim's there_and_back is smooth-eased rather
+    # than triangular, so calling the bound function keeps the exact
+    # pulse shape while dropping the per-frame attribute lookups
+    there_and_back = rate_functions.there_and_back
+    opacity_delta = max_opacity - min_opacity
 
     def update_opacity(mob: Mobject, alpha: float) -> None:
-        # Use there_and_back for smooth pulse
-        t = rate_functions.there_and_back(alpha)
-        new_opacity = min_opacity + (max_opacity - min_opacity) * t
-        mob.set_opacity(new_opacity)
-
-    from manim import UpdateFromAlphaFunc
+        mob.set_opacity(min_opacity + opacity_delta * there_and_back(alpha))
 
     return UpdateFromAlphaFunc(mobject, update_opacity, run_time=duration)
 
@@ -219,53 +255,34 @@ def create_screen_edge_pulse(
         VGroup containing edge rectangles for animation
 
     """
-    from manim import ManimColor, Rectangle
-
-    edges = VGroup()
-
-    # Create thin rectangles along each edge
+    # Create thin rectangles along each edge; opposite edges are exact
+    # copies of one prototype, so only two constructors run
     edge_width = 0.1
+    edge_color = cached_color(color)
 
-    # Top edge
     top = Rectangle(
         width=16,
         height=edge_width,
-        color=ManimColor(color),
+        color=edge_color,
         fill_opacity=0.8,
     )
     top.move_to([0, 4 - edge_width / 2, 0])
-    edges.add(top)
 
-    # Bottom edge
-    bottom = Rectangle(
-        width=16,
-        height=edge_width,
-        color=ManimColor(color),
-        fill_opacity=0.8,
-    )
+    bottom = top.copy()
     bottom.move_to([0, -4 + edge_width / 2, 0])
-    edges.add(bottom)
 
-    # Left edge
     left = Rectangle(
         width=edge_width,
         height=8,
-        color=ManimColor(color),
+        color=edge_color,
         fill_opacity=0.8,
     )
     left.move_to([-7.5 + edge_width / 2, 0, 0])
-    edges.add(left)
 
-    # Right edge
-    right = Rectangle(
-        width=edge_width,
-        height=8,
-        color=ManimColor(color),
-        fill_opacity=0.8,
-    )
+    right = left.copy()
     right.move_to([7.5 - edge_width / 2, 0, 0])
-    edges.add(right)
 
+    edges = VGroup(top, bottom, left, right)
     edges.set_opacity(0)  # Start invisible
     return edges
 
@@ -312,25 +329,85 @@ def create_static_noise_overlay(
         VGroup containing noise dots
 
     """
-    import numpy as np
-    from manim import Dot, ManimColor
-
+    # Three vector draws replace 3 * density scalar rng calls; the loop
+    # that remains only constructs mobjects
     rng = np.random.default_rng(42)
-    noise = VGroup()
-
-    for _ in range(density):
-        x = rng.uniform(-width / 2, width / 2)
-        y = rng.uniform(-height / 2, height / 2)
-        brightness = rng.uniform(0.3, 1.0)
-
-        dot = Dot(
-            point=[x, y, 0],
-            radius=0.02,
-            color=ManimColor(COLORS.TEXT),
-            fill_opacity=brightness,
-        )
-        noise.add(dot)
+    xs = rng.uniform(-width / 2, width / 2, density)
+    ys = rng.uniform(-height / 2, height / 2, density)
+    brightnesses = rng.uniform(0.3, 1.0, density)
+    dot_color = cached_color(COLORS.TEXT)
+
+    return VGroup(
+        *[
+            Dot(
+                point=[x, y, 0],
+                radius=0.02,
+                color=dot_color,
+                fill_opacity=brightness,
+            )
+            for x, y, brightness in zip(xs, ys, brightnesses, strict=True)
+        ],
+    )
 
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    njit = None
+    prange = range
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def _fill_noise(out: np.ndarray, seed: int) -> None:
+        """Fill the noise texture from an integer hash (compiled by numba).
+
+        Each pixel hashes (row, column, seed) independently, so the outer
+        loop parallelizes across cores and the inner loop compiles down
+        to branch-free SIMD-friendly stores - no RNG state to serialize.
+        """
+        for y in prange(out.shape[0]):
+            for x in range(out.shape[1]):
+                h = y * 73856093 ^ x * 19349663 ^ seed * 83492791
+                h ^= h >> 13
+                h *= 1274126177
+                h ^= h >> 16
+                out[y, x] = h & 0xFF
+else:
+    _fill_noise = None
+
+
+def create_static_noise_image(
+    size: tuple[int, int] = (1920, 1080),
+    seed: int = 0,
+) -> ImageMobject:
+    """Create static noise as a single pre-rendered texture.
+
+    The dot-based overlay puts hundreds of tiny mobjects in the scene
+    graph, and every one is redrawn each frame for as long as the noise
+    is on screen. Baking the noise into one grayscale image keeps the
+    per-frame cost at a single blit regardless of density.
+
+    Args:
+        size: Texture size as (width, height) in pixels
+        seed: Seed for the noise pattern
+
+    Returns:
+        ImageMobject stretched to cover the full frame
+
+    """
+    width, height = size
+    if _fill_noise is not None:
+        # Hash-based fill compiled by numba, parallel across rows
+        pixels = np.empty((height, width), dtype=np.uint8)
+        _fill_noise(pixels, seed)
+    else:
+        rng = np.random.default_rng(seed)
+        pixels = rng.integers(0, 256, size=(height, width), dtype=np.uint8)
+
+    noise = ImageMobject(pixels)
+    noise.stretch_to_fit_width(config.frame_width)
+    noise.stretch_to_fit_height(config.frame_height)
     return noise
 
 
@@ -0,0 +1,202 @@
+"""Content-keyed geometry cache for expensively constructed mobjects.
+
+Static mobjects (equation plates, axes, titles) are rebuilt identically
+on every iterative ``-ql`` render cycle, each paying the full LaTeX or
+Cairo path-computation cost. This module memoizes a mobject's computed
+family geometry on disk - the points and stroke/fill style of every
+member that carries points - keyed by a hash of the constructor
+arguments: a cache hit rebuilds the group with one ``np.load`` and a
+style pass, skipping the expensive construction entirely.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from manim import Axes, ImageMobject, ManimColor, MathTex, Mobject, VMobject
+
+CACHE_DIR: Final[Path] = Path.home() / ".cache" / "judge_curve" / "mobjects"
+"""On-disk location for cached mobject point arrays."""
+
+
+@lru_cache(maxsize=512)
+def cached_color(hex_color: str) -> ManimColor:
+    """Return a memoized ManimColor for a hex string.
+
+    ManimColor construction parses and validates the hex string on
+    every call, and the factories in this package resolve the same few
+    palette constants over and over - up to once per noise dot. The
+    returned instances are treated as immutable, so sharing them is
+    safe and invalidation is never needed.
+
+    Args:
+        hex_color: Color in "#RRGGBB" format
+
+    Returns:
+        The parsed ManimColor, shared across calls
+
+    """
+    from manim import ManimColor
+
+    return ManimColor(hex_color)
+
+
+def _content_key(name: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+    """Hash a constructor call's arguments into a stable cache key.
+
+    Args:
+        name: Constructor name, namespacing the key
+        args: Positional constructor arguments
+        kwargs: Keyword constructor arguments
+
+    Returns:
+        Hex digest identifying this exact construction
+
+    """
+    payload = json.dumps(
+        [name, [repr(a) for a in args], {k: repr(v) for k, v in sorted(kwargs.items())}],
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def content_cached(
+    build: Callable[..., VMobject],
+) -> Callable[..., VMobject]:
+    """Wrap a VMobject factory with the on-disk geometry cache.
+
+    Composites like MathTex and Axes keep their geometry entirely in
+    submobjects, so the cache serializes the whole family: one points
+    array plus the stroke/fill style of every member that carries
+    points. On a hit those members are rebuilt into a flat VMobject
+    group that draws identically to the original; on a miss the freshly
+    built family is stored for the next run.
+
+    Args:
+        build: Factory producing a VMobject from its arguments
+
+    Returns:
+        Factory with identical signature backed by the geometry cache
+
+    """
+
+    def cached_build(*args: Any, **kwargs: Any) -> VMobject:
+        key = _content_key(build.__name__, args, kwargs)
+        points_path = CACHE_DIR / f"{key}.npz"
+        style_path = CACHE_DIR / f"{key}.json"
+
+        if points_path.exists() and style_path.exists():
+            from manim import VMobject
+
+            styles = json.loads(style_path.read_text())
+            rebuilt = VMobject()
+            with np.load(points_path) as archive:
+                for index, style in enumerate(styles):
+                    member = VMobject()
+                    member.set_points(archive[f"points_{index}"])
+                    member.set_fill(
+                        style["fill_color"],
+                        opacity=style["fill_opacity"],
+                    )
+                    member.set_stroke(
+                        style["stroke_color"],
+                        width=style["stroke_width"],
+                        opacity=style["stroke_opacity"],
+                    )
+                    rebuilt.add(member)
+            return rebuilt
+
+        mobject = build(*args, **kwargs)
+        members = mobject.family_members_with_points()
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        arrays = {
+            f"points_{index}": np.asarray(member.points)
+            for index, member in enumerate(members)
+        }
+        styles = [
+            {
+                "fill_color": member.get_fill_color().to_hex(),
+                "fill_opacity": float(member.get_fill_opacity()),
+                "stroke_color": member.get_stroke_color().to_hex(),
+                "stroke_opacity": float(member.get_stroke_opacity()),
+                "stroke_width": float(member.get_stroke_width()),
+            }
+            for member in members
+        ]
+        # Write the style manifest last so a partial cache entry from an
+        # interrupted run is never treated as a hit
+        np.savez(points_path, **arrays)
+        style_path.write_text(json.dumps(styles))
+        return mobject
+
+    cached_build.__name__ = build.__name__
+    cached_build.__doc__ = build.__doc__
+    return cached_build
+
+
+def freeze(mobject: Mobject) -> ImageMobject:
+    """Rasterize a fully laid-out mobject into a full-frame snapshot.
+
+    Under the cairo renderer every frame re-tessellates and re-fills all
+    vector paths, including mobjects that sit still between their appear
+    and fade animations. Capturing them once through an offscreen camera
+    turns the hold phase into a single texture blit; the caller swaps
+    the snapshot in for the hold and may animate it out directly.
+
+    Args:
+        mobject: Mobject to rasterize, already in its final position
+
+    Returns:
+        Full-frame ImageMobject that overlays the original exactly
+
+    """
+    from manim import Camera, ImageMobject, config
+
+    camera = Camera(background_opacity=0.0)
+    camera.capture_mobjects([mobject])
+    snapshot = ImageMobject(np.asarray(camera.pixel_array))
+    snapshot.stretch_to_fit_width(config.frame_width)
+    snapshot.stretch_to_fit_height(config.frame_height)
+    snapshot.move_to([0.0, 0.0, 0.0])
+    return snapshot
+
+
+@content_cached
+def cached_mathtex(tex: str, **kwargs: Any) -> MathTex:
+    """Build (or load from cache) a MathTex for a static string.
+
+    Args:
+        tex: LaTeX source string
+        **kwargs: Forwarded to MathTex
+
+    Returns:
+        MathTex on a cache miss; a VMobject group drawing the same glyphs on a hit
+
+    """
+    from manim import MathTex
+
+    return MathTex(tex, **kwargs)
+
+
+@content_cached
+def cached_axes(**kwargs: Any) -> Axes:
+    """Build (or load from cache) an Axes with the given configuration.
+
+    Args:
+        **kwargs: Forwarded to Axes
+
+    Returns:
+        Axes on a cache miss; a VMobject group drawing the same axes on a hit
+
+    """
+    from manim import Axes
+
+    return Axes(**kwargs)